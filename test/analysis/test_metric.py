@@ -3,7 +3,11 @@ import pandas as pd
 import pytest
 
 from tricys.analysis.metric import (
+    _centered_rolling_mean,
+    _parse_param_str,
+    _pivot_metric_rows,
     calculate_doubling_time,
+    calculate_single_job_metrics,
     calculate_startup_inventory,
     extract_metrics,
     get_final_value,
@@ -34,6 +38,13 @@ def test_calculate_startup_inventory(sample_series_data):
     assert calculate_startup_inventory(series) == 18
 
 
+@pytest.mark.build_test
+def test_calculate_startup_inventory_skips_nan():
+    series = pd.Series([5, 4, np.nan, 1, 2, 3])
+    assert calculate_startup_inventory(series) == 4.0
+    assert np.isnan(calculate_startup_inventory(pd.Series([np.nan, np.nan])))
+
+
 @pytest.mark.build_test
 def test_time_of_turning_point(sample_series_data):
     series, time_series = sample_series_data
@@ -50,6 +61,15 @@ def test_time_of_turning_point_monotonic_decrease():
     assert np.isnan(time_of_turning_point(series, time_series))
 
 
+@pytest.mark.build_test
+def test_time_of_turning_point_dip_in_tail():
+    """A narrow dip in the tail is the raw minimum but not the smoothed one."""
+    data = np.abs(np.arange(2000) - 1000) / 10 + 10
+    data[1900] = 5
+    time = np.arange(2000)
+    assert time_of_turning_point(pd.Series(data), pd.Series(time)) == 1900
+
+
 @pytest.mark.build_test
 def test_calculate_doubling_time(sample_series_data):
     series, time_series = sample_series_data
@@ -58,6 +78,16 @@ def test_calculate_doubling_time(sample_series_data):
     assert calculate_doubling_time(series, time_series) == 90
 
 
+@pytest.mark.build_test
+def test_calculate_doubling_time_non_monotonic_tail():
+    time_series = pd.Series(np.arange(6) * 10)
+    # The first crossing (250) precedes a dip, so the tail is not sorted.
+    series = pd.Series([100, 80, 250, 90, 100, 300])
+    assert calculate_doubling_time(series, time_series) == 20
+    series = pd.Series([100, 80, 90, 150, np.nan, 220])
+    assert calculate_doubling_time(series, time_series) == 50
+
+
 @pytest.mark.build_test
 def test_calculate_doubling_time_never_doubles(sample_series_data):
     series, time_series = sample_series_data
@@ -120,6 +150,42 @@ def test_extract_metrics():
     assert row2["Final_Value"].iloc[0] == 120.0
 
 
+@pytest.mark.build_test
+def test_extract_metrics_skips_nan_samples():
+    """Tests that missing samples do not become the minimum of a run."""
+    results_df = pd.DataFrame(
+        {
+            "time": [0, 10, 20, 30, 40],
+            "sds.I[1]&blanket.TBR=1.05": [100, np.nan, 85, 95, 110],
+            "sds.I[1]&blanket.TBR=1.10": [110, 100, 95, np.nan, 120],
+        }
+    )
+    metrics_definition = {
+        "Startup_Inventory": {
+            "source_column": "sds.I[1]",
+            "method": "calculate_startup_inventory",
+        },
+        "Self_Sufficiency_Time": {
+            "source_column": "sds.I[1]",
+            "method": "time_of_turning_point",
+        },
+    }
+    analysis_case = {"dependent_variables": list(metrics_definition)}
+
+    summary_df = extract_metrics(results_df, metrics_definition, analysis_case)
+
+    assert summary_df["Startup_Inventory"].tolist() == [15.0, 15.0]
+    assert summary_df["Self_Sufficiency_Time"].tolist() == [20.0, 20.0]
+
+
+@pytest.mark.build_test
+def test_metric_primitives_all_nan():
+    series = pd.Series([np.nan] * 5)
+    time_series = pd.Series(np.arange(5))
+    assert np.isnan(time_of_turning_point(series, time_series))
+    assert np.isnan(calculate_doubling_time(series, time_series))
+
+
 @pytest.mark.build_test
 def test_extract_metrics_bisection_search_skip():
     """Tests that metrics with 'bisection_search' method are correctly skipped."""
@@ -136,3 +202,185 @@ def test_extract_metrics_bisection_search_skip():
     assert "Required_TBR" not in summary_df.columns
     assert "Startup_Inventory" in summary_df.columns
     assert len(summary_df) == 1
+
+
+@pytest.mark.build_test
+@pytest.mark.parametrize("window", [1, 2, 3, 4, 7])
+def test_centered_rolling_mean_matches_pandas(window):
+    values = np.random.default_rng(0).normal(size=50)
+    expected = (
+        pd.Series(values).rolling(window=window, center=True, min_periods=1).mean()
+    )
+    np.testing.assert_allclose(
+        _centered_rolling_mean(values, window), expected.to_numpy()
+    )
+
+
+@pytest.mark.build_test
+@pytest.mark.parametrize("window", [1, 3, 4])
+def test_centered_rolling_mean_skips_nan(window):
+    values = np.random.default_rng(0).normal(size=50)
+    values[[0, 10, 11, 12, 13, 14, 49]] = np.nan
+    expected = (
+        pd.Series(values).rolling(window=window, center=True, min_periods=1).mean()
+    )
+    np.testing.assert_allclose(
+        _centered_rolling_mean(values, window), expected.to_numpy()
+    )
+
+
+@pytest.mark.build_test
+def test_extract_metrics_source_names_sharing_prefix():
+    """Tests that a source name which prefixes another one does not steal its columns."""
+    results_df = pd.DataFrame(
+        {
+            "time": [0, 10, 20],
+            "sds.I&param=1": [100, 90, 95],
+            "sds.I_total&param=1": [200, 150, 180],
+        }
+    )
+    metrics_definition = {
+        "Startup_Inventory": {
+            "source_column": "sds.I",
+            "method": "calculate_startup_inventory",
+        },
+        "Total_Startup_Inventory": {
+            "source_column": "sds.I_total",
+            "method": "calculate_startup_inventory",
+        },
+    }
+    analysis_case = {
+        "dependent_variables": ["Startup_Inventory", "Total_Startup_Inventory"]
+    }
+    summary_df = extract_metrics(results_df, metrics_definition, analysis_case)
+    assert summary_df["Startup_Inventory"].iloc[0] == 10.0
+    assert summary_df["Total_Startup_Inventory"].iloc[0] == 50.0
+
+
+@pytest.mark.build_test
+def test_pivot_metric_rows_matches_pivot_table():
+    summary_df = pd.DataFrame(
+        {
+            "blanket.TBR": [1.1, 1.1, 1.05, 1.05, 1.2, 1.2],
+            "metric_name": ["B", "A", "B", "A", "B", "A"],
+            "metric_value": [1.0, 2.0, 3.0, np.nan, np.nan, np.nan],
+        }
+    )
+    expected = summary_df.pivot_table(
+        index=["blanket.TBR"], columns="metric_name", values="metric_value"
+    ).reset_index()
+    pd.testing.assert_frame_equal(
+        _pivot_metric_rows(summary_df, ["blanket.TBR"]), expected
+    )
+
+
+@pytest.mark.build_test
+def test_metric_primitives_accept_ndarray(sample_series_data):
+    series, time_series = sample_series_data
+    values, times = series.to_numpy(), time_series.to_numpy()
+    assert get_final_value(values) == 210
+    assert calculate_startup_inventory(values) == 18
+    assert time_of_turning_point(values, times) == 30
+    assert calculate_doubling_time(values, times) == 90
+
+
+@pytest.mark.build_test
+@pytest.mark.parametrize(
+    "param_str, expected",
+    [
+        ("a=1&b=x", {"a": 1.0, "b": "x"}),
+        ("a=1e-3&b=-.5", {"a": 0.001, "b": -0.5}),
+        ("a=1.2.3", {"a": "1.2.3"}),
+        ("a=b=c", None),
+        ("a=1&&b=2", None),
+        ("a", None),
+        ("", None),
+    ],
+)
+def test_parse_param_str(param_str, expected):
+    assert _parse_param_str(param_str) == expected
+
+
+@pytest.mark.build_test
+def test_extract_metrics_threaded_matches_sequential():
+    """Tests that splitting a wide sweep across threads does not change results."""
+    rng = np.random.default_rng(0)
+    time = np.arange(50, dtype=float)
+    columns = {"time": time}
+    for i in range(600):
+        columns[f"sds.I[1]&p={i}"] = 100 + (time - 20) ** 2 + rng.normal(size=50)
+    results_df = pd.DataFrame(columns)
+    metrics_definition = {
+        "Startup_Inventory": {
+            "source_column": "sds.I[1]",
+            "method": "calculate_startup_inventory",
+        },
+        "Doubling_Time": {
+            "source_column": "sds.I[1]",
+            "method": "calculate_doubling_time",
+        },
+    }
+    analysis_case = {"dependent_variables": ["Startup_Inventory", "Doubling_Time"]}
+
+    sequential = extract_metrics(
+        results_df, metrics_definition, analysis_case, max_workers=1
+    )
+    threaded = extract_metrics(
+        results_df, metrics_definition, analysis_case, max_workers=4
+    )
+    assert len(sequential) == 600
+    pd.testing.assert_frame_equal(sequential, threaded)
+
+
+@pytest.mark.build_test
+def test_calculate_single_job_metrics(sample_series_data):
+    series, time_series = sample_series_data
+    job_df = pd.DataFrame({"time": time_series, "sds.I[1]": series})
+    metrics_definition = {
+        "Startup_Inventory": {
+            "source_column": "sds.I[1]",
+            "method": "calculate_startup_inventory",
+        },
+        "Self_Sufficiency_Time": {
+            "source_column": "sds.I[1]",
+            "method": "time_of_turning_point",
+        },
+        "Doubling_Time": {
+            "source_column": "sds.I[1]",
+            "method": "calculate_doubling_time",
+        },
+        "Net_Balance": {
+            "source_column": "sds.I[1]",
+            "method": "net_tritium_balance",
+        },
+        "Missing_Source": {"source_column": "other", "method": "final_value"},
+        "Required_TBR": {"method": "bisection_search"},
+    }
+    assert calculate_single_job_metrics(job_df, metrics_definition) == {
+        "Startup_Inventory": 18.0,
+        "Self_Sufficiency_Time": 30.0,
+        "Doubling_Time": 90.0,
+        "Net_Balance": 110.0,
+    }
+    assert calculate_single_job_metrics(job_df.iloc[:0], metrics_definition) == {}
+
+
+@pytest.mark.build_test
+def test_calculate_single_job_metrics_skips_bad_column(sample_series_data):
+    series, time_series = sample_series_data
+    job_df = pd.DataFrame(
+        {"time": time_series, "sds.I[1]": series, "label": ["run"] * len(series)}
+    )
+    metrics_definition = {
+        "Startup_Inventory": {
+            "source_column": "sds.I[1]",
+            "method": "calculate_startup_inventory",
+        },
+        "Label_Minimum": {
+            "source_column": "label",
+            "method": "calculate_startup_inventory",
+        },
+    }
+    assert calculate_single_job_metrics(job_df, metrics_definition) == {
+        "Startup_Inventory": 18.0
+    }
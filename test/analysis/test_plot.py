@@ -6,6 +6,13 @@ import pandas as pd
 import pytest
 
 from tricys.analysis.plot import (
+    _find_unit_config,
+    _format_label,
+    _format_number_for_display,
+    _format_numbers_for_display,
+    _parse_column_params,
+    _plot_language,
+    _UnitResolver,
     generate_analysis_plots,
     load_glossary,
     plot_sweep_time_series,
@@ -72,6 +79,18 @@ def test_set_plot_language():
     )
 
 
+def test_plot_language_context_restores_settings():
+    """Test that _plot_language scopes the language and rcParams to the block."""
+    import matplotlib.pyplot as plt
+
+    set_plot_language("en")
+    with _plot_language("cn"):
+        assert "SimHei" in plt.rcParams["font.sans-serif"]
+        assert plt.rcParams["axes.unicode_minus"] is False
+    assert plt.rcParams["font.sans-serif"] == plt.rcParamsDefault["font.sans-serif"]
+    assert _format_label("a_b", ({"a_b": "AB"}, {"a_b": "甲乙"})) == "AB"
+
+
 def test_load_glossary():
     """Test the load_glossary function."""
     glossary_path = Path(TEST_DIR) / "glossary.csv"
@@ -90,6 +109,70 @@ def test_load_glossary():
     assert not chinese_map
 
 
+def test_format_label():
+    """Test glossary lookup and fallback formatting in _format_label."""
+    glossary_maps = ({"plasma.fb": "Plasma FB"}, {"plasma.fb": "等离子体FB"})
+
+    set_plot_language("cn")
+    try:
+        assert _format_label("plasma.fb", glossary_maps) == "等离子体FB"
+    finally:
+        set_plot_language("en")
+    assert _format_label("plasma.fb", glossary_maps) == "Plasma FB"
+    assert _format_label("sds.I_total", glossary_maps) == "sds I total"
+    assert _format_label("fb=0.5") == "fb=0.5"
+    assert _format_label(1.5) == 1.5
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (0, "0"),
+        (0.0123, "1.23e-02"),
+        (1, "1.000"),
+        (9.999999999999998, "10.000"),
+        (10, "10.00"),
+        (99.99999999999999, "100.00"),
+        (100, "100.0"),
+        (-250.25, "-250.2"),
+        (float("nan"), "nan"),
+        (float("inf"), "inf"),
+    ],
+)
+def test_format_number_for_display(value, expected):
+    """Test decade-based number formatting, including near-boundary values."""
+    assert _format_number_for_display(value) == expected
+
+
+def test_format_numbers_for_display_matches_scalar():
+    """Test that the vectorized formatter agrees with the scalar one."""
+    values = [0, 0.0123, 1, 9.999999999999998, 10, 99.99999999999999, 100, -250.25]
+    values += [float("nan"), float("inf"), float("-inf")]
+
+    formatted = _format_numbers_for_display(values)
+
+    assert list(formatted) == [_format_number_for_display(v) for v in values]
+
+
+def test_unit_resolver_matching_order():
+    """Test exact, last-component and longest-substring unit matching."""
+    unit_map = {
+        "power": {"unit": "MW"},
+        "sds.I": {"unit": "kg"},
+        "I": {"unit": "g"},
+        "Startup_Inventory": {"unit": "kg"},
+    }
+    resolver = _UnitResolver(unit_map)
+
+    assert resolver.resolve("Startup_Inventory") is unit_map["Startup_Inventory"]
+    assert resolver.resolve("pulse.power") is unit_map["power"]
+    assert resolver.resolve("sds.I[1]") is unit_map["sds.I"]
+    assert resolver.resolve("unknown") is None
+    assert "pulse.power" in resolver.cache
+    assert _find_unit_config("sds.I[1]", unit_map) is unit_map["sds.I"]
+    assert _find_unit_config("sds.I[1]", None) is None
+
+
 def test_generate_analysis_plots():
     """Test the generate_analysis_plots function."""
     summary_df = pd.DataFrame(
@@ -145,3 +228,119 @@ def test_plot_sweep_time_series():
     assert len(plot_paths) > 0
     for path in plot_paths:
         assert os.path.exists(path)
+
+
+def test_plot_sweep_time_series_single_language():
+    """Test that only the requested language is saved."""
+    sweep_df = pd.DataFrame(
+        {"time": range(10), "sds.I[1]&plasma.fb=0.08": range(10, 20)}
+    )
+    csv_path = Path(TEST_DIR) / "sweep_results.csv"
+    sweep_df.to_csv(csv_path, index=False)
+
+    plot_paths = plot_sweep_time_series(
+        csv_path=str(csv_path),
+        save_dir=TEST_DIR,
+        y_var_name="sds.I[1]",
+        independent_var_name="plasma.fb",
+        languages=("cn",),
+    )
+
+    assert len(plot_paths) == 1
+    assert plot_paths[0].endswith("_zh.svg")
+    assert os.path.exists(plot_paths[0])
+
+
+def test_parse_column_params():
+    """Test parsing the parameters encoded in sweep column names."""
+    assert _parse_column_params("sds.I[1]&plasma.fb=0.08&i_iss.T=18") == {
+        "plasma.fb": "0.08",
+        "i_iss.T": "18",
+    }
+    assert _parse_column_params("sds.I[1]") == {}
+    assert _parse_column_params("sds.I[1]&flag&plasma.fb=0.1") == {"plasma.fb": "0.1"}
+
+
+def test_plot_sweep_time_series_default_params():
+    """Test that default_params keeps only the matching curves."""
+    sweep_df = pd.DataFrame(
+        {
+            "time": range(10),
+            "sds.I[1]&plasma.fb=0.08&i_iss.T=18": range(10, 20),
+            "sds.I[1]&plasma.fb=0.09&i_iss.T=20": range(20, 30),
+            "sds.I[1]": range(30, 40),
+        }
+    )
+    csv_path = Path(TEST_DIR) / "sweep_results.csv"
+    sweep_df.to_csv(csv_path, index=False)
+
+    plot_paths = plot_sweep_time_series(
+        csv_path=str(csv_path),
+        save_dir=TEST_DIR,
+        y_var_name="sds.I[1]",
+        independent_var_name="plasma.fb",
+        default_params={"i_iss.T": 18},
+    )
+    assert len(plot_paths) == 2
+
+    no_match = plot_sweep_time_series(
+        csv_path=str(csv_path),
+        save_dir=TEST_DIR,
+        y_var_name="sds.I[1]",
+        independent_var_name="plasma.fb",
+        default_params={"i_iss.T": 19},
+    )
+    assert no_match == []
+
+
+def test_generate_analysis_plots_multi_required_with_units():
+    """Test the multi-column Required_*** figure with unit conversion."""
+    summary_df = pd.DataFrame(
+        {
+            "plasma.fb": [0.08, 0.09, 0.10, 0.08, 0.09, 0.10],
+            "i_iss.T": [18.0, 18.0, 18.0, 20.0, 20.0, 20.0],
+            "Required_Startup_Inventory(Doubling_Time=5)": [1e3, 2e3, 3e3] * 2,
+            "Required_Startup_Inventory(Doubling_Time=10)": [4e3, 5e3, 6e3] * 2,
+        }
+    )
+    analysis_case = {
+        "name": "Test Case",
+        "independent_variable": "plasma.fb",
+        "dependent_variables": ["Required_Startup_Inventory"],
+        "default_simulation_values": {"i_iss.T": 19.0},
+    }
+    unit_map = {"Startup_Inventory": {"unit": "kg", "conversion_factor": 1000}}
+
+    plot_paths = generate_analysis_plots(
+        summary_df, analysis_case, TEST_DIR, unit_map=unit_map
+    )
+
+    assert len(plot_paths) == 2
+    for path in plot_paths:
+        assert os.path.exists(path)
+    # The caller's frame must not be converted in place.
+    assert summary_df["Required_Startup_Inventory(Doubling_Time=5)"].iloc[0] == 1e3
+
+
+def test_generate_analysis_plots_multi_required_non_numeric():
+    """Test that object-typed Required_*** columns do not abort plotting."""
+    summary_df = pd.DataFrame(
+        {
+            "plasma.fb": [0.08, 0.09, 0.10],
+            "Required_TBR(Doubling_Time=5)": [1.05, "n/a", 1.07],
+            "Required_TBR(Doubling_Time=10)": ["1.02", "1.03", None],
+            "Startup_Inventory": [20, 18, 16],
+        }
+    )
+    analysis_case = {
+        "name": "Test Case",
+        "independent_variable": "plasma.fb",
+        "dependent_variables": ["Required_TBR", "Startup_Inventory"],
+    }
+
+    plot_paths = generate_analysis_plots(summary_df, analysis_case, TEST_DIR)
+
+    assert any("Required_TBR" in os.path.basename(path) for path in plot_paths)
+    assert any("Startup_Inventory" in os.path.basename(path) for path in plot_paths)
+    for path in plot_paths:
+        assert os.path.exists(path)
@@ -1,12 +1,22 @@
+import io
 import json
 import os
 import shutil
 from pathlib import Path
+from types import SimpleNamespace
 
 import pandas as pd
 import pytest
 
+from tricys.analysis import report
 from tricys.analysis.report import (
+    _build_svg_plot_map,
+    _classify_plots,
+    _configure_llm_rate_limiter,
+    _create_chat_completion,
+    _dataframe_to_markdown,
+    _estimate_tokens,
+    _llm_rate_limiter,
     consolidate_reports,
     generate_analysis_cases_summary,
     generate_prompt_templates,
@@ -56,6 +66,131 @@ def create_dummy_results(
     sweep_df.to_csv(results_dir / "sweep_results.csv", index=False)
 
 
+def test_classify_plots_prefers_chinese_svgs():
+    """Tests that plot scanning buckets files and prefers the _zh SVG variant."""
+    results_dir = Path(TEST_DIR) / "results"
+    os.makedirs(results_dir)
+    for name in ["a.svg", "a_zh.svg", "b.svg", "c.png", "summary.csv"]:
+        (results_dir / name).touch()
+
+    svg_plots, png_plots = _classify_plots(str(results_dir))
+
+    assert sorted(svg_plots) == ["a.svg", "a_zh.svg", "b.svg"]
+    assert png_plots == ["c.png"]
+    assert _build_svg_plot_map(svg_plots) == {"a.svg": "a_zh.svg", "b.svg": "b.svg"}
+
+
+def test_dataframe_to_markdown():
+    """Tests the pipe-table writer used for the report tables."""
+    df = pd.DataFrame(
+        {"name": ["a", "bb"], "value": [0.5, 12.25], "text": ["1.20", "x"]}
+    )
+
+    assert _dataframe_to_markdown(df) == (
+        "| name | value | text |\n"
+        "|:-----|------:|:-----|\n"
+        "| a    |   0.5 | 1.20 |\n"
+        "| bb   | 12.25 | x    |"
+    )
+
+
+def test_llm_rate_limits_from_env():
+    """Tests the token estimate and the configurable per-minute limits."""
+    assert _estimate_tokens("abcdefgh") == 2
+    assert _estimate_tokens("氚库存ab") == 3
+
+    _configure_llm_rate_limiter(
+        {"AI_REQUESTS_PER_MINUTE": "10", "AI_TOKENS_PER_MINUTE": "bad"}
+    )
+    try:
+        assert _llm_rate_limiter.request_capacity == 10
+        assert _llm_rate_limiter.token_capacity == 150_000
+    finally:
+        _configure_llm_rate_limiter({})
+    assert _llm_rate_limiter.request_capacity == 60
+
+
+class _FakeCompletions:
+    """Streams canned (text, finish_reason) responses and records max_tokens."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.max_tokens = []
+
+    def create(self, **kwargs):
+        self.max_tokens.append(kwargs["max_tokens"])
+        text, finish_reason = self.responses.pop(0)
+        delta = SimpleNamespace(content=text)
+        return [
+            SimpleNamespace(
+                choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)]
+            )
+        ]
+
+
+def test_create_chat_completion_retries_and_caches_complete_responses():
+    """Tests that cut-off responses are retried with the full budget and not cached."""
+    completions = _FakeCompletions(
+        [("cut", "length"), ("full", "stop"), ("cut", "length"), ("cut", "length")]
+    )
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    sink = io.StringIO()
+    text = _create_chat_completion(
+        client, "m", "prompt", max_tokens=100, sink=sink, cache_dir=TEST_DIR
+    )
+    assert text == sink.getvalue() == "full"
+    assert completions.max_tokens == [100, 4000]
+    # The complete response is served from the cache.
+    assert _create_chat_completion(client, "m", "prompt", cache_dir=TEST_DIR) == "full"
+    assert len(completions.max_tokens) == 2
+
+    # A response cut off at the full budget is returned but never cached.
+    for _ in range(2):
+        assert (
+            _create_chat_completion(client, "m", "other", cache_dir=TEST_DIR) == "cut"
+        )
+    assert completions.max_tokens == [100, 4000, 4000, 4000]
+
+
+def test_generate_prompt_templates_reuses_cached_llm_responses(monkeypatch):
+    """Tests that rebuilding an unchanged AI case sends no new LLM requests."""
+    completions = _FakeCompletions([("analysis", "stop"), ("academic", "stop")])
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    monkeypatch.setattr(report, "_get_openai_client", lambda api_key, base_url: client)
+
+    case_dir = Path(TEST_DIR) / "Case_A"
+    create_dummy_results(case_dir, "Case_A")
+    glossary_path = Path(TEST_DIR) / "sheets.csv"
+    glossary_path.write_text("term,translation\n", encoding="utf-8")
+    case_data = {
+        "name": "Case_A",
+        "independent_variable": "plasma.fb",
+        "independent_variable_sampling": [0.08, 0.09, 0.10],
+        "dependent_variables": ["Startup_Inventory", "Self_Sufficiency_Time"],
+        "ai": True,
+    }
+    case_configs = [{"index": 0, "workspace": str(case_dir), "case_data": case_data}]
+    original_config = {
+        "sensitivity_analysis": {"glossary_path": str(glossary_path)},
+        "llm_env": {"API_KEY": "key", "BASE_URL": "http://llm", "AI_MODEL": "m"},
+    }
+    results_dir = case_dir / "results"
+
+    generate_prompt_templates(case_configs, original_config)
+    assert len(completions.max_tokens) == 2
+    assert (results_dir / "academic_report_Case_A_m.md").exists()
+
+    # Force a rebuild; the reports get a new timestamp but the same content.
+    os.remove(results_dir / ".report_etag")
+    generate_prompt_templates(case_configs, original_config)
+
+    assert len(completions.max_tokens) == 2
+    assert (results_dir / "academic_report_Case_A_m.md").read_text(
+        encoding="utf-8"
+    ) == "academic"
+
+
 def test_generate_analysis_cases_summary():
     """Tests the generate_analysis_cases_summary function."""
     run_workspace = Path(TEST_DIR).resolve() / "20250101_120000"
@@ -245,3 +380,60 @@ def test_generate_prompt_templates_and_consolidate_reports():
 
     assert not report2_path.exists()
     assert (case2_dir / "report" / "analysis_report_Case_B.md").exists()
+
+
+def test_generate_prompt_templates_skips_unchanged_case():
+    """Tests that an unchanged case is not rebuilt and a changed one is."""
+    case_dir = Path(TEST_DIR) / "Case_A"
+    create_dummy_results(case_dir, "Case_A")
+    case_data = {
+        "name": "Case_A",
+        "independent_variable": "plasma.fb",
+        "independent_variable_sampling": [0.08, 0.09, 0.10],
+        "dependent_variables": ["Startup_Inventory", "Self_Sufficiency_Time"],
+    }
+    case_configs = [{"index": 0, "workspace": str(case_dir), "case_data": case_data}]
+    original_config = {"sensitivity_analysis": {}}
+    results_dir = case_dir / "results"
+    report_path = results_dir / "analysis_report_Case_A.md"
+
+    generate_prompt_templates(case_configs, original_config)
+    assert (results_dir / ".report_etag").exists()
+
+    report_path.write_text("unchanged", encoding="utf-8")
+    generate_prompt_templates(case_configs, original_config)
+    assert report_path.read_text(encoding="utf-8") == "unchanged"
+
+    summary_csv = results_dir / "sensitivity_analysis_summary.csv"
+    mtime = os.path.getmtime(summary_csv) + 10
+    os.utime(summary_csv, (mtime, mtime))
+    generate_prompt_templates(case_configs, original_config)
+    assert report_path.read_text(encoding="utf-8") != "unchanged"
+
+
+def test_generate_prompt_templates_drops_stale_ai_reports(monkeypatch):
+    """Tests that a changed AI case whose reports fail keeps no etag or old report."""
+    monkeypatch.delenv("API_KEY", raising=False)
+    monkeypatch.delenv("BASE_URL", raising=False)
+    case_dir = Path(TEST_DIR) / "Case_A"
+    create_dummy_results(case_dir, "Case_A")
+    case_data = {
+        "name": "Case_A",
+        "independent_variable": "plasma.fb",
+        "independent_variable_sampling": [0.08, 0.09, 0.10],
+        "dependent_variables": ["Startup_Inventory", "Self_Sufficiency_Time"],
+        "ai": True,
+    }
+    case_configs = [{"index": 0, "workspace": str(case_dir), "case_data": case_data}]
+    original_config = {"sensitivity_analysis": {}, "llm_env": {"AI_MODEL": "m"}}
+    results_dir = case_dir / "results"
+    stale_report = results_dir / "academic_report_Case_A_m.md"
+    stale_report.write_text("stale", encoding="utf-8")
+    (results_dir / ".report_etag").write_text("old", encoding="utf-8")
+
+    # Without credentials no academic report can be written.
+    generate_prompt_templates(case_configs, original_config)
+
+    assert not stale_report.exists()
+    assert not (results_dir / ".report_etag").exists()
+    assert (results_dir / "analysis_report_Case_A.md").exists()
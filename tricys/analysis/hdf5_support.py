@@ -110,10 +110,11 @@ def build_dynamic_slices_from_hdf5(
             end_sample_columns[label] = series.iloc[end_indices].tolist()
 
             if variable_name == reference_variable:
-                current_min = float(series.min())
+                min_index = series.idxmin()
+                current_min = float(series[min_index])
                 if current_min < best_turning_value:
                     best_turning_value = current_min
-                    turning_index = int(series.idxmin())
+                    turning_index = int(min_index)
                     reference_label = label
 
     if turning_index is not None:
@@ -1,4 +1,8 @@
-from typing import Any, Dict, Optional
+import functools
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -6,14 +10,194 @@ import pandas as pd
 from tricys.analysis.hdf5_support import iter_hdf5_job_results
 from tricys.utils.hdf5_schema import load_jobs_df
 
+# Sweep result columns are named "variable&param1=value1&param2=value2".
+_SWEEP_COLUMN_RE = re.compile(r"^(?P<var>[^&]+)(?:&(?P<params>.*))?$")
+# Parameter values accepted by float(); checked up front instead of catching
+# ValueError for every non-numeric value.
+_FLOAT_RE = re.compile(
+    r"\s*[+-]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|inf(?:inity)?|nan)\s*",
+    re.IGNORECASE,
+)
+
+# Number of runs evaluated together by extract_metrics in one 2-D block.
+_METRIC_BLOCK_COLUMNS = 256
+
+
+def _centered_rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Computes a centered moving average with partial windows at the edges.
+
+    Equivalent to ``pd.Series(values).rolling(window, center=True,
+    min_periods=1).mean()`` but built from a single prefix sum, so the cost is
+    one pass over the data regardless of the window size. As in pandas, NaN
+    samples are left out of their windows.
+
+    Args:
+        values: 1-D array of samples, or a 2-D array smoothed column-wise.
+        window: The rolling window length.
+
+    Returns:
+        An array of the same shape holding the smoothed values.
+    """
+    n = len(values)
+    prefix = np.concatenate(
+        (np.zeros((1,) + values.shape[1:]), np.cumsum(values, axis=0))
+    )
+    positions = np.arange(n)
+    lo = np.maximum(positions - window // 2, 0)
+    hi = np.minimum(positions + (window - 1) // 2, n - 1)
+    counts = (hi - lo + 1).reshape((n,) + (1,) * (values.ndim - 1))
+    if not np.isnan(prefix[-1]).any():
+        return (prefix[hi + 1] - prefix[lo]) / counts
+
+    # A NaN total means some samples are missing: average only the valid ones
+    # and leave windows without any valid sample NaN.
+    valid = ~np.isnan(values)
+    zeros = np.zeros((1,) + values.shape[1:])
+    prefix = np.concatenate((zeros, np.cumsum(np.where(valid, values, 0.0), axis=0)))
+    valid_prefix = np.concatenate((zeros, np.cumsum(valid, axis=0)))
+    counts = valid_prefix[hi + 1] - valid_prefix[lo]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(counts > 0, (prefix[hi + 1] - prefix[lo]) / counts, np.nan)
+
+
+def _nan_argmin_cols(values: np.ndarray) -> np.ndarray:
+    """Finds the per-column argmin of a 2-D array, skipping NaN like idxmin().
+
+    Columns holding only NaN get position 0, whose value is NaN.
+    """
+    min_pos = values.argmin(axis=0)
+    # argmin stops at the first NaN of a column, so only columns whose minimum
+    # came out as NaN need the NaN-aware search.
+    has_nan = np.isnan(values[min_pos, np.arange(values.shape[1])])
+    if has_nan.any():
+        nan_cols = values[:, has_nan]
+        has_value = ~np.isnan(nan_cols).all(axis=0)
+        positions = np.zeros(nan_cols.shape[1], dtype=min_pos.dtype)
+        positions[has_value] = np.nanargmin(nan_cols[:, has_value], axis=0)
+        min_pos[has_nan] = positions
+    return min_pos
+
+
+# The kernels below evaluate one metric for every column of a 2-D
+# (time x run) array at once and return one value per column. min_pos is the
+# optional per-column argmin, shared between kernels that need it.
+
+
+def _final_value_cols(
+    values: np.ndarray,
+    times: Optional[np.ndarray] = None,
+    min_pos: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Column kernel for get_final_value."""
+    return values[-1]
+
+
+def _startup_inventory_cols(
+    values: np.ndarray,
+    times: Optional[np.ndarray] = None,
+    min_pos: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Column kernel for calculate_startup_inventory."""
+    if min_pos is None:
+        # Like Series.min(), skip NaN samples; all-NaN columns stay NaN.
+        minimum = np.full(values.shape[1], np.nan)
+        has_value = ~np.isnan(values).all(axis=0)
+        minimum[has_value] = np.nanmin(values[:, has_value], axis=0)
+        return values[0] - minimum
+    return values[0] - values[min_pos, np.arange(values.shape[1])]
+
+
+def _turning_point_time_cols(
+    values: np.ndarray, times: np.ndarray, min_pos: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Column kernel for time_of_turning_point."""
+    # Define a window size for the rolling average, e.g., 5% of the data length
+    # with a minimum size of 1. This helps in smoothing out local fluctuations.
+    window_size = max(1, int(len(values) * 0.001))
+    if min_pos is None:
+        min_pos = _nan_argmin_cols(values)
+
+    # Check if the minimum of the smoothed data is within the first or last 5%
+    # of the series. If so, the trend is considered monotonic. Otherwise, take
+    # the precise turning point from the original, noisy data.
+    five_percent_threshold = int(len(values) * 0.3)
+    tail_start = len(values) - five_percent_threshold
+
+    # With a window of one the moving average is the identity, so the raw
+    # minimum is also the smoothed one.
+    if window_size > 1:
+        smoothed = _centered_rolling_mean(values, window_size)
+        is_monotonic = _nan_argmin_cols(smoothed) >= tail_start
+    else:
+        is_monotonic = min_pos >= tail_start
+    # Only columns without any valid sample have a NaN at their minimum.
+    all_nan = np.isnan(values[min_pos, np.arange(values.shape[1])])
+    return np.where(is_monotonic | all_nan, np.nan, times[min_pos])
+
+
+def _doubling_time_cols(
+    values: np.ndarray, times: np.ndarray, min_pos: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Column kernel for calculate_doubling_time."""
+    doubled_inventory = 2 * values[0]
+
+    # Find the first index where the inventory is >= doubled_inventory
+    # We should only consider the part of the series after the turning point
+    if min_pos is None:
+        min_pos = _nan_argmin_cols(values)
+
+    doubling_times = np.full(values.shape[1], np.nan)
+    for col, start in enumerate(min_pos):
+        after_turning_point = values[start:, col]
+        threshold = doubled_inventory[col]
+
+        # After the turning point the inventory usually rises monotonically,
+        # so a binary search proposes the first crossing. The proposal is
+        # only trusted once nothing before it reaches the threshold (fmax
+        # skips NaN and does not allocate); otherwise search linearly.
+        first_hit = int(np.searchsorted(after_turning_point, threshold))
+        if first_hit and np.fmax.reduce(after_turning_point[:first_hit]) >= threshold:
+            first_hit = int(np.argmax(after_turning_point[:first_hit] >= threshold))
+        elif first_hit < len(after_turning_point) and not (
+            after_turning_point[first_hit] >= threshold
+        ):
+            # argmax returns the first True position; it is 0 both for a hit
+            # and for no hit at all, so confirm the hit.
+            reached = after_turning_point[first_hit:] >= threshold
+            offset = int(np.argmax(reached))
+            first_hit += offset if reached[offset] else len(reached)
+
+        # Columns that never double keep NaN.
+        if first_hit < len(after_turning_point):
+            doubling_times[col] = times[start + first_hit]
+    return doubling_times
+
+
+def _net_tritium_balance_cols(
+    values: np.ndarray,
+    times: Optional[np.ndarray] = None,
+    min_pos: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Column kernel for net_tritium_balance."""
+    if len(values) == 0:
+        return np.full(values.shape[1], np.nan)
+    all_nan = np.isnan(values).all(axis=0)
+    return np.where(all_nan, np.nan, values[-1] - values[0])
+
+
+def _as_column(series: Union[pd.Series, np.ndarray], dtype=None) -> np.ndarray:
+    """Views a Series or 1-D array as a single-column 2-D array."""
+    return np.asarray(series, dtype=dtype).reshape(-1, 1)
+
 
 def get_final_value(
-    series: pd.Series, time_series: Optional[pd.Series] = None
+    series: Union[pd.Series, np.ndarray],
+    time_series: Optional[Union[pd.Series, np.ndarray]] = None,
 ) -> float:
     """Gets the final value of a time series.
 
     Args:
-        series: The time series data.
+        series: The time series data, as a Series or 1-D array.
         time_series: The corresponding time data (unused).
 
     Returns:
@@ -23,11 +207,12 @@ def get_final_value(
         The time_series parameter is kept for interface consistency but is not used
         in the calculation. Only the series data is required.
     """
-    return series.iloc[-1]
+    return _final_value_cols(_as_column(series))[0]
 
 
 def calculate_startup_inventory(
-    series: pd.Series, time_series: Optional[pd.Series] = None
+    series: Union[pd.Series, np.ndarray],
+    time_series: Optional[Union[pd.Series, np.ndarray]] = None,
 ) -> float:
     """Calculates the startup inventory.
 
@@ -35,7 +220,7 @@ def calculate_startup_inventory(
     inventory and the minimum inventory (the turning point).
 
     Args:
-        series: The inventory time series data.
+        series: The inventory time series data, as a Series or 1-D array.
         time_series: The corresponding time data (unused).
 
     Returns:
@@ -46,12 +231,12 @@ def calculate_startup_inventory(
         used in the calculation. The startup inventory represents the amount of
         inventory consumed before reaching the minimum point.
     """
-    initial_inventory = series.iloc[0]
-    minimum_inventory = series.min()
-    return initial_inventory - minimum_inventory
+    return _startup_inventory_cols(_as_column(series))[0]
 
 
-def time_of_turning_point(series: pd.Series, time_series: pd.Series) -> float:
+def time_of_turning_point(
+    series: Union[pd.Series, np.ndarray], time_series: Union[pd.Series, np.ndarray]
+) -> float:
     """Finds the time of the turning point (minimum value) in a series.
 
     This function identifies the time corresponding to the minimum value in the
@@ -61,7 +246,7 @@ def time_of_turning_point(series: pd.Series, time_series: pd.Series) -> float:
     it returns the time of the absolute minimum from the original data.
 
     Args:
-        series: The time series data to analyze.
+        series: The time series data to analyze, as a Series or 1-D array.
         time_series: The corresponding time data.
 
     Returns:
@@ -71,40 +256,22 @@ def time_of_turning_point(series: pd.Series, time_series: pd.Series) -> float:
         ValueError: If time_series is None.
 
     Note:
-        Uses a rolling window (0.1% of data length) for smoothing to identify the
-        general trend. If the smoothed minimum is within the last 30% of the series,
-        the trend is considered monotonic and NaN is returned. Otherwise, returns
-        the time of the absolute minimum in the original data.
+        Uses a centered moving average (window of 0.1% of data length) for
+        smoothing to identify the general trend. If the smoothed minimum is
+        within the last 30% of the series, the trend is considered monotonic and
+        NaN is returned. Otherwise, returns the time of the absolute minimum in
+        the original data.
     """
     if time_series is None:
         raise ValueError("time_series must be provided for time_of_turning_point")
+    return _turning_point_time_cols(
+        _as_column(series, dtype=np.float64), np.asarray(time_series)
+    )[0]
 
-    # Define a window size for the rolling average, e.g., 5% of the data length
-    # with a minimum size of 1. This helps in smoothing out local fluctuations.
-    window_size = max(1, int(len(series) * 0.001))
-    smoothed_series = series.rolling(
-        window=window_size, center=True, min_periods=1
-    ).mean()
-
-    # Find the index label of the minimum value in the smoothed series.
-    smooth_min_index = smoothed_series.idxmin()
-    min_index = series.idxmin()
-
-    # Check if the minimum of the smoothed data is within the first or last 5%
-    # of the series. If so, the trend is considered monotonic.
-    smooth_min_pos = series.index.get_loc(smooth_min_index)
-    five_percent_threshold = int(len(series) * 0.3)
 
-    if smooth_min_pos >= len(series) - five_percent_threshold:
-        return np.nan
-    else:
-        # A clear turning point is identified in the overall trend.
-        # Now, find the precise turning point in the original, noisy data.
-        min_index = series.idxmin()
-        return time_series.loc[min_index]
-
-
-def calculate_doubling_time(series: pd.Series, time_series: pd.Series) -> float:
+def calculate_doubling_time(
+    series: Union[pd.Series, np.ndarray], time_series: Union[pd.Series, np.ndarray]
+) -> float:
     """Calculates the time it takes for the inventory to double its initial value.
 
     This function finds the first time point, after the inventory's minimum
@@ -112,7 +279,7 @@ def calculate_doubling_time(series: pd.Series, time_series: pd.Series) -> float:
     initial value.
 
     Args:
-        series: The inventory time series data.
+        series: The inventory time series data, as a Series or 1-D array.
         time_series: The corresponding time data.
 
     Returns:
@@ -128,48 +295,118 @@ def calculate_doubling_time(series: pd.Series, time_series: pd.Series) -> float:
     """
     if time_series is None:
         raise ValueError("time_series must be provided for calculate_doubling_time")
-    initial_inventory = series.iloc[0]
-    doubled_inventory = 2 * initial_inventory
-
-    # Find the first index where the inventory is >= doubled_inventory
-    # We should only consider the part of the series after the turning point
-    min_index = series.idxmin()
-    after_turning_point_series = series.loc[min_index:]
-
-    doubling_indices = after_turning_point_series[
-        after_turning_point_series >= doubled_inventory
-    ].index
-
-    if not doubling_indices.empty:
-        doubling_index = doubling_indices[0]
-        return time_series.loc[doubling_index]
-    else:
-        # If it never doubles, return NaN
-        return np.nan
+    return _doubling_time_cols(_as_column(series), np.asarray(time_series))[0]
 
 
 def net_tritium_balance(
-    series: pd.Series, time_series: Optional[pd.Series] = None
+    series: Union[pd.Series, np.ndarray],
+    time_series: Optional[Union[pd.Series, np.ndarray]] = None,
 ) -> float:
     """Calculates the net change in tritium inventory over the simulation period.
 
     Args:
-        series: The inventory time series data.
+        series: The inventory time series data, as a Series or 1-D array.
         time_series: The corresponding time data (unused).
 
     Returns:
         The difference between the final and initial inventory values,
         or NaN if the series is empty or contains only NaN values.
     """
-    if series.empty or series.isna().all():
-        return np.nan
-    return series.iloc[-1] - series.iloc[0]
+    return _net_tritium_balance_cols(_as_column(series, dtype=np.float64))[0]
+
+
+# Maps the "method" of a metric definition to the column kernel computing it.
+METHOD_DISPATCH = {
+    "final_value": _final_value_cols,
+    "calculate_startup_inventory": _startup_inventory_cols,
+    "time_of_turning_point": _turning_point_time_cols,
+    "calculate_doubling_time": _doubling_time_cols,
+    "net_tritium_balance": _net_tritium_balance_cols,
+}
+
+# Kernels that locate the series minimum; extract_metrics computes the argmin
+# once per column and shares it between them.
+_ARGMIN_KERNELS = {
+    _startup_inventory_cols,
+    _turning_point_time_cols,
+    _doubling_time_cols,
+}
+
+
+def _parse_param_str(param_str: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Parses a "param1=value1&param2=value2" suffix into a parameter dict.
+
+    Numeric values are converted to float; anything else is kept as a string.
+    Returns None if the suffix is missing or malformed.
+    """
+    if not param_str:
+        return None
+
+    params = {}
+    for item in param_str.split("&"):
+        key, sep, value = item.partition("=")
+        if not sep or "=" in value:
+            return None
+        params[key] = float(value) if _FLOAT_RE.fullmatch(value) else value
+    return params
+
+
+def _pivot_metric_rows(summary_df: pd.DataFrame, param_cols: list) -> pd.DataFrame:
+    """Reshapes long-format metric rows into one row per parameter combination.
+
+    Every (parameter combination, metric) pair occurs at most once, so the
+    values are scattered straight into a preallocated array instead of going
+    through the grouping and aggregation of ``pivot_table``. The output
+    matches ``pivot_table(...).reset_index()``: rows sorted by parameters,
+    metric columns sorted by name, and all-NaN rows and columns dropped.
+    """
+    summary_df = summary_df.dropna(subset=param_cols)
+
+    combo_positions = {}
+    row_positions = np.empty(len(summary_df), dtype=np.intp)
+    for i, combo in enumerate(
+        summary_df[param_cols].itertuples(index=False, name=None)
+    ):
+        row_positions[i] = combo_positions.setdefault(combo, len(combo_positions))
+
+    metric_name_col = summary_df["metric_name"]
+    if isinstance(metric_name_col.dtype, pd.CategoricalDtype):
+        metric_positions = metric_name_col.cat.codes.to_numpy()
+        metric_names = metric_name_col.cat.categories
+    else:
+        metric_positions, metric_names = pd.factorize(metric_name_col, sort=True)
+    metric_values = np.full((len(combo_positions), len(metric_names)), np.nan)
+    metric_values[row_positions, metric_positions] = summary_df[
+        "metric_value"
+    ].to_numpy(dtype=np.float64)
+
+    metrics_df = pd.DataFrame(metric_values, columns=pd.Index(metric_names))
+    metrics_df = metrics_df.dropna(axis=1, how="all")
+    has_value = metrics_df.notna().any(axis=1).to_numpy()
+
+    pivot_df = pd.concat(
+        [pd.DataFrame(list(combo_positions), columns=param_cols), metrics_df],
+        axis=1,
+    )[has_value]
+    pivot_df.columns.name = "metric_name"
+    return pivot_df.sort_values(param_cols, ignore_index=True)
+
+
+def _evaluate_metric_block(
+    values: np.ndarray, times: np.ndarray, metric_infos: list
+) -> list:
+    """Evaluates every metric of one source for a (time x run) block."""
+    min_pos = None
+    if any(info["func"] in _ARGMIN_KERNELS for info in metric_infos):
+        min_pos = _nan_argmin_cols(values)
+    return [info["func"](values, times, min_pos) for info in metric_infos]
 
 
 def extract_metrics(
     results_df: pd.DataFrame,
     metrics_definition: Dict[str, Any],
     analysis_case: Dict[str, Any],
+    max_workers: Optional[int] = None,
 ) -> pd.DataFrame:
     """Extracts summary metrics from detailed simulation results.
 
@@ -184,6 +421,8 @@ def extract_metrics(
             (e.g., source column, method).
         analysis_case: The analysis case configuration, used to identify
             dependent variables.
+        max_workers: Number of threads used to evaluate column blocks. Defaults
+            to the CPU count, capped by the number of blocks.
 
     Returns:
         A pivoted DataFrame with parameters as the index and metric names as columns.
@@ -194,8 +433,6 @@ def extract_metrics(
         DataFrame if no valid metrics are found or if pivoting fails.
     """
 
-    analysis_results = []
-
     source_to_metric = {}
     dependent_vars = analysis_case.get("dependent_variables", [])
 
@@ -206,95 +443,169 @@ def extract_metrics(
         if not definition or definition.get("method") == "bisection_search":
             continue
 
+        method_name = definition["method"]
+        calculation_func = METHOD_DISPATCH.get(method_name)
+        if calculation_func is None:
+            print(
+                f"Warning: Calculation method '{method_name}' not implemented. Skipping."
+            )
+            continue
+
         source = definition["source_column"]
         if source not in source_to_metric:
             source_to_metric[source] = []
         source_to_metric[source].append(
             {
                 "metric_name": metric_name,
-                "method": definition["method"],
+                "func": calculation_func,
             }
         )
 
+    # Parse every sweep column once into its source variable and parameters.
+    parsed_columns = {}
     for col_name in results_df.columns:
         if col_name.lower() == "time":
             continue
 
-        source_var = None
-        for var in source_to_metric.keys():
-            if col_name.startswith(var):
-                source_var = var
-                break
-
-        if not source_var:
+        match = _SWEEP_COLUMN_RE.match(col_name)
+        if not match or match.group("var") not in source_to_metric:
             continue
 
-        param_str = col_name[len(source_var) :].lstrip("&")
-
-        try:
-            params = dict(item.split("=") for item in param_str.split("&"))
-        except ValueError:
+        params = _parse_param_str(match.group("params"))
+        if params is None:
             print(
                 f"Warning: Could not parse parameters from column '{col_name}'. Skipping."
             )
             continue
 
-        for k, v in params.items():
-            try:
-                params[k] = float(v)
-            except ValueError:
-                params[k] = v
-
-        for metric_info in source_to_metric[source_var]:
-            method_name = metric_info["method"]
-            metric_name = metric_info["metric_name"]
-
-            if method_name == "final_value":
-                calculation_func = get_final_value
-            elif method_name == "calculate_startup_inventory":
-                calculation_func = calculate_startup_inventory
-            elif method_name == "time_of_turning_point":
-                calculation_func = time_of_turning_point
-            elif method_name == "calculate_doubling_time":
-                calculation_func = calculate_doubling_time
-            elif method_name == "net_tritium_balance":
-                calculation_func = net_tritium_balance
-            else:
-                print(
-                    f"Warning: Calculation method '{method_name}' not implemented. Skipping."
-                )
-                continue
-
-            metric_value = calculation_func(results_df[col_name], results_df["time"])
-
-            result_row = params.copy()
-            result_row["metric_name"] = metric_name
-            result_row["metric_value"] = metric_value
-            analysis_results.append(result_row)
+        parsed_columns[col_name] = (match.group("var"), params)
 
-    if not analysis_results:
+    # One long-format row per (column, metric); fill preallocated columns
+    # instead of building a dict per row.
+    n_rows = sum(len(source_to_metric[source]) for source, _ in parsed_columns.values())
+    if n_rows == 0:
         return pd.DataFrame()
 
-    summary_df = pd.DataFrame(analysis_results)
-
-    # Dynamically identify all parameter columns from the dataframe
-    param_cols = [
-        col for col in summary_df.columns if col not in ["metric_name", "metric_value"]
+    param_cols = list(
+        dict.fromkeys(name for _, params in parsed_columns.values() for name in params)
+    )
+    param_arrays = {name: np.full(n_rows, np.nan, dtype=object) for name in param_cols}
+    # Metric names are stored as codes into a sorted category list, which is
+    # also the column order of the pivoted result.
+    metric_categories = sorted(
+        {info["metric_name"] for infos in source_to_metric.values() for info in infos}
+    )
+    metric_codes = {name: code for code, name in enumerate(metric_categories)}
+    metric_name_codes = np.empty(n_rows, dtype=np.intp)
+    metric_values = np.empty(n_rows, dtype=np.float64)
+
+    # Group the columns by source so every metric is evaluated for a block of
+    # runs with a single 2-D reduction. Large sources are split into several
+    # blocks so they can be spread across worker threads.
+    source_columns = {}
+    for col_name, (source_var, _) in parsed_columns.items():
+        source_columns.setdefault(source_var, []).append(col_name)
+
+    blocks = [
+        (source_var, col_names[start : start + _METRIC_BLOCK_COLUMNS])
+        for source_var, col_names in source_columns.items()
+        for start in range(0, len(col_names), _METRIC_BLOCK_COLUMNS)
     ]
 
-    if not param_cols:
-        return pd.DataFrame()
+    # Convert all used columns to one float64 matrix, ordered so that every
+    # block is a contiguous column slice (a view, not a copy).
+    ordered_columns = [col for _, col_names in blocks for col in col_names]
+    matrix = results_df[ordered_columns].to_numpy(dtype=np.float64)
+    block_slices = []
+    start = 0
+    for source, col_names in blocks:
+        block_slices.append(
+            (matrix[:, start : start + len(col_names)], source_to_metric[source])
+        )
+        start += len(col_names)
+
+    times = results_df["time"].to_numpy(dtype=np.float64)
+
+    # NumPy releases the GIL inside the reductions, so threads scale without
+    # copying the data into worker processes.
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(blocks)))
+    if max_workers == 1:
+        block_results = [
+            _evaluate_metric_block(values, times, infos)
+            for values, infos in block_slices
+        ]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            block_results = list(
+                executor.map(
+                    lambda block: _evaluate_metric_block(block[0], times, block[1]),
+                    block_slices,
+                )
+            )
+
+    row = 0
+    for (source_var, col_names), results in zip(blocks, block_results):
+        metric_infos = source_to_metric[source_var]
+
+        # Rows of this block are metric-major: row + j * n_cols + i holds
+        # metric j of column i.
+        n_cols = len(col_names)
+        block_end = row + n_cols * len(metric_infos)
+        for i, col_name in enumerate(col_names):
+            for name, value in parsed_columns[col_name][1].items():
+                param_arrays[name][row + i : block_end : n_cols] = value
+
+        for metric_info, result in zip(metric_infos, results):
+            metric_name_codes[row : row + n_cols] = metric_codes[
+                metric_info["metric_name"]
+            ]
+            metric_values[row : row + n_cols] = result
+            row += n_cols
+
+    summary_df = pd.DataFrame(param_arrays).infer_objects()
+    for name in param_cols:
+        if summary_df[name].dtype == object:
+            summary_df[name] = summary_df[name].astype("category")
+    summary_df["metric_name"] = pd.Categorical.from_codes(
+        metric_name_codes, categories=metric_categories
+    )
+    summary_df["metric_value"] = metric_values
 
     try:
-        pivot_df = summary_df.pivot_table(
-            index=param_cols, columns="metric_name", values="metric_value"
-        ).reset_index()
-        return pivot_df
+        return _pivot_metric_rows(summary_df, param_cols)
     except Exception as e:
         print(f"Error during pivoting: {e}")
         return pd.DataFrame()
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_single_job_plan(metric_specs: tuple, columns: tuple) -> tuple:
+    """Resolves metric definitions against a job's columns once per layout.
+
+    Args:
+        metric_specs: Tuples of (metric_name, source_column, method).
+        columns: The column names of the job DataFrame.
+
+    Returns:
+        A tuple (plan_columns, plan) where plan_columns lists the source
+        columns to extract and each plan entry is (metric_name, index into
+        plan_columns, column kernel).
+    """
+    plan_columns = []
+    plan = []
+    available = set(columns)
+    for metric_name, source_col, method_name in metric_specs:
+        calculation_func = METHOD_DISPATCH.get(method_name)
+        if calculation_func is None or source_col not in available:
+            continue
+        if source_col not in plan_columns:
+            plan_columns.append(source_col)
+        plan.append((metric_name, plan_columns.index(source_col), calculation_func))
+    return tuple(plan_columns), tuple(plan)
+
+
 def calculate_single_job_metrics(
     job_df: pd.DataFrame,
     metrics_definition: Dict[str, Any],
@@ -310,46 +621,43 @@ def calculate_single_job_metrics(
         A dictionary mapping metric names to their calculated values.
     """
     results = {}
-    if not metrics_definition:
+    if not metrics_definition or job_df.empty:
         return results
 
-    for metric_name, definition in metrics_definition.items():
-        # Skip metrics that require complex optimization (bisection)
-        # We only calculate scalar metrics extractable from a single run.
-        if definition.get("method") == "bisection_search":
-            continue
-
-        source_col = definition.get("source_column")
-        method_name = definition.get("method")
+    # Skip metrics that require complex optimization (bisection)
+    # We only calculate scalar metrics extractable from a single run.
+    metric_specs = tuple(
+        (metric_name, definition.get("source_column"), definition.get("method"))
+        for metric_name, definition in metrics_definition.items()
+        if definition.get("method") != "bisection_search"
+    )
+    plan_columns, plan = _compile_single_job_plan(metric_specs, tuple(job_df.columns))
+    if not plan:
+        return results
 
-        if source_col not in job_df.columns:
-            continue
+    time_values = job_df["time"].to_numpy() if "time" in job_df.columns else None
+    argmin_cols = {col for _, col, func in plan if func in _ARGMIN_KERNELS}
+    # Each source column is converted (and its argmin found) once, inside the
+    # per-metric try so that one bad column only skips its own metrics.
+    column_cache = {}
 
-        series = job_df[source_col]
-        time_series = job_df["time"] if "time" in job_df.columns else None
-
-        calculation_func = None
-        if method_name == "final_value":
-            calculation_func = get_final_value
-        elif method_name == "calculate_startup_inventory":
-            calculation_func = calculate_startup_inventory
-        elif method_name == "time_of_turning_point":
-            calculation_func = time_of_turning_point
-        elif method_name == "calculate_doubling_time":
-            calculation_func = calculate_doubling_time
-
-        if calculation_func:
-            try:
-                val = calculation_func(series, time_series)
-                # Ensure JSON serializable (handle numpy types)
-                if hasattr(val, "item"):
-                    val = val.item()
-                if pd.isna(val):
-                    val = None
-                results[metric_name] = val
-            except Exception:
-                # If metric calc fails, skip it or store None
-                pass
+    for metric_name, col, calculation_func in plan:
+        try:
+            if col not in column_cache:
+                values = _as_column(job_df[plan_columns[col]], dtype=np.float64)
+                min_pos = _nan_argmin_cols(values) if col in argmin_cols else None
+                column_cache[col] = (values, min_pos)
+            values, min_pos = column_cache[col]
+            val = calculation_func(values, time_values, min_pos)[0]
+            # Ensure JSON serializable (handle numpy types)
+            if hasattr(val, "item"):
+                val = val.item()
+            if pd.isna(val):
+                val = None
+            results[metric_name] = val
+        except Exception:
+            # If metric calc fails, skip it or store None
+            pass
 
     return results
 
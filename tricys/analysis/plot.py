@@ -4,9 +4,14 @@ This module provides functions to generate plots from the simulation output
 CSV files, such as visualizing startup tritium inventory or time-series data.
 """
 
+import math
+import multiprocessing
 import os
-import re
-from typing import Any, Dict, List, Union
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import matplotlib.patches as patches
 import matplotlib.pyplot as plt
@@ -15,10 +20,15 @@ import pandas as pd
 import seaborn as sns
 
 from tricys.analysis.hdf5_support import get_hdf5_result_columns, iter_hdf5_job_results
+from tricys.utils.concurrency_utils import get_safe_max_workers
 from tricys.utils.hdf5_schema import load_jobs_df
 
 _use_chinese_labels = False
 
+# Render SVG text as paths so the Chinese labels do not depend on the fonts
+# installed where the SVGs are viewed. Set once here rather than per save.
+plt.rcParams["svg.fonttype"] = "path"
+
 # Add a dictionary for UI text translations
 _ui_text = {
     "en": {
@@ -61,8 +71,13 @@ def _get_text(key: str) -> str:
         Falls back to the key itself if translation not found, which is useful
         for units from unit_map that may not be in the predefined _ui_text dictionary.
     """
+    return _translate(key, "cn" if _use_chinese_labels else "en")
+
+
+@lru_cache(maxsize=256)
+def _translate(key: str, lang: str) -> str:
+    """Looks up key in _ui_text for lang, memoized per (key, lang)."""
     # Fallback to key itself if not found, useful for units from unit_map
-    lang = "cn" if _use_chinese_labels else "en"
     return _ui_text[lang].get(key, key)
 
 
@@ -91,6 +106,47 @@ def set_plot_language(lang: str = "en") -> None:
         plt.rcParams["axes.unicode_minus"] = plt.rcParamsDefault["axes.unicode_minus"]
 
 
+# rcParams applied for each language, matching set_plot_language().
+_LANG_RC = {
+    "cn": {
+        "font.sans-serif": ["SimHei"],
+        "axes.unicode_minus": False,
+        "font.family": "sans-serif",
+    },
+    "en": {
+        "font.sans-serif": plt.rcParamsDefault["font.sans-serif"],
+        "axes.unicode_minus": plt.rcParamsDefault["axes.unicode_minus"],
+    },
+}
+
+
+@contextmanager
+def _plot_language(lang: str) -> Iterator[None]:
+    """Temporarily switches the plot language for a block of drawing/saving.
+
+    Unlike set_plot_language(), the rcParams and the label language are
+    restored on exit, so callers do not need to track the previous setting.
+
+    Args:
+        lang: 'en' for English, 'cn' for Chinese.
+    """
+    global _use_chinese_labels
+    previous = _use_chinese_labels
+    _use_chinese_labels = lang == "cn"
+    try:
+        with plt.rc_context(_LANG_RC[lang]):
+            yield
+    finally:
+        _use_chinese_labels = previous
+
+
+_GLOSSARY_COLUMNS = (
+    "模型参数 (Model Parameter)",
+    "英文术语 (English Term)",
+    "中文翻译 (Chinese Translation)",
+)
+
+
 def load_glossary(glossary_path: str) -> tuple[dict, dict]:
     """Loads glossary data from a CSV file.
 
@@ -113,21 +169,19 @@ def load_glossary(glossary_path: str) -> tuple[dict, dict]:
         return english_glossary_map, chinese_glossary_map
 
     try:
-        df = pd.read_csv(glossary_path)
-        if (
-            "模型参数 (Model Parameter)" in df.columns
-            and "英文术语 (English Term)" in df.columns
-            and "中文翻译 (Chinese Translation)" in df.columns
-        ):
+        # Only parse the three glossary columns, as plain strings.
+        df = pd.read_csv(
+            glossary_path, usecols=lambda col: col in _GLOSSARY_COLUMNS, dtype=str
+        )
+        if all(col in df.columns for col in _GLOSSARY_COLUMNS):
             df.dropna(subset=["模型参数 (Model Parameter)"], inplace=True)
-            english_glossary_map = pd.Series(
-                df["英文术语 (English Term)"].values,
-                index=df["模型参数 (Model Parameter)"],
-            ).to_dict()
-            chinese_glossary_map = pd.Series(
-                df["中文翻译 (Chinese Translation)"].values,
-                index=df["模型参数 (Model Parameter)"],
-            ).to_dict()
+            params = df["模型参数 (Model Parameter)"].tolist()
+            english_glossary_map = dict(
+                zip(params, df["英文术语 (English Term)"].tolist())
+            )
+            chinese_glossary_map = dict(
+                zip(params, df["中文翻译 (Chinese Translation)"].tolist())
+            )
             print(f"Successfully loaded glossary from {glossary_path}.")
         else:
             print("Warning: Glossary CSV does not contain expected columns.")
@@ -137,7 +191,31 @@ def load_glossary(glossary_path: str) -> tuple[dict, dict]:
     return english_glossary_map, chinese_glossary_map
 
 
-def _format_label(label: str, glossary_maps: tuple[dict, dict]) -> str:
+@lru_cache(maxsize=1024)
+def _fallback_label(label: str) -> str:
+    """Replaces underscores and non-decimal dots in a label with spaces.
+
+    A dot is kept only between two digits, e.g. "blanket.T" becomes
+    "blanket T" while "1.5" is unchanged.
+    """
+    label = label.replace("_", " ")
+    if "." not in label:
+        return label
+
+    chars = list(label)
+    last = len(chars) - 1
+    for i, ch in enumerate(chars):
+        if ch != ".":
+            continue
+        in_number = (
+            0 < i < last and chars[i - 1].isdecimal() and chars[i + 1].isdecimal()
+        )
+        if not in_number:
+            chars[i] = " "
+    return "".join(chars)
+
+
+def _format_label(label: str, glossary_maps: Optional[tuple[dict, dict]] = None) -> str:
     """Formats a label for display using the loaded glossary.
 
     It first attempts to find a professional term from the glossary. If not
@@ -147,6 +225,7 @@ def _format_label(label: str, glossary_maps: tuple[dict, dict]) -> str:
     Args:
         label: The raw label string to format.
         glossary_maps: A tuple containing the English and Chinese glossary maps.
+            Defaults to None, in which case only the fallback formatting is used.
 
     Returns:
         The formatted label.
@@ -154,65 +233,140 @@ def _format_label(label: str, glossary_maps: tuple[dict, dict]) -> str:
     Note:
         Checks glossary for current language (English or Chinese). If not found
         or glossary not loaded, replaces underscores with spaces and removes dots
-        (except in numbers). Non-string inputs are returned unchanged.
+        (except in numbers). Non-string inputs are returned unchanged. The
+        fallback formatting does not depend on the glossary or language and is
+        memoized.
     """
-    english_glossary_map, chinese_glossary_map = glossary_maps
-
     if not isinstance(label, str):
         return label
 
-    glossary_map = chinese_glossary_map if _use_chinese_labels else english_glossary_map
-
-    if glossary_map and label in glossary_map:
-        term = glossary_map[label]
-        if pd.notna(term) and str(term).strip():
+    if glossary_maps:
+        glossary_map = glossary_maps[1] if _use_chinese_labels else glossary_maps[0]
+        term = glossary_map.get(label)
+        if term is not None and pd.notna(term) and str(term).strip():
             return str(term)
 
-    # Fallback to simple formatting
-    formatted_label = label.replace("_", " ")
-    formatted_label = re.sub(r"(?<!\d)\.|\.(?!\d)", " ", formatted_label)
-    return formatted_label
+    return _fallback_label(label)
 
 
-def _find_unit_config(var_name: str, unit_map: dict) -> dict | None:
-    """Finds the unit configuration for a variable name from the unit_map.
+def _numeric_columns(df: pd.DataFrame) -> set:
+    """Returns the names of the numeric columns of df."""
+    return set(df.select_dtypes(include=np.number).columns)
+
+
+@lru_cache(maxsize=32)
+def _viridis_palette(n: int) -> tuple:
+    """Returns n viridis colors, cached as an immutable tuple."""
+    return tuple(sns.color_palette("viridis", n))
 
-    Uses a three-step matching strategy:
-    1. Checks for an exact match
-    2. Checks if the last part of a dot-separated name matches
-    3. Checks for substring containment (longest keys first)
+
+def _save_svg(fig, save_path: str, **kwargs) -> None:
+    """Saves fig as an SVG cropped to its padded tight bounding box.
+
+    The bounding box is measured with the figure's own renderer and passed
+    to savefig, which then skips the extra draw it makes for
+    bbox_inches="tight". Canvases without a renderer use "tight" as before.
+    """
+    get_renderer = getattr(fig.canvas, "get_renderer", None)
+    if get_renderer is None:
+        bbox = "tight"
+    else:
+        bbox = fig.get_tightbbox(get_renderer()).padded(
+            plt.rcParams["savefig.pad_inches"]
+        )
+    fig.savefig(save_path, format="svg", bbox_inches=bbox, **kwargs)
+
+
+class _UnitResolver:
+    """Resolves unit configurations for variable names against a unit_map.
+
+    The longest-first key order is computed once and every resolved name is
+    memoized, so repeated lookups for the same axis or metric are O(1).
 
     Args:
-        var_name: The variable name to look up.
         unit_map: Dictionary mapping variable names to unit configurations.
+    """
+
+    def __init__(self, unit_map: dict | None):
+        self.exact = unit_map or {}
+        self.sorted_keys = sorted(self.exact.keys(), key=len, reverse=True)
+        self.cache: dict[str, dict | None] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.exact)
+
+    def resolve(self, var_name: str) -> dict | None:
+        """Finds the unit configuration for a variable name.
+
+        Uses a three-step matching strategy:
+        1. Checks for an exact match
+        2. Checks if the last part of a dot-separated name matches
+        3. Checks for substring containment (longest keys first)
+
+        Args:
+            var_name: The variable name to look up.
+
+        Returns:
+            The unit configuration dict if found, None otherwise.
+        """
+        if not self.exact or not var_name:
+            return None
+        if var_name in self.cache:
+            return self.cache[var_name]
+
+        config = None
+        # 1. Exact match
+        if var_name in self.exact:
+            config = self.exact[var_name]
+        else:
+            # 2. Last component match (e.g., 'pulse.power' matches 'power')
+            components = var_name.split(".")
+            if len(components) > 1 and components[-1] in self.exact:
+                config = self.exact[components[-1]]
+            else:
+                # 3. Substring match (longest key first to be safer)
+                for key in self.sorted_keys:
+                    if key in var_name:
+                        config = self.exact[key]
+                        break
+
+        self.cache[var_name] = config
+        return config
+
+
+def _conversion_factor(unit_config: dict | None) -> float:
+    """Returns the conversion factor of a unit config, 1.0 when absent or unset."""
+    if not unit_config:
+        return 1.0
+    return float(unit_config.get("conversion_factor") or 1.0)
+
+
+def _find_unit_config(
+    var_name: str, unit_map: Union[dict, _UnitResolver, None]
+) -> dict | None:
+    """Finds the unit configuration for a variable name from the unit_map.
+
+    Args:
+        var_name: The variable name to look up.
+        unit_map: Dictionary mapping variable names to unit configurations, or
+            a prebuilt _UnitResolver wrapping one.
 
     Returns:
         The unit configuration dict if found, None otherwise.
 
     Note:
         Unit config typically contains 'unit' and 'conversion_factor' keys.
-        Step 3 uses longest-first matching to prefer more specific matches.
+        Matching follows _UnitResolver.resolve. Pass a _UnitResolver when
+        resolving many names against the same map so lookups are memoized.
     """
-    if not unit_map or not var_name:
-        return None
-
-    # 1. Exact match
-    if var_name in unit_map:
-        return unit_map[var_name]
-
-    # 2. Last component match (e.g., 'pulse.power' matches 'power')
-    components = var_name.split(".")
-    if len(components) > 1:
-        last_component = components[-1]
-        if last_component in unit_map:
-            return unit_map[last_component]
+    if not isinstance(unit_map, _UnitResolver):
+        unit_map = _UnitResolver(unit_map)
+    return unit_map.resolve(var_name)
 
-    # 3. Substring match (longest key first to be safer)
-    for key in sorted(unit_map.keys(), key=len, reverse=True):
-        if key in var_name:
-            return unit_map[key]
 
-    return None
+# Display formats for |value| in [1, 10), [10, 100) and [100, inf).
+_DISPLAY_FORMATS = ("{:.3f}", "{:.2f}", "{:.1f}")
+_DISPLAY_DECADES = (1.0, 10.0, 100.0)
 
 
 def _format_number_for_display(value: float) -> str:
@@ -235,23 +389,54 @@ def _format_number_for_display(value: float) -> str:
         Returns string representation for NaN and infinity values.
         Uses scientific notation for very small values to maintain readability.
     """
-    if np.isnan(value) or np.isinf(value):
+    if not math.isfinite(value):
         return str(value)
 
     abs_value = abs(value)
 
     if abs_value == 0:
         return "0"
-    elif abs_value >= 100:
-        return f"{value:.1f}"
-    elif abs_value >= 10:
-        return f"{value:.2f}"
-    elif abs_value >= 1:
-        return f"{value:.3f}"
-    else:
+    if abs_value < 1:
         # For very small numbers, use scientific notation
         return f"{value:.2e}"
 
+    # Pick the format by decade; log10 can round up just below a power of ten.
+    idx = min(2, int(math.log10(abs_value)))
+    if abs_value < _DISPLAY_DECADES[idx]:
+        idx -= 1
+    return _DISPLAY_FORMATS[idx].format(value)
+
+
+def _format_numbers_for_display(values: np.ndarray) -> np.ndarray:
+    """Vectorized counterpart of _format_number_for_display.
+
+    Args:
+        values: Array-like of numeric values.
+
+    Returns:
+        An object array of formatted strings with the same shape as values.
+
+    Note:
+        Values are bucketed by magnitude with np.digitize so each format string
+        is applied to a whole bucket at once; results match the scalar version.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.empty(values.shape, dtype=object)
+    abs_values = np.abs(values)
+    finite = np.isfinite(values)
+    buckets = np.digitize(abs_values, _DISPLAY_DECADES)
+
+    def fill(mask: np.ndarray, fmt: str) -> None:
+        if mask.any():
+            out[mask] = [fmt.format(v) for v in values[mask].tolist()]
+
+    fill(~finite, "{}")
+    fill(finite & (abs_values == 0), "0")
+    fill(finite & (abs_values != 0) & (buckets == 0), "{:.2e}")
+    for bucket, fmt in enumerate(_DISPLAY_FORMATS, start=1):
+        fill(finite & (buckets == bucket), fmt)
+    return out
+
 
 def _generate_multi_required_plot(
     summary_df: pd.DataFrame,
@@ -284,149 +469,157 @@ def _generate_multi_required_plot(
         constraint values. Uses viridis color palette for line coloring.
     """
     plot_paths = []
-    original_lang_is_chinese = _use_chinese_labels
-
-    for lang in ["en", "cn"]:
-        set_plot_language(lang)
 
-        x_var = case["independent_variable"]
-        case_sim_params = case.get("default_simulation_values", {})
-        hue_vars = sorted(list(case_sim_params.keys()))
+    x_var = case["independent_variable"]
+    case_sim_params = case.get("default_simulation_values", {})
+    hue_vars = sorted(list(case_sim_params.keys()))
+
+    x_config = _find_unit_config(x_var, unit_map) if unit_map else None
+    base_config = _find_unit_config(base_metric_name, unit_map) if unit_map else None
+
+    # Only the plotted columns are extracted, and unit conversion does not
+    # depend on the language, so it is applied once on plain float arrays.
+    # Values that are not numbers become NaN and are left out of the lines.
+    x_all = pd.to_numeric(summary_df[x_var], errors="coerce").to_numpy(dtype=np.float64)
+    y_frame = summary_df[required_cols]
+    if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in y_frame.dtypes):
+        y_frame = y_frame.apply(pd.to_numeric, errors="coerce")
+    y_all = y_frame.to_numpy(dtype=np.float64)
+    x_factor = _conversion_factor(x_config)
+    y_factor = _conversion_factor(base_config)
+    if x_factor != 1.0:
+        x_all = x_all / x_factor
+    if y_factor != 1.0:
+        y_all = y_all / y_factor
+
+    if not hue_vars:
+        # If no hue_vars, create a single plot with all required_cols.
+        fig, ax = plt.subplots(1, 1, figsize=(12, 8))
+        axes = [ax]
+        plot_groups = [("All Data", np.arange(len(summary_df)))]
+    else:
+        # Group row positions by unique combinations of hue_vars
+        plot_groups = list(summary_df.groupby(hue_vars, observed=True).indices.items())
+        n_plots = len(plot_groups)
+        if n_plots == 0:
+            return []
 
-        x_var_label = _format_label(x_var, glossary_maps)
-        base_metric_name_label = _format_label(base_metric_name, glossary_maps)
-
-        # Apply units to labels if unit_map is provided
-        if unit_map:
-            x_config = _find_unit_config(x_var, unit_map)
-            if x_config and x_config.get("unit"):
-                unit = _get_text(x_config.get("unit"))
-                x_var_label = f"{x_var_label} ({unit})"
-
-            base_config = _find_unit_config(base_metric_name, unit_map)
-            if base_config and base_config.get("unit"):
-                unit = _get_text(base_config.get("unit"))
-                base_metric_name_label = f"{base_metric_name_label} ({unit})"
-
-        if not hue_vars:
-            # If no hue_vars, create a single plot with all required_cols.
-            fig, ax = plt.subplots(1, 1, figsize=(12, 8))
-            axes = [ax]
-            plot_groups = [("All Data", summary_df)]
+        # Determine layout
+        if n_plots <= 2:
+            rows, cols = 1, n_plots
+        elif n_plots <= 4:
+            rows, cols = 2, 2
         else:
-            # Group data by unique combinations of hue_vars
-            plot_groups = list(summary_df.groupby(hue_vars))
-            n_plots = len(plot_groups)
-            if n_plots == 0:
-                return []
-
-            # Determine layout
-            if n_plots <= 2:
-                rows, cols = 1, n_plots
-            elif n_plots <= 4:
-                rows, cols = 2, 2
-            else:
-                rows = int(np.ceil(np.sqrt(n_plots)))
-                cols = int(np.ceil(n_plots / rows))
+            rows = int(np.ceil(np.sqrt(n_plots)))
+            cols = int(np.ceil(n_plots / rows))
 
-            fig, axes = plt.subplots(
-                rows, cols, figsize=(cols * 7, rows * 5), squeeze=False
+        fig, axes = plt.subplots(
+            rows, cols, figsize=(cols * 7, rows * 5), squeeze=False
+        )
+        axes = axes.flatten()
+
+    line_colors = _viridis_palette(len(required_cols))
+
+    # Dynamically determine the legend title from associated metric columns
+    legend_metric_name = None
+    search_pattern = f"_for_{base_metric_name}"
+    for col in summary_df.columns:
+        if search_pattern in col:
+            legend_metric_name = col.split(search_pattern)[0]
+            break
+
+    # The data is drawn once; only the text differs between languages.
+    used_axes = axes[: len(plot_groups)]
+    for ax, (group_name, positions) in zip(used_axes, plot_groups):
+        order = positions[np.argsort(x_all[positions], kind="stable")]
+        x = x_all[order]
+        y_values = y_all[order]
+
+        # Plot each required_col as a line in the subplot
+        for i, req_col in enumerate(required_cols):
+            # Create a clean label for the legend
+            legend_label = req_col.replace(base_metric_name, "").strip("()")
+            if not legend_label:
+                legend_label = req_col
+
+            # Plain lines on sorted x; missing points are skipped, not gapped.
+            y = y_values[:, i]
+            valid = ~(np.isnan(x) | np.isnan(y))
+            ax.plot(
+                x[valid],
+                y[valid],
+                color=line_colors[i],
+                label=_format_label(legend_label),
+                marker="o",
+                markersize=6,
+                linewidth=2.0,
             )
-            axes = axes.flatten()
-
-        line_colors = sns.color_palette("viridis", len(required_cols))
-
-        # Create a subplot for each group
-        for idx, (group_name, group_df) in enumerate(plot_groups):
-            if idx >= len(axes):
-                break
-            ax = axes[idx]
-
-            plot_df = group_df.copy()
-
-            # Apply data conversion for x-axis
-            if unit_map:
-                x_config = _find_unit_config(x_var, unit_map)
-                if x_config:
-                    factor = x_config.get("conversion_factor")
-                    if factor and pd.api.types.is_numeric_dtype(plot_df[x_var]):
-                        plot_df[x_var] = plot_df[x_var] / float(factor)
-
-            # Plot each required_col as a line in the subplot
-            for i, req_col in enumerate(required_cols):
-                # Create a clean label for the legend
-                legend_label = req_col.replace(base_metric_name, "").strip("()")
-                if not legend_label:
-                    legend_label = req_col
-
-                # Apply data conversion for y-axis
-                if unit_map:
-                    base_config = _find_unit_config(base_metric_name, unit_map)
-                    if base_config:
-                        factor = base_config.get("conversion_factor")
-                        if factor and pd.api.types.is_numeric_dtype(plot_df[req_col]):
-                            plot_df[req_col] = plot_df[req_col] / float(factor)
-
-                sns.lineplot(
-                    data=plot_df,
-                    x=x_var,
-                    y=req_col,
-                    ax=ax,
-                    color=line_colors[i],
-                    label=_format_label(legend_label),
-                    marker="o",
-                    markersize=6,
-                    linewidth=2.0,
-                )
 
-            # Subplot titles and labels
-            if hue_vars:
-                if isinstance(group_name, tuple):
-                    title = ", ".join(
-                        f"{_format_label(k)}={v}" for k, v in zip(hue_vars, group_name)
-                    )
-                else:
-                    title = f"{_format_label(hue_vars[0])}={group_name}"
-                ax.set_title(title, fontsize=12)
+        # Subplot titles for parameter groups do not depend on the language
+        if hue_vars:
+            if isinstance(group_name, tuple):
+                title = ", ".join(
+                    f"{_format_label(k)}={v}" for k, v in zip(hue_vars, group_name)
+                )
             else:
+                title = f"{_format_label(hue_vars[0])}={group_name}"
+            ax.set_title(title, fontsize=12)
+
+        ax.grid(True, which="both", linestyle="--", linewidth=0.5)
+        ax.legend()
+
+    # Hide unused axes
+    for i in range(len(plot_groups), len(axes)):
+        axes[i].set_visible(False)
+
+    # Everything below that varies by language is label text only.
+    x_unit = x_config.get("unit") if x_config else None
+    base_unit = base_config.get("unit") if base_config else None
+    legend_metric_label = (
+        _format_label(legend_metric_name) if legend_metric_name is not None else None
+    )
+
+    for lang in ["en", "cn"]:
+        with _plot_language(lang):
+            x_var_label = _format_label(x_var, glossary_maps)
+            base_metric_name_label = _format_label(base_metric_name, glossary_maps)
+
+            # Apply units to labels if unit_map is provided
+            if x_unit:
+                x_var_label = f"{x_var_label} ({_get_text(x_unit)})"
+            if base_unit:
+                base_metric_name_label = (
+                    f"{base_metric_name_label} ({_get_text(base_unit)})"
+                )
+
+            legend_title = legend_metric_label
+            if legend_title is None:
+                legend_title = _get_text("constraint")  # A more descriptive default
+            title = None
+            if not hue_vars:
                 title = _get_text("dependence_of_on").format(
                     y_label=base_metric_name_label, x_label=x_var_label
                 )
-                ax.set_title(title, fontsize=12)
-
-            ax.set_xlabel(x_var_label, fontsize=12)
-            ax.set_ylabel(base_metric_name_label, fontsize=12)
-            ax.grid(True, which="both", linestyle="--", linewidth=0.5)
-            # Dynamically determine the legend title from associated metric columns
-            legend_title = _get_text("constraint")  # A more descriptive default
-            search_pattern = f"_for_{base_metric_name}"
-            for col in summary_df.columns:
-                if search_pattern in col:
-                    metric_name = col.split(search_pattern)[0]
-                    legend_title = _format_label(metric_name)
-                    break
-
-            ax.legend(title=legend_title)
-
-        # Hide unused axes
-        for i in range(len(plot_groups), len(axes)):
-            axes[i].set_visible(False)
-
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-
-        suffix = "_zh" if lang == "cn" else ""
-        save_path = os.path.join(
-            save_dir, f"multi_{base_metric_name}_analysis_by_param{suffix}.svg"
-        )
-        # Force text to be rendered as paths in SVG.
-        plt.rcParams["svg.fonttype"] = "path"
-        plt.savefig(save_path, format="svg", bbox_inches="tight")
-        plt.close(fig)
 
-        print(f"Generated multi-metric analysis plot by parameter: {save_path}")
-        plot_paths.append(save_path)
+            for ax in used_axes:
+                if title is not None:
+                    ax.set_title(title, fontsize=12)
+                ax.set_xlabel(x_var_label, fontsize=12)
+                ax.set_ylabel(base_metric_name_label, fontsize=12)
+                ax.get_legend().set_title(legend_title)
+
+            plt.tight_layout(rect=[0, 0.03, 1, 0.95])
+
+            suffix = "_zh" if lang == "cn" else ""
+            save_path = os.path.join(
+                save_dir, f"multi_{base_metric_name}_analysis_by_param{suffix}.svg"
+            )
+            _save_svg(fig, save_path)
+
+            print(f"Generated multi-metric analysis plot by parameter: {save_path}")
+            plot_paths.append(save_path)
 
-    set_plot_language("cn" if original_lang_is_chinese else "en")
+    plt.close(fig)
     return plot_paths
 
 
@@ -464,13 +657,14 @@ def generate_analysis_plots(
 
     analysis_cases = [analysis_case]  # Keep as a list for consistency
     sns.set_theme(style="whitegrid")
-    line_colors = sns.color_palette("viridis", 10)
+    line_colors = _viridis_palette(10)
 
     plot_paths = []
 
-    # If unit_map is not provided, initialize as empty dict
-    if unit_map is None:
-        unit_map = {}
+    # Resolve unit configs once per name for every plot generated below.
+    unit_map = _UnitResolver(unit_map)
+    numeric_cols = _numeric_columns(summary_df)
+    summary_cols = set(summary_df.columns)
 
     # --- 1. Handle ALL 'Required_***' plots first and separately ---
     all_required_vars_from_config = {
@@ -480,15 +674,16 @@ def generate_analysis_plots(
         if var.startswith("Required_")
     }
 
+    # Index columns by the name before any "(...)" suffix, so "Required_X" and
+    # "Required_X(Doubling_Time=5)" both file under "Required_X".
+    base_to_cols = defaultdict(list)
+    for col in summary_cols:
+        if isinstance(col, str):
+            base_to_cols[col.split("(", 1)[0]].append(col)
+
     for req_var in all_required_vars_from_config:
         # Find all actual columns in the dataframe for this base name
-        matching_cols = sorted(
-            [
-                c
-                for c in summary_df.columns
-                if c == req_var or c.startswith(req_var + "(")
-            ]
-        )
+        matching_cols = sorted(base_to_cols.get(req_var, []))
 
         if not matching_cols:
             continue
@@ -525,6 +720,7 @@ def generate_analysis_plots(
                 line_colors,
                 unit_map=unit_map,
                 glossary_maps=glossary_maps,
+                numeric_cols=numeric_cols,
             )
             plot_paths.extend(single_plot_path)
 
@@ -543,7 +739,7 @@ def generate_analysis_plots(
             if not v.startswith("Required_")
         ]
 
-        if x_var not in summary_df.columns:
+        if x_var not in summary_cols:
             print(
                 f"Warning: Independent variable '{x_var}' not found in summary data for case '{case_name}'. Skipping."
             )
@@ -553,7 +749,7 @@ def generate_analysis_plots(
         hue_vars = sorted(list(case_sim_params.keys()))
 
         for y_var in y_vars:
-            if y_var not in summary_df.columns:
+            if y_var not in summary_cols:
                 print(
                     f"Warning: Dependent variable '{y_var}' not found in summary data for case '{case_name}'. Skipping."
                 )
@@ -581,6 +777,7 @@ def generate_analysis_plots(
                 line_colors,
                 unit_map=unit_map,
                 glossary_maps=glossary_maps,
+                numeric_cols=numeric_cols,
             )
         else:
             # If not combining, plot them individually anyway
@@ -591,6 +788,7 @@ def generate_analysis_plots(
                 line_colors,
                 unit_map=unit_map,
                 glossary_maps=glossary_maps,
+                numeric_cols=numeric_cols,
             )
         plot_paths.extend(generated_paths)
 
@@ -604,6 +802,7 @@ def _generate_combined_plots(
     line_colors: list,
     unit_map: dict = None,
     glossary_maps: tuple[dict, dict] = ({}, {}),
+    numeric_cols: Optional[set] = None,
 ) -> list[str]:
     """Generate a single combined figure with multiple subplots.
 
@@ -618,6 +817,8 @@ def _generate_combined_plots(
         line_colors: List of colors for plot lines.
         unit_map: Optional unit configuration dictionary. Defaults to None.
         glossary_maps: Optional tuple of glossary maps.
+        numeric_cols: Optional set of numeric column names in summary_df,
+            computed from its dtypes when not given.
 
     Returns:
         List of paths to saved plot files.
@@ -641,52 +842,50 @@ def _generate_combined_plots(
             line_colors,
             unit_map=unit_map,
             glossary_maps=glossary_maps,
+            numeric_cols=numeric_cols,
         )
 
     plot_paths = []
-    original_lang_is_chinese = _use_chinese_labels
-
-    for lang in ["en", "cn"]:
-        set_plot_language(lang)
-
-        axes_list = []
-        is_odd = n_plots % 2 == 1
-
-        # Determine layout based on number of plots
-        if is_odd and n_plots > 1:
-            # Custom layout for odd numbers (3, 5, 7...)
-            rows = int(np.ceil(n_plots / 2))
-            cols = 2
-            fig = plt.figure(figsize=(cols * 8, rows * 5))
-            gs = fig.add_gridspec(
-                rows, cols, height_ratios=[1] * rows, hspace=0.3, wspace=0.2
-            )
 
-            # Add all but the last plot
-            for i in range(n_plots - 1):
-                ax = fig.add_subplot(gs[i // cols, i % cols])
-                axes_list.append(ax)
+    axes_list = []
+    is_odd = n_plots % 2 == 1
+
+    # Determine layout based on number of plots
+    if is_odd and n_plots > 1:
+        # Custom layout for odd numbers (3, 5, 7...)
+        rows = int(np.ceil(n_plots / 2))
+        cols = 2
+        fig = plt.figure(figsize=(cols * 8, rows * 5))
+        gs = fig.add_gridspec(
+            rows, cols, height_ratios=[1] * rows, hspace=0.3, wspace=0.2
+        )
 
-            # Add the last plot, spanning the full width of the last row
-            ax = fig.add_subplot(gs[rows - 1, :])
+        # Add all but the last plot
+        for i in range(n_plots - 1):
+            ax = fig.add_subplot(gs[i // cols, i % cols])
             axes_list.append(ax)
 
-        else:
-            # General layout for even numbers and a single plot
-            cols = 2
-            rows = int(np.ceil(n_plots / cols))
-            fig, axes = plt.subplots(
-                rows, cols, figsize=(cols * 8, rows * 5), squeeze=False
-            )
-            axes_list = axes.flatten()
+        # Add the last plot, spanning the full width of the last row
+        ax = fig.add_subplot(gs[rows - 1, :])
+        axes_list.append(ax)
+
+    else:
+        # General layout for even numbers and a single plot
+        cols = 2
+        rows = int(np.ceil(n_plots / cols))
+        fig, axes = plt.subplots(
+            rows, cols, figsize=(cols * 8, rows * 5), squeeze=False
+        )
+        axes_list = axes.flatten()
 
-        # Set overall figure properties
-        fig.patch.set_facecolor("white")
-        # x_var_label = _format_label(valid_plots[0]["x_var"])
+    # Set overall figure properties
+    fig.patch.set_facecolor("white")
 
-        # Generate each subplot
-        for idx, plot_config in enumerate(valid_plots):
-            ax = axes_list[idx]
+    # Generate each subplot once; only the labels are redrawn per language
+    label_appliers = []
+    for idx, plot_config in enumerate(valid_plots):
+        ax = axes_list[idx]
+        label_appliers.append(
             _create_subplot(
                 summary_df,
                 plot_config,
@@ -695,37 +894,43 @@ def _generate_combined_plots(
                 idx,
                 unit_map=unit_map,
                 glossary_maps=glossary_maps,
+                numeric_cols=numeric_cols,
             )
-
-        # Hide any unused axes (only relevant for even-number layouts)
-        for i in range(n_plots, len(axes_list)):
-            axes_list[i].set_visible(False)
-
-        # Adjust layout
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95], pad=3.0)
-
-        # Save the combined figure
-        suffix = "_zh" if lang == "cn" else ""
-        combined_filename = f"combined_analysis_plots{suffix}.svg"
-        save_path = os.path.join(save_dir, combined_filename)
-        # Force text to be rendered as paths in SVG.
-        plt.rcParams["svg.fonttype"] = "path"
-        plt.savefig(
-            save_path,
-            format="svg",
-            bbox_inches="tight",
-            facecolor="white",
-            edgecolor="none",
         )
-        plt.close(fig)
 
-        print(f"Generated combined analysis plot: {save_path}")
-        plot_paths.append(save_path)
+    # Hide any unused axes (only relevant for even-number layouts)
+    for i in range(n_plots, len(axes_list)):
+        axes_list[i].set_visible(False)
+
+    for lang in ["en", "cn"]:
+        with _plot_language(lang):
+            for apply_labels in label_appliers:
+                apply_labels()
+
+            # Adjust layout
+            plt.tight_layout(rect=[0, 0.03, 1, 0.95], pad=3.0)
+
+            # Save the combined figure
+            suffix = "_zh" if lang == "cn" else ""
+            combined_filename = f"combined_analysis_plots{suffix}.svg"
+            save_path = os.path.join(save_dir, combined_filename)
+            _save_svg(fig, save_path, facecolor="white", edgecolor="none")
+
+            print(f"Generated combined analysis plot: {save_path}")
+            plot_paths.append(save_path)
 
-    set_plot_language("cn" if original_lang_is_chinese else "en")
+    plt.close(fig)
     return plot_paths
 
 
+# Size of the figures drawn by _render_individual_plot.
+_INDIVIDUAL_FIGSIZE = (12, 8)
+
+# Fewer individual plots than this are rendered in-process, as starting a
+# process pool costs more than drawing them.
+_MIN_PLOTS_FOR_WORKERS = 4
+
+
 def _generate_individual_plots(
     summary_df: pd.DataFrame,
     valid_plots: list[dict],
@@ -733,6 +938,7 @@ def _generate_individual_plots(
     line_colors: list,
     unit_map: dict = None,
     glossary_maps: tuple[dict, dict] = ({}, {}),
+    numeric_cols: Optional[set] = None,
 ) -> list[str]:
     """Generate individual plot files (original behavior).
 
@@ -743,6 +949,8 @@ def _generate_individual_plots(
         line_colors: List of colors for plot lines.
         unit_map: Optional unit configuration dictionary. Defaults to None.
         glossary_maps: Optional tuple of glossary maps.
+        numeric_cols: Optional set of numeric column names in summary_df,
+            computed from its dtypes when not given.
 
     Returns:
         List of paths to saved plot files.
@@ -750,57 +958,159 @@ def _generate_individual_plots(
     Note:
         Creates separate SVG files for each plot configuration. Generates bilingual
         versions (English and Chinese) with _zh suffix for Chinese. Each plot is
-        saved as {plot_type}_{y_var}_vs_{x_var}[_zh].svg.
+        saved as {plot_type}_{y_var}_vs_{x_var}[_zh].svg. Multiple configurations
+        are rendered in a process pool; paths keep the order of valid_plots.
+    """
+
+    shared_args = (save_dir, line_colors, unit_map, glossary_maps, numeric_cols)
+    render_args = [
+        (summary_df, plot_config, idx) + shared_args
+        for idx, plot_config in enumerate(valid_plots)
+    ]
+
+    # Figures are independent, so render them in worker processes when there
+    # are enough of them to pay for starting the pool. Daemonic processes
+    # (e.g. analysis cases run in a multiprocessing.Pool) cannot start
+    # children and fall back to rendering in-process.
+    max_workers = 1
+    if (
+        len(valid_plots) >= _MIN_PLOTS_FOR_WORKERS
+        and not multiprocessing.current_process().daemon
+    ):
+        max_workers = get_safe_max_workers(task_count=len(valid_plots))
+
+    if max_workers > 1:
+        rc_snapshot = {k: v for k, v in plt.rcParams.items() if k != "backend"}
+        # summary_df and the shared arguments are sent once per worker; each
+        # task only carries its plot configuration and index.
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_plot_worker,
+            initargs=(rc_snapshot, summary_df, shared_args),
+        ) as executor:
+            results = list(
+                executor.map(
+                    _render_individual_plot_in_worker,
+                    valid_plots,
+                    range(len(valid_plots)),
+                )
+            )
+    else:
+        # Draw every configuration on one figure, cleared between plots.
+        fig = plt.figure(figsize=_INDIVIDUAL_FIGSIZE)
+        try:
+            results = [_render_individual_plot(*args, fig=fig) for args in render_args]
+        finally:
+            plt.close(fig)
+
+    return [path for paths in results for path in paths]
+
+
+# Figure reused by every plot rendered in a worker process.
+_worker_figure = None
+# (summary_df, shared arguments) received once by each worker process.
+_worker_plot_data = None
+
+
+def _init_plot_worker(
+    rc_params: dict, summary_df: pd.DataFrame, shared_args: tuple
+) -> None:
+    """Prepares a worker process to render figures without a display."""
+    global _worker_figure, _worker_plot_data
+    plt.switch_backend("Agg")
+    plt.rcParams.update(rc_params)
+    _worker_figure = plt.figure(figsize=_INDIVIDUAL_FIGSIZE)
+    _worker_plot_data = (summary_df, shared_args)
+
+
+def _render_individual_plot_in_worker(plot_config: dict, plot_index: int) -> list[str]:
+    """Runs _render_individual_plot on the worker process's shared figure."""
+    summary_df, shared_args = _worker_plot_data
+    return _render_individual_plot(
+        summary_df, plot_config, plot_index, *shared_args, fig=_worker_figure
+    )
+
+
+def _render_individual_plot(
+    summary_df: pd.DataFrame,
+    plot_config: dict,
+    plot_index: int,
+    save_dir: str,
+    line_colors: list,
+    unit_map: dict = None,
+    glossary_maps: tuple[dict, dict] = ({}, {}),
+    numeric_cols: Optional[set] = None,
+    fig=None,
+) -> list[str]:
+    """Draws one plot configuration and saves it in English and Chinese.
+
+    Args:
+        summary_df: DataFrame containing plot data.
+        plot_config: Plot configuration dictionary.
+        plot_index: Index of the plot, used to select a line color.
+        save_dir: Directory to save plots.
+        line_colors: List of colors for plot lines.
+        unit_map: Optional unit configuration dictionary. Defaults to None.
+        glossary_maps: Optional tuple of glossary maps.
+        numeric_cols: Optional set of numeric column names in summary_df,
+            computed from its dtypes when not given.
+        fig: Optional figure to draw on. It is cleared first and left open so
+            the caller can reuse it for the next plot. When not given, a new
+            figure is created and closed after saving.
+
+    Returns:
+        Paths of the saved English and Chinese SVG files.
     """
     plot_paths = []
-    original_lang_is_chinese = _use_chinese_labels
 
-    for idx, plot_config in enumerate(valid_plots):
-        for lang in ["en", "cn"]:
-            set_plot_language(lang)
+    owns_figure = fig is None
+    if owns_figure:
+        fig = plt.figure(figsize=_INDIVIDUAL_FIGSIZE)
+    else:
+        fig.clf()
+    ax = fig.add_subplot(111)
+    fig.patch.set_facecolor("white")
+
+    apply_labels = _create_subplot(
+        summary_df,
+        plot_config,
+        ax,
+        line_colors,
+        plot_index,
+        unit_map=unit_map,
+        glossary_maps=glossary_maps,
+        numeric_cols=numeric_cols,
+    )
 
-            # Create individual figure
-            fig, ax = plt.subplots(figsize=(12, 8))
-            fig.patch.set_facecolor("white")
+    x_var = plot_config["x_var"]
+    y_var = plot_config["y_var"]
+    plot_type = plot_config["plot_type"]
 
-            _create_subplot(
-                summary_df,
-                plot_config,
-                ax,
-                line_colors,
-                idx,
-                unit_map=unit_map,
-                glossary_maps=glossary_maps,
-            )
+    for lang in ["en", "cn"]:
+        with _plot_language(lang):
+            apply_labels()
 
             # Adjust layout
-            plt.tight_layout(pad=2.0)
+            fig.tight_layout(pad=2.0)
 
             # Save individual plot
-            x_var = plot_config["x_var"]
-            y_var = plot_config["y_var"]
-            plot_type = plot_config["plot_type"]
             suffix = "_zh" if lang == "cn" else ""
             plot_filename = f"{plot_type}_{y_var}_vs_{x_var}{suffix}.svg"
             save_path = os.path.join(save_dir, plot_filename)
 
-            # Force text to be rendered as paths in SVG.
-            plt.rcParams["svg.fonttype"] = "path"
-            plt.savefig(
-                save_path,
-                format="svg",
-                bbox_inches="tight",
-                facecolor="white",
-                edgecolor="none",
-            )
-            plt.close(fig)
+            _save_svg(fig, save_path, facecolor="white", edgecolor="none")
             plot_paths.append(save_path)
             print(f"Generated enhanced analysis plot: {save_path}")
 
-    set_plot_language("cn" if original_lang_is_chinese else "en")
+    if owns_figure:
+        plt.close(fig)
     return plot_paths
 
 
+# Upper bound on the data point annotations drawn in one subplot.
+_MAX_ANNOTATIONS = 50
+
+
 def _create_subplot(
     summary_df: pd.DataFrame,
     plot_config: dict,
@@ -809,7 +1119,8 @@ def _create_subplot(
     plot_index: int,
     unit_map: dict = None,
     glossary_maps: tuple[dict, dict] = ({}, {}),
-) -> None:
+    numeric_cols: Optional[set] = None,
+) -> Callable[[], None]:
     """Creates and beautifies a single subplot for sensitivity analysis results.
 
     This function handles plotting one dependent variable against an independent
@@ -824,72 +1135,87 @@ def _create_subplot(
         plot_index: The index of the plot, used to select a color.
         unit_map: Optional dictionary for unit conversion and labeling. Defaults to None.
         glossary_maps: Optional tuple of glossary maps.
+        numeric_cols: Optional set of numeric column names in summary_df,
+            computed from its dtypes when not given.
+
+    Returns:
+        A callable that sets the title, axis labels and legend title for the
+        current plot language. Call it once per language (see _plot_language)
+        so one drawn subplot can be saved in several languages.
 
     Note:
         Applies unit conversions from unit_map if provided. Creates multi-line plots
         with different styles for hue variables. Annotates data points when number of
-        curves <= 4 for readability. Uses viridis palette for multi-curve plots.
+        curves <= 4 for readability, thinned to at most
+        _MAX_ANNOTATIONS points. Uses viridis palette for multi-curve plots.
     """
     x_var = plot_config["x_var"]
     y_var = plot_config["y_var"]
     hue_vars = plot_config.get("hue_vars", [])
 
-    # Format labels for display
-    x_var_label = _format_label(x_var, glossary_maps)
-    y_var_display = _format_label(y_var, glossary_maps)
-
     # Create a local copy for plotting to avoid changing the original DataFrame
     plot_vars = [x_var, y_var] + hue_vars
     plot_data = summary_df[plot_vars].copy().dropna()
 
-    # Initialize labels
-    final_y_var_label = y_var_display
-    final_x_var_label = x_var_label
+    if numeric_cols is None:
+        numeric_cols = _numeric_columns(summary_df)
+
+    # Unit keys (resolved per language in apply_labels) for each axis
+    x_unit = None
+    y_unit = None
 
-    # Apply unit conversions and formatting based on unit_map
+    # Apply unit conversions based on unit_map
     if unit_map:
         # Process Y-axis variable
         y_config = _find_unit_config(y_var, unit_map)
         if y_config:
-            unit = y_config.get("unit")
-            factor = y_config.get("conversion_factor")
-            if factor and pd.api.types.is_numeric_dtype(plot_data[y_var]):
-                plot_data[y_var] = plot_data[y_var] / float(factor)
-            if unit:
-                final_y_var_label = f"{y_var_display} ({_get_text(unit)})"
+            y_unit = y_config.get("unit")
+            factor = _conversion_factor(y_config)
+            if factor != 1.0 and y_var in numeric_cols:
+                plot_data[y_var] = plot_data[y_var] / factor
 
         # Process X-axis variable
         x_config = _find_unit_config(x_var, unit_map)
         if x_config:
-            unit = x_config.get("unit")
-            factor = x_config.get("conversion_factor")
-            if factor and pd.api.types.is_numeric_dtype(plot_data[x_var]):
-                plot_data[x_var] = plot_data[x_var] / float(factor)
-            if unit:
-                final_x_var_label = f"{x_var_label} ({_get_text(unit)})"
+            x_unit = x_config.get("unit")
+            factor = _conversion_factor(x_config)
+            if factor != 1.0 and x_var in numeric_cols:
+                plot_data[x_var] = plot_data[x_var] / factor
     else:
         # Fallback to old hard-coded logic if no unit_map is provided
         if y_var in ["Doubling_Time", "Self_Sufficiency_Time"]:
             plot_data[y_var] = plot_data[y_var] / 24
-            final_y_var_label = f"{y_var_display} ({_get_text('days')})"
+            y_unit = "days"
         elif y_var == "Startup_Inventory":
             plot_data[y_var] = plot_data[y_var] / 1000.0
-            final_y_var_label = f"{y_var_display} ({_get_text('kg')})"
+            y_unit = "kg"
 
     # --- Plotting Logic ---
     num_curves = 1  # Default for a single curve
     if hue_vars:
+        # One curve per distinct combination of the hue variables
+        hue_keys = plot_data[hue_vars].drop_duplicates()
+        num_curves = len(hue_keys)
+
         # Set up hue column and legend title based on number of hue variables
         if len(hue_vars) == 1:
             hue_col = hue_vars[0]
         else:
-            # For multiple hue variables, create a string-based column for the hue
+            # For multiple hue variables, create a string-based column for the hue.
+            # Only the distinct combinations are joined; rows pick theirs by
+            # group number, which follows the same first-appearance order.
             hue_col = ", ".join(hue_vars)
-            plot_data[hue_col] = plot_data[hue_vars].apply(
-                lambda row: ", ".join(map(str, row)), axis=1
-            )
-
-        num_curves = len(plot_data[hue_col].unique())
+            hue_parts = [hue_keys[h].astype(str) for h in hue_vars]
+            key_labels = hue_parts[0].str.cat(hue_parts[1:], sep=", ")
+            codes = plot_data.groupby(hue_vars, sort=False).ngroup().to_numpy()
+            if key_labels.is_unique:
+                # A categorical lets seaborn take the levels from its categories
+                # for both the hue and the style mapping.
+                plot_data[hue_col] = pd.Categorical.from_codes(
+                    codes, categories=key_labels
+                )
+            else:
+                plot_data[hue_col] = key_labels.to_numpy()[codes]
 
         # Define distinct markers and line styles for better visual separation
         markers_cycle = ["o", "s", "X", "D", "^", "v", "P", "*"]
@@ -926,10 +1252,15 @@ def _create_subplot(
 
     # Add data point annotations only if the number of curves is manageable
     if num_curves <= 4:
-        for i, row in plot_data.iterrows():
+        # Label at most _MAX_ANNOTATIONS evenly spaced points
+        step = max(1, math.ceil(len(plot_data) / _MAX_ANNOTATIONS))
+        x_values = plot_data[x_var].to_numpy()[::step]
+        y_values = plot_data[y_var].to_numpy()[::step]
+        y_texts = _format_numbers_for_display(y_values)
+        for x_value, y_value, text in zip(x_values, y_values, y_texts):
             ax.annotate(
-                _format_number_for_display(row[y_var]),
-                (row[x_var], row[y_var]),
+                text,
+                (x_value, y_value),
                 textcoords="offset points",
                 xytext=(0, 10),
                 ha="center",
@@ -937,28 +1268,68 @@ def _create_subplot(
                 alpha=0.75,
             )
 
-    title = _get_text("dependence_of_on").format(
-        y_label=final_y_var_label, x_label=final_x_var_label
-    )
-
-    # Set title and labels
-    ax.set_title(title, fontsize=12, fontweight="bold", pad=20)
-    ax.set_xlabel(final_x_var_label, fontsize=12)
-    ax.set_ylabel(final_y_var_label, fontsize=12)
-
     # Set grid style and legend
     ax.grid(True, which="both", linestyle="--", linewidth=0.5)
     ax.set_axisbelow(True)
-    if hue_vars:
-        # Get the legend object and adjust its properties
-        legend = ax.get_legend()
+    legend = ax.get_legend() if hue_vars else None
+    original_title = None
+    if legend:
+        original_title = legend.get_title().get_text()
+        plt.setp(legend.get_texts(), fontsize=10)
+
+    # Label strings per language, built on first use
+    labels_by_lang = {}
+
+    def build_labels() -> tuple:
+        # Format labels for display
+        x_var_label = _format_label(x_var, glossary_maps)
+        y_var_display = _format_label(y_var, glossary_maps)
+        final_x_var_label = x_var_label
+        final_y_var_label = y_var_display
+        if x_unit:
+            final_x_var_label = f"{x_var_label} ({_get_text(x_unit)})"
+        if y_unit:
+            final_y_var_label = f"{y_var_display} ({_get_text(y_unit)})"
+
+        title = _get_text("dependence_of_on").format(
+            y_label=final_y_var_label, x_label=final_x_var_label
+        )
+        legend_title = _format_label(original_title, glossary_maps) if legend else None
+        return title, final_x_var_label, final_y_var_label, legend_title
+
+    def apply_labels() -> None:
+        lang = "cn" if _use_chinese_labels else "en"
+        labels = labels_by_lang.get(lang)
+        if labels is None:
+            labels = labels_by_lang[lang] = build_labels()
+        title, final_x_var_label, final_y_var_label, legend_title = labels
+
+        # Set title and labels
+        ax.set_title(title, fontsize=12, fontweight="bold", pad=20)
+        ax.set_xlabel(final_x_var_label, fontsize=12)
+        ax.set_ylabel(final_y_var_label, fontsize=12)
         if legend:
-            original_title = legend.get_title().get_text()
-            legend.set_title(
-                _format_label(original_title, glossary_maps),
-                prop={"size": 10, "weight": "bold"},
-            )
-            plt.setp(legend.get_texts(), fontsize=10)
+            legend.set_title(legend_title, prop={"size": 10, "weight": "bold"})
+
+    return apply_labels
+
+
+def _parse_column_params(column: str) -> dict:
+    """Parses the "&name=value" parameters of a sweep result column name.
+
+    Args:
+        column: Column name such as "sds.I&blanket.TBR=1.1&plasma.fb=0.05".
+
+    Returns:
+        The parameter values by name, as strings. Empty if the column has no
+        parameters; parts without "=" are ignored.
+    """
+    params = {}
+    for part in column.split("&")[1:]:
+        name, sep, value = part.partition("=")
+        if sep:
+            params.setdefault(name, value)
+    return params
 
 
 def plot_sweep_time_series(
@@ -969,6 +1340,7 @@ def plot_sweep_time_series(
     independent_var_alias: str = None,
     default_params: Dict[str, Any] = None,
     glossary_path: str = None,
+    languages: Tuple[str, ...] = ("en", "cn"),
 ) -> List[str]:
     """Generates a single figure with two subplots: an overall time-series view and a zoomed-in view.
 
@@ -984,12 +1356,15 @@ def plot_sweep_time_series(
         default_params: A dictionary of default parameters. If provided, only curves
             matching these parameters will be plotted.
         glossary_path: Path to the glossary file for professional labels.
+        languages: Languages to save the figure in, 'en' and/or 'cn'. Defaults
+            to both; pass a single language to skip the other copy.
 
     Returns:
         A list of paths to the saved plot images, or an empty list on failure.
 
     Note:
-        Converts time from hours to days. Generates bilingual plots (English and Chinese).
+        Converts time from hours to days. Generates bilingual plots (English and Chinese)
+        by default, with a _zh suffix for the Chinese copy.
         Overall view masks data exceeding 2x initial value. Zoomed view shows region from
         t=0 to 2 days past minimum, with red rectangle indicator on overall view. Data is
         converted from grams to kilograms for display.
@@ -1038,14 +1413,15 @@ def plot_sweep_time_series(
         for _, job_params, job_df in iter_hdf5_job_results(
             csv_path, jobs_df=jobs_df, columns=y_var_columns
         ):
-            time_days = job_df["time"] / 24
-            for variable_name in y_var_columns:
-                if variable_name not in job_df.columns:
-                    continue
+            if job_df.empty:
+                continue
+            time_days = job_df["time"].to_numpy(dtype=np.float64) / 24
 
-                y_data = job_df[variable_name] / 1000.0
-                if y_data.empty:
-                    continue
+            # Convert all of the job's curves to kilograms in one division
+            job_columns = [col for col in y_var_columns if col in job_df.columns]
+            job_values = job_df[job_columns].to_numpy(dtype=np.float64) / 1000.0
+            for i, variable_name in enumerate(job_columns):
+                y_data = job_values[:, i]
 
                 independent_value = job_params.get(independent_var_name)
                 if independent_value is None:
@@ -1055,21 +1431,23 @@ def plot_sweep_time_series(
                 else:
                     plot_label = f"{variable_name}={independent_value}"
 
-                threshold = 2 * y_data.iloc[0]
+                threshold = 2 * y_data[0]
                 plot_entries.append(
                     {
                         "label": plot_label,
                         "time_days": time_days,
                         "y_data": y_data,
-                        "y_masked": y_data.where(y_data <= threshold),
+                        "y_masked": np.where(y_data <= threshold, y_data, np.nan),
                     }
                 )
 
-                min_idx = y_data.idxmin()
-                current_min_y = y_data.loc[min_idx]
+                if np.isnan(y_data).all():
+                    continue
+                min_pos = np.nanargmin(y_data)
+                current_min_y = y_data[min_pos]
                 if current_min_y < min_y_global:
                     min_y_global = current_min_y
-                    min_x_global = time_days.loc[min_idx]
+                    min_x_global = time_days[min_pos]
 
         if not plot_entries:
             return []
@@ -1079,24 +1457,9 @@ def plot_sweep_time_series(
         )
 
         sns.set_theme(style="whitegrid")
-        plot_paths = []
-        original_lang_is_chinese = _use_chinese_labels
-
-        for lang in ["en", "cn"]:
-            set_plot_language(lang)
-            colors = sns.color_palette("plasma", len(plot_entries))
-            fig, (ax1, ax2) = plt.subplots(
-                2,
-                1,
-                figsize=(12, 16),
-                sharex=False,
-                gridspec_kw={"height_ratios": [2, 1]},
-            )
-            y_var_names_formatted = [
-                _format_label(y, glossary_maps) for y in y_var_names
-            ]
-            y_label = f"{', '.join(y_var_names_formatted)} ({_get_text('kg')})"
-
+        colors = np.asarray(sns.color_palette("plasma", len(plot_entries)))
+        fig, (ax1, ax2) = _sweep_axes()
+        try:
             for i, entry in enumerate(plot_entries):
                 ax1.plot(
                     entry["time_days"],
@@ -1107,14 +1470,11 @@ def plot_sweep_time_series(
                     alpha=0.85,
                 )
 
-            ax1.set_ylabel(y_label, fontsize=12)
-            ax1.set_title(_get_text("overall_view"), fontsize=12)
-            ax1.legend(
-                loc="best", title=_format_label(independent_var_name, glossary_maps)
-            )
+            legend = ax1.legend(loc="best")
             ax1.grid(True)
 
-            if min_y_global != float("inf") and np.isfinite(min_y_global):
+            show_zoom = min_y_global != float("inf") and np.isfinite(min_y_global)
+            if show_zoom:
                 x1 = 0
                 x2 = min_x_global + 2
                 y_min_in_range = float("inf")
@@ -1130,12 +1490,13 @@ def plot_sweep_time_series(
                         alpha=0.9,
                     )
 
-                    zoom_mask = (entry["time_days"] >= x1) & (entry["time_days"] <= x2)
-                    if zoom_mask.any():
-                        zoom_values = entry["y_data"].loc[zoom_mask]
-                        if not zoom_values.empty:
-                            y_min_in_range = min(y_min_in_range, zoom_values.min())
-                            y_max_in_range = max(y_max_in_range, zoom_values.max())
+                    # Simulation time is non-decreasing, so the window is a slice
+                    zoom_values = entry["y_data"][
+                        _time_window(entry["time_days"], x1, x2)
+                    ]
+                    if zoom_values.size and not np.isnan(zoom_values).all():
+                        y_min_in_range = min(y_min_in_range, np.nanmin(zoom_values))
+                        y_max_in_range = max(y_max_in_range, np.nanmax(zoom_values))
 
                 y_padding = (y_max_in_range - y_min_in_range) * 0.05
                 y1 = y_min_in_range - y_padding
@@ -1143,9 +1504,6 @@ def plot_sweep_time_series(
 
                 ax2.set_xlim(x1, x2)
                 ax2.set_ylim(y1, y2)
-                ax2.set_xlabel(_get_text("time_days"), fontsize=12)
-                ax2.set_ylabel(y_label, fontsize=12)
-                ax2.set_title(_get_text("detailed_view"), fontsize=12)
                 ax2.grid(True, linestyle="--")
 
                 rect = patches.Rectangle(
@@ -1162,53 +1520,32 @@ def plot_sweep_time_series(
             else:
                 ax2.set_visible(False)
 
-            ax1.set_xlabel(_get_text("time_days"), fontsize=12)
-            fig.tight_layout(rect=[0, 0.03, 1, 0.95])
-
-            safe_y_vars = "_".join(
-                [
-                    var.replace(".", "_").replace("[", "").replace("]", "")
-                    for var in y_var_names
-                ]
-            )
-            safe_param = (
-                raw_plot_alias.replace(".", "_").replace("[", "").replace("]", "")
-            )
-            suffix = "_zh" if lang == "cn" else ""
-            svg_path = os.path.join(
-                save_dir, f"sweep_{safe_y_vars}_vs_{safe_param}{suffix}.svg"
+            return _save_sweep_figure(
+                fig,
+                (ax1, ax2, legend),
+                show_zoom,
+                save_dir,
+                y_var_names,
+                independent_var_name,
+                raw_plot_alias,
+                glossary_maps,
+                languages,
             )
-
-            try:
-                plt.rcParams["svg.fonttype"] = "path"
-                plt.savefig(svg_path, format="svg", bbox_inches="tight")
-                print(f"Successfully generated combined sweep plot: {svg_path}")
-                plot_paths.append(svg_path)
-            except Exception as e:
-                print(f"Error saving plot: {e}")
-            finally:
-                plt.close(fig)
-
-        set_plot_language("cn" if original_lang_is_chinese else "en")
-        return plot_paths
+        finally:
+            plt.close(fig)
 
     try:
-        df = pd.read_csv(csv_path)
+        # Read the header first so only the plotted columns are parsed below
+        header = pd.read_csv(csv_path, nrows=0).columns
 
     except FileNotFoundError:
         print(f"Error: Could not find results file at {csv_path}")
         return []
 
-    if df is None or len(df) == 0:
-        return []
-
-    if "time" not in df.columns:
+    if "time" not in header:
         print(f"Error: 'time' column not found in {csv_path}")
         return []
 
-    # Convert time from hours to days
-    time_days = df["time"] / 24
-
     # Use alias if provided, otherwise format the original name
     raw_plot_alias = (
         independent_var_alias if independent_var_alias else independent_var_name
@@ -1221,31 +1558,21 @@ def plot_sweep_time_series(
 
     y_var_columns = []
     for y_var in y_var_names:
-        y_var_columns.extend(
-            [col for col in df.columns if col != "time" and y_var in col]
-        )
+        y_var_columns.extend([col for col in header if col != "time" and y_var in col])
     y_var_columns = list(dict.fromkeys(y_var_columns))
 
-    # If default_params are provided, filter columns to only plot baseline curves
-    if default_params:
-        filtered_columns = []
-        for col in y_var_columns:
-            try:
-                param_str = col.split("&", 1)[1]
-                col_params = dict(p.split("=", 1) for p in param_str.split("&"))
-
-                # Check if all default_params match the parameters in the column name
-                is_match = all(
-                    col_params.get(key) == str(val)
-                    for key, val in default_params.items()
-                )
+    # Parameters encoded in each column name, parsed once
+    col_meta = {col: _parse_column_params(col) for col in y_var_columns}
 
-                if is_match:
-                    filtered_columns.append(col)
-            except IndexError:
-                # This column does not have parameters in its name, so it can't be a match
-                continue
-        y_var_columns = filtered_columns
+    # If default_params are provided, filter columns to only plot baseline curves.
+    # Columns without parameters in their name can't be a match.
+    if default_params:
+        expected = {key: str(val) for key, val in default_params.items()}
+        y_var_columns = [
+            col
+            for col in y_var_columns
+            if all(col_meta[col].get(key) == val for key, val in expected.items())
+        ]
 
     if not y_var_columns:
         print(
@@ -1253,60 +1580,44 @@ def plot_sweep_time_series(
         )
         return []
 
-    # Convert y-axis data from grams to kilograms
-    for col in y_var_columns:
-        df[col] = df[col] / 1000.0
+    # The curves are only displayed, so float32 is precise enough for them
+    df = pd.read_csv(
+        csv_path,
+        usecols=["time"] + y_var_columns,
+        dtype={col: np.float32 for col in y_var_columns},
+    )
+    if len(df) == 0:
+        return []
 
-    # Generate clean labels (values only) for the legend
-    plot_labels = []
-    for col in y_var_columns:
-        label = col
-        try:
-            param_parts = col.split("&")[1:]
-            for part in param_parts:
-                if part.startswith(independent_var_name + "="):
-                    label = part.split("=", 1)[1]  # Extract just the value
-                    break
-        except IndexError:
-            pass  # No parameters in name, use full column name
-        plot_labels.append(label)
+    # Time in days and y-axis data in kilograms, one column per curve
+    time_days = df["time"].to_numpy(dtype=np.float64) / 24
+    y_values = df[y_var_columns].to_numpy() / np.float32(1000.0)
+
+    # Generate clean labels (values only) for the legend; columns without the
+    # scan parameter in their name use the full column name
+    plot_labels = [
+        col_meta[col].get(independent_var_name, col) for col in y_var_columns
+    ]
 
     print(
         f"Found {len(y_var_columns)} columns to plot containing {y_var_names}: {y_var_columns}"
     )
 
     sns.set_theme(style="whitegrid")
-    plot_paths = []
-    original_lang_is_chinese = _use_chinese_labels
-
-    for lang in ["en", "cn"]:
-        set_plot_language(lang)
-
-        colors = sns.color_palette("plasma", len(y_var_columns))
-
-        # Create a figure with two subplots (overall and zoom)
-        fig, (ax1, ax2) = plt.subplots(
-            2, 1, figsize=(12, 16), sharex=False, gridspec_kw={"height_ratios": [2, 1]}
-        )
-        y_var_names_formatted = [_format_label(y, glossary_maps) for y in y_var_names]
-
-        min_y_global = float("inf")
-        min_x_global = float("inf")
 
-        # Define the y-axis label with units
-        y_label = f"{', '.join(y_var_names_formatted)} ({_get_text('kg')})"
+    colors = np.asarray(sns.color_palette("plasma", len(y_var_columns)))
 
+    # Create a figure with two subplots (overall and zoom). The curves are drawn
+    # once; only the text is changed per language in _save_sweep_figure.
+    fig, (ax1, ax2) = _sweep_axes()
+    try:
         # --- Subplot 1: Overall View ---
-        for i, column in enumerate(y_var_columns):
-            y_data = df[column]
+        for i in range(len(y_var_columns)):
+            y_data = y_values[:, i]
 
             # For the global view, mask data that is more than 2x the initial value
-            if not y_data.empty:
-                initial_value = y_data.iloc[0]
-                threshold = 2 * initial_value
-                y_masked = y_data.where(y_data <= threshold)
-            else:
-                y_masked = y_data
+            threshold = 2 * y_data[0]
+            y_masked = np.where(y_data <= threshold, y_data, np.nan)
 
             ax1.plot(
                 time_days,
@@ -1317,26 +1628,20 @@ def plot_sweep_time_series(
                 alpha=0.85,
             )
 
-            # Calculations for zoom window should use the original, unmasked data
-            if not y_data.empty:
-                min_idx = y_data.idxmin()
-                current_min_y = y_data.loc[min_idx]
-                if current_min_y < min_y_global:
-                    min_y_global = current_min_y
-                    min_x_global = time_days.loc[min_idx]
+        # Calculations for zoom window should use the original, unmasked data
+        min_x_global, min_y_global = _sweep_minimum(time_days, y_values)
 
-        ax1.set_ylabel(y_label, fontsize=12)
-        ax1.set_title(_get_text("overall_view"), fontsize=12)
-        ax1.legend(loc="best", title=_format_label(independent_var_name, glossary_maps))
+        legend = ax1.legend(loc="best")
         ax1.grid(True)
 
         # --- Subplot 2: Zoomed-in View (uses original data) ---
-        if min_y_global != float("inf") and np.isfinite(min_y_global):
-            for i, column in enumerate(y_var_columns):
+        show_zoom = min_y_global != float("inf") and np.isfinite(min_y_global)
+        if show_zoom:
+            for i in range(len(y_var_columns)):
                 # Plot original, unmasked data in the zoom plot
                 ax2.plot(
                     time_days,
-                    df[column],
+                    y_values[:, i],
                     label=plot_labels[i],
                     color=colors[i],
                     linewidth=1.8,
@@ -1347,13 +1652,12 @@ def plot_sweep_time_series(
             x1 = 0
             x2 = min_x_global + 2  # Show 2 days past the minimum
 
-            # Filter the DataFrame to the new x-range to find the y-range
-            zoom_mask = (time_days >= x1) & (time_days <= x2)
-            df_zoom_range = df[zoom_mask]
+            # Restrict the rows to the new x-range to find the y-range
+            zoom_values = y_values[_time_window(time_days, x1, x2)]
 
             # Find y-min and y-max within this specific range
-            y_min_in_range = df_zoom_range[y_var_columns].min().min()
-            y_max_in_range = df_zoom_range[y_var_columns].max().max()
+            y_min_in_range = np.nanmin(zoom_values)
+            y_max_in_range = np.nanmax(zoom_values)
 
             # Add padding to the y-axis
             y_padding = (y_max_in_range - y_min_in_range) * 0.05
@@ -1362,10 +1666,6 @@ def plot_sweep_time_series(
 
             ax2.set_xlim(x1, x2)
             ax2.set_ylim(y1, y2)
-
-            ax2.set_xlabel(_get_text("time_days"), fontsize=12)
-            ax2.set_ylabel(y_label, fontsize=12)
-            ax2.set_title(_get_text("detailed_view"), fontsize=12)
             ax2.grid(True, linestyle="--")
 
             # Add a rectangle to the main plot to indicate the new zoom area
@@ -1384,32 +1684,123 @@ def plot_sweep_time_series(
             # If no zoom, hide the second subplot
             ax2.set_visible(False)
 
-        ax1.set_xlabel(_get_text("time_days"), fontsize=12)
-        fig.tight_layout(rect=[0, 0.03, 1, 0.95])  # Adjust for suptitle
+        return _save_sweep_figure(
+            fig,
+            (ax1, ax2, legend),
+            show_zoom,
+            save_dir,
+            y_var_names,
+            independent_var_name,
+            raw_plot_alias,
+            glossary_maps,
+            languages,
+        )
+    finally:
+        plt.close(fig)
+
+
+def _sweep_axes() -> tuple:
+    """Creates a sweep figure with its overall and zoom axes.
+
+    The caller owns the figure and must close it once it has been saved.
+    """
+    return plt.subplots(
+        2, 1, figsize=(12, 16), sharex=False, gridspec_kw={"height_ratios": [2, 1]}
+    )
+
+
+def _time_window(time_days: np.ndarray, start: float, end: float) -> slice:
+    """Returns the rows of a non-decreasing time axis within [start, end]."""
+    lo = np.searchsorted(time_days, start, side="left")
+    hi = np.searchsorted(time_days, end, side="right")
+    return slice(lo, hi)
+
+
+def _sweep_minimum(time_days: np.ndarray, y_values: np.ndarray) -> tuple:
+    """Finds the smallest value over all sweep curves and when it occurs.
+
+    Args:
+        time_days: Time axis shared by the curves.
+        y_values: Curve data, one column per curve.
+
+    Returns:
+        (time, value) of the minimum, ignoring NaNs. Ties go to the first
+        curve, then the earliest time. Both are inf if every value is NaN.
+    """
+    filled = np.where(np.isnan(y_values), np.inf, y_values)
+    min_rows = filled.argmin(axis=0)
+    column_mins = filled[min_rows, np.arange(filled.shape[1])]
+    best = column_mins.argmin()
+    if column_mins[best] == np.inf:
+        return float("inf"), float("inf")
+    return time_days[min_rows[best]], column_mins[best]
+
+
+def _save_sweep_figure(
+    fig,
+    artists: tuple,
+    show_zoom: bool,
+    save_dir: str,
+    y_var_names: List[str],
+    independent_var_name: str,
+    raw_plot_alias: str,
+    glossary_maps: tuple[dict, dict],
+    languages: Tuple[str, ...] = ("en", "cn"),
+) -> List[str]:
+    """Labels a drawn sweep time-series figure per language and saves it.
 
-        # --- Save Figure ---
-        safe_y_vars = "_".join(
-            [
-                var.replace(".", "_").replace("[", "").replace("]", "")
-                for var in y_var_names
+    Args:
+        fig: The figure drawn by plot_sweep_time_series.
+        artists: The (overall axes, zoom axes, overall legend) of the figure.
+        show_zoom: Whether the zoom axes are shown and need labels.
+        save_dir: Directory to save the image.
+        y_var_names: Names of the Y-axis variables.
+        independent_var_name: Full name of the scan parameter.
+        raw_plot_alias: Name of the scan parameter used in the file name.
+        glossary_maps: Tuple of glossary maps for professional labels.
+        languages: Languages to save the figure in, 'en' and/or 'cn'.
+
+    Returns:
+        Paths of the saved SVG files.
+    """
+    ax1, ax2, legend = artists
+
+    safe_y_vars = "_".join(
+        [var.replace(".", "_").replace("[", "").replace("]", "") for var in y_var_names]
+    )
+    safe_param = raw_plot_alias.replace(".", "_").replace("[", "").replace("]", "")
+
+    plot_paths = []
+    for lang in languages:
+        with _plot_language(lang):
+            y_var_names_formatted = [
+                _format_label(y, glossary_maps) for y in y_var_names
             ]
-        )
-        safe_param = raw_plot_alias.replace(".", "_").replace("[", "").replace("]", "")
-        suffix = "_zh" if lang == "cn" else ""
-        svg_path = os.path.join(
-            save_dir, f"sweep_{safe_y_vars}_vs_{safe_param}{suffix}.svg"
-        )
+            # Define the y-axis label with units
+            y_label = f"{', '.join(y_var_names_formatted)} ({_get_text('kg')})"
 
-        try:
-            # Force text to be rendered as paths in SVG.
-            plt.rcParams["svg.fonttype"] = "path"
-            plt.savefig(svg_path, format="svg", bbox_inches="tight")
-            print(f"Successfully generated combined sweep plot: {svg_path}")
-            plot_paths.append(svg_path)
-        except Exception as e:
-            print(f"Error saving plot: {e}")
-        finally:
-            plt.close(fig)
+            ax1.set_ylabel(y_label, fontsize=12)
+            ax1.set_title(_get_text("overall_view"), fontsize=12)
+            ax1.set_xlabel(_get_text("time_days"), fontsize=12)
+            legend.set_title(_format_label(independent_var_name, glossary_maps))
+            if show_zoom:
+                ax2.set_xlabel(_get_text("time_days"), fontsize=12)
+                ax2.set_ylabel(y_label, fontsize=12)
+                ax2.set_title(_get_text("detailed_view"), fontsize=12)
+
+            fig.tight_layout(rect=[0, 0.03, 1, 0.95])  # Adjust for suptitle
+
+            # --- Save Figure ---
+            suffix = "_zh" if lang == "cn" else ""
+            svg_path = os.path.join(
+                save_dir, f"sweep_{safe_y_vars}_vs_{safe_param}{suffix}.svg"
+            )
+
+            try:
+                _save_svg(fig, svg_path)
+                print(f"Successfully generated combined sweep plot: {svg_path}")
+                plot_paths.append(svg_path)
+            except Exception as e:
+                print(f"Error saving plot: {e}")
 
-    set_plot_language("cn" if original_lang_is_chinese else "en")
     return plot_paths
@@ -1,11 +1,17 @@
+import hashlib
 import json
 import logging
 import os
+import random
 import re
 import shutil
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import openai
 import pandas as pd
 
@@ -14,6 +20,463 @@ from tricys.utils.config_utils import get_llm_env
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on (case, model) LLM analyses running at the same time.
+_MAX_CONCURRENT_LLM_CASES = 8
+
+# Upper bound on generated tokens per LLM request; requests ask for less when
+# their prompt calls for fewer sections and are retried with the full budget
+# if the response is cut off.
+_MAX_COMPLETION_TOKENS = 4000
+
+# Seconds between status checks of a submitted Batch API job.
+_BATCH_POLL_INTERVAL = 60
+
+# Hours to wait for a Batch API job before cancelling it and using the regular
+# API, unless sensitivity_analysis.batch_api_max_wait_hours says otherwise.
+_DEFAULT_BATCH_MAX_WAIT_HOURS = 1.0
+
+# Characters other than (Unicode) alphanumerics, "_" and "-", dropped from
+# model names used in file names. \w is exactly str.isalnum() plus "_".
+_MODEL_NAME_STRIP_RE = re.compile(r"[^\w-]+")
+
+# The report's generation timestamp, left out of LLM cache keys so that a
+# rebuilt but otherwise unchanged report still hits the cache.
+_REPORT_TIMESTAMP_RE = re.compile(r"^生成时间: .*$", re.MULTILINE)
+
+# Dots that are not decimal points, replaced by spaces in display labels.
+_LABEL_DOT_RE = re.compile(r"(?<!\d)\.|\.(?!\d)")
+
+# Static parts of the per-case analysis prompt (call_openai_analysis_api).
+_ANALYSIS_ROLE_PROMPT = """**角色：** 你是一名聚变反应堆氚燃料循环领域的专家。
+
+**任务：** 请**完全基于**下方提供的**两类数据表格**，对聚变堆燃料循环模型的**敏感性分析**结果进行深度解读。
+"""
+
+_GLOBAL_SENSITIVITY_TMPL = (
+    "1.  **全局敏感性分析 (参考“性能指标总表”) :**\n"
+    "    *   分析性能指标总表（ `Startup_Inventory`, `Doubling_Time` 以及以 `Required_` 开头的求解指标等）呈现出怎样的**总体趋势**？请进行量化描述。\n"
+    "    *   如果存在多个性能指标，分析哪个性能指标对独立变量 `{independent_variable}` 的变化最为敏感？哪个最不敏感？\n"
+)
+
+_INTERACTION_TMPL = (
+    "2.  **交互效应分析：** 本次分析包含了多变量的交互效应。请分析独立变量 `{independent_variable}` "
+    "与背景扫描参数 ({param_names}) 之间的交互作用对各项性能指标的影响。"
+    "请注意，独立变量或背景扫描参数中，可能包含常规的模型参数，也可能包含为满足特定性能目标（限制倍增时间Double_Time达到倍增）而求解出的特殊变量（约束限制变量Double_Time）。"
+    "请讨论在不同的变量组合下，性能指标的敏感性有何不同？是否存在显著的交互效应？"
+)
+
+_DYNAMIC_TMPL = (
+    "3.  **动态过程分析 (参考“关键动态数据切片：过程数据”) :**\n"
+    "    *   观察过程数据切片：系统在“初始阶段”和“结束阶段”的行为有何不同？\n"
+    "    *   以 `{reference_col}` 为参考，其“转折点阶段”的数据揭示了什么物理过程？（例如，它是否是氚库存由消耗转为净增长的关键时刻？）"
+)
+
+_CONCLUSION_TMPL = (
+    "3.  **综合结论：**\n"
+    "结合所有分析（包括主趋势{interaction_clause}），"
+    "总结在不同的运行场景下，调整 `{independent_variable}` 对整个氚燃料循环系统的综合影响和潜在的利弊权衡。\n"
+    "    *   基于这些发现，可以得出哪些关于系统设计或运行优化的初步建议？"
+)
+
+# Descriptions of the optimization settings listed for `Required_` metrics.
+_OPTIMIZATION_CONFIG_ROWS = {
+    "source_column": "限制条件的数据源列。",
+    "parameter_to_optimize": "优化的目标参数。",
+    "search_range": "参数的搜索范围。",
+    "tolerance": "搜索的收敛精度。",
+    "max_iterations": "最大迭代次数。",
+    "metric_name": "限制条件的性能指标。",
+    "metric_max_value": "限制条件满足的上限值。（hour）",
+}
+
+# Instructions of the academic summary prompt, filled by
+# _build_academic_instructions().
+_ACADEMIC_INSTRUCTIONS_TMPL = """**指令：**
+
+1.  **专业化语言：** 将初步报告中的模型参数/缩写（例如 `sds.I[1]`, `Startup_Inventory`）替换为术语表中对应的“中文翻译”或“英文术语”。例如，应将“`sds`的库存”表述为“储存与输送系统 (SDS) 的氚库存量 (Tritium Inventory)”。
+2.  **学术化重述：** 用严谨、客观的学术语言重新组织和阐述初步报告中的发现。避免使用“看起来”、“好像”等模糊词汇。
+3.  **图表和表格的呈现与引用：**
+    *   **显示图表：** 在报告的“结果与讨论”部分，您**必须**使用Markdown语法 `![图表标题](图表文件名)` 来**直接嵌入**和显示初步报告中包含的所有图表。可用的图表文件如下：
+{plot_list_str}
+    *   **引用图表：** 在正文中分析和讨论图表内容时，请使用“如图1所示...”等方式对图表进行编号和文字引用。
+    *   **显示表格：** 当呈现数据时（例如，性能指标总表或关键动态数据切片），您**必须**使用Markdown的管道表格（pipe-table）格式来清晰地展示它们。您可以直接复用或重新格式化初步报告中的数据表格。
+4.  **结构化报告：** 您的报告是关于一项**敏感性分析**。报告应包含以下部分：
+    *   **标题 (Title):** {title_instruction_text}
+    *   **摘要 (Abstract):** 简要概括本次敏感性研究的目的，明确指明独立变量是 **`{independent_variable}`** 以及背景扫描参数，总结其对哪些关键性能指标（如启动库存、增殖时间等）影响最显著，并陈述核心结论。
+    *   **引言 (Introduction):** 描述进行这项关于 **`{independent_variable}`** 的敏感性分析的背景和重要性。阐述研究目标，即量化评估 **`{independent_variable}`** 的变化对氚燃料循环系统性能的影响。
+        *   **独立变量采样 (Independent Variable Sampling):** 本次分析中，独立变量 `{independent_variable}` 扫描范围为 `{sampling_range}`。
+{simulation_params_str}{dependent_vars_str}
+    *   **方法 (Methodology):** 简要说明分析方法，包括提及 **`{independent_variable}`** 的扫描范围和被评估的关键性能指标。
+    *   **结果与讨论 (Results and Discussion):** 这是报告的核心。请结合所有图表和数据表格，并根据分析内容，组织分点详细论述：
+{results_and_discussion_str}
+    *   **结论 (Conclusion):** 总结本次敏感性分析得出的主要学术结论，并对反应堆设计或未来运行策略提出具体建议。
+5.  **输出格式：** 请直接输出完整的学术分析报告正文，确保所有内容（包括图表和表格）都遵循正确的Markdown语法。
+
+**输入文件：**
+"""
+
+# Role prompt of the academic summary (generate_sensitivity_academic_report).
+_ACADEMIC_ROLE_PROMPT = """**角色：** 您是一位在核聚变工程，特别是氚燃料循环领域，具有深厚学术背景的资深科学家。
+
+**任务：** 您收到了一个关于**敏感性分析**的程序自动生成的初步报告和一份专业术语表。请您基于这两份文件，撰写一份更加专业、正式、符合学术发表标准的深度分析总结报告。
+"""
+
+
+class _RateLimiter:
+    """Spaces out LLM requests to stay within per-minute request and token budgets.
+
+    Both budgets refill continuously (token buckets). acquire() blocks until the
+    request fits, so concurrent cases queue locally instead of being rejected
+    by the provider with HTTP 429.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.request_capacity = float(requests_per_minute)
+        self.token_capacity = float(tokens_per_minute)
+        self.available_requests = self.request_capacity
+        self.available_tokens = self.token_capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def configure(self, requests_per_minute: float, tokens_per_minute: float) -> None:
+        """Changes both budgets, keeping what is left of them within the new ones."""
+        with self.lock:
+            self.request_capacity = float(requests_per_minute)
+            self.token_capacity = float(tokens_per_minute)
+            self.available_requests = min(
+                self.available_requests, self.request_capacity
+            )
+            self.available_tokens = min(self.available_tokens, self.token_capacity)
+
+    def acquire(self, tokens: int) -> None:
+        """Blocks until one request using about `tokens` tokens may be sent."""
+        tokens = min(float(tokens), self.token_capacity)
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                minutes = (now - self.updated) / 60.0
+                self.updated = now
+                self.available_requests = min(
+                    self.request_capacity,
+                    self.available_requests + minutes * self.request_capacity,
+                )
+                self.available_tokens = min(
+                    self.token_capacity,
+                    self.available_tokens + minutes * self.token_capacity,
+                )
+                if self.available_requests >= 1 and self.available_tokens >= tokens:
+                    self.available_requests -= 1
+                    self.available_tokens -= tokens
+                    return
+                wait_minutes = max(
+                    (1 - self.available_requests) / self.request_capacity,
+                    (tokens - self.available_tokens) / self.token_capacity,
+                )
+            time.sleep(wait_minutes * 60.0)
+
+
+# Provider limits used unless AI_REQUESTS_PER_MINUTE / AI_TOKENS_PER_MINUTE are
+# set in the environment or the config's llm_env.
+_DEFAULT_REQUESTS_PER_MINUTE = 60
+_DEFAULT_TOKENS_PER_MINUTE = 150_000
+
+# Shared by all LLM requests of this process.
+_llm_rate_limiter = _RateLimiter(
+    requests_per_minute=_DEFAULT_REQUESTS_PER_MINUTE,
+    tokens_per_minute=_DEFAULT_TOKENS_PER_MINUTE,
+)
+
+
+def _configure_llm_rate_limiter(env: Dict[str, Any]) -> None:
+    """Applies the per-minute limits from get_llm_env() to the shared rate limiter."""
+    limits = []
+    for key, default in (
+        ("AI_REQUESTS_PER_MINUTE", _DEFAULT_REQUESTS_PER_MINUTE),
+        ("AI_TOKENS_PER_MINUTE", _DEFAULT_TOKENS_PER_MINUTE),
+    ):
+        value = env.get(key)
+        try:
+            limit = float(value) if value else default
+        except (TypeError, ValueError):
+            limit = 0
+        if limit <= 0:
+            logger.warning(f"Invalid {key} value '{value}', using {default}.")
+            limit = default
+        limits.append(limit)
+    _llm_rate_limiter.configure(*limits)
+
+
+def _estimate_tokens(text: str) -> int:
+    """Roughly estimates the token count of a prompt.
+
+    ASCII text averages about 4 characters per token, while CJK characters
+    usually take at least one token each.
+    """
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return ascii_chars // 4 + (len(text) - ascii_chars)
+
+
+def _create_chat_completion(
+    client: openai.OpenAI,
+    ai_model: str,
+    prompt: str,
+    max_tokens: int = _MAX_COMPLETION_TOKENS,
+    sink: Optional[Any] = None,
+    cache_dir: Optional[str] = None,
+) -> str:
+    """Streams a single-message chat completion once the rate limiter allows it.
+
+    Args:
+        client: OpenAI client to send the request with.
+        ai_model: Model name.
+        prompt: User message content.
+        max_tokens: Upper bound on generated tokens. A response cut off by a
+            smaller budget is requested again with _MAX_COMPLETION_TOKENS.
+        sink: Optional writable, seekable text stream that receives the output
+            as it arrives. It is emptied before a cut-off response is retried.
+        cache_dir: Optional directory holding a `.llm_cache` of earlier responses,
+            keyed by a hash of the model and prompt. A hit skips the request.
+
+    Returns:
+        The complete generated text. Only non-empty responses that finished
+        normally (finish_reason "stop") are stored in the cache.
+    """
+    cache_path = _llm_cache_path(cache_dir, ai_model, prompt) if cache_dir else None
+    if cache_path:
+        if os.path.exists(cache_path):
+            with open(cache_path, "r", encoding="utf-8") as f:
+                text = f.read()
+            if text.strip():
+                logger.info(f"Reusing cached LLM response {cache_path}.")
+                if sink is not None:
+                    sink.write(text)
+                return text
+
+    while True:
+        _llm_rate_limiter.acquire(_estimate_tokens(prompt) + max_tokens)
+        stream = client.chat.completions.create(
+            model=ai_model,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            stream=True,
+        )
+        parts = []
+        finish_reason = None
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            delta = choice.delta.content
+            if delta:
+                parts.append(delta)
+                if sink is not None:
+                    sink.write(delta)
+            if choice.finish_reason:
+                finish_reason = choice.finish_reason
+        text = "".join(parts)
+
+        if finish_reason != "length" or max_tokens >= _MAX_COMPLETION_TOKENS:
+            break
+        logger.warning(
+            f"LLM response was cut off at {max_tokens} tokens, retrying with {_MAX_COMPLETION_TOKENS}."
+        )
+        max_tokens = _MAX_COMPLETION_TOKENS
+        if sink is not None:
+            sink.seek(0)
+            sink.truncate()
+
+    if cache_path:
+        if text.strip() and finish_reason == "stop":
+            _write_llm_cache(cache_path, text)
+        else:
+            logger.warning(
+                f"Not caching incomplete LLM response (finish_reason={finish_reason})."
+            )
+    return text
+
+
+def _llm_cache_path(cache_dir: str, ai_model: str, prompt: str) -> str:
+    """Returns the response cache file for a model and prompt under cache_dir.
+
+    Generation timestamps of embedded reports do not take part in the key.
+    """
+    prompt = _REPORT_TIMESTAMP_RE.sub("", prompt)
+    key = hashlib.blake2b(
+        (ai_model + "\0" + prompt).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return os.path.join(cache_dir, ".llm_cache", f"{key}.md")
+
+
+def _write_llm_cache(cache_path: str, text: str) -> None:
+    """Atomically stores a response in the LLM response cache."""
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    with open(cache_path + ".part", "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(cache_path + ".part", cache_path)
+
+
+def _run_batch_chat_completions(
+    client: openai.OpenAI,
+    requests: List[Dict[str, Any]],
+    max_wait_hours: float = _DEFAULT_BATCH_MAX_WAIT_HOURS,
+) -> Dict[str, str]:
+    """Runs chat completions through the OpenAI Batch API and waits for them.
+
+    Args:
+        client: OpenAI client to submit the batch with.
+        requests: Dicts with "ai_model", "prompt" and "max_tokens" keys.
+        max_wait_hours: How long to wait for the batch before cancelling it.
+
+    Returns:
+        Dict mapping the request index (as a string) to the generated text.
+        Requests that failed inside the batch, or whose output is empty or was
+        cut off, are missing from the result.
+
+    Raises:
+        RuntimeError: If the batch does not complete within max_wait_hours.
+    """
+    lines = [
+        json.dumps(
+            {
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": request["ai_model"],
+                    "messages": [{"role": "user", "content": request["prompt"]}],
+                    "max_tokens": request["max_tokens"],
+                },
+            },
+            ensure_ascii=False,
+        )
+        for i, request in enumerate(requests)
+    ]
+    input_file = client.files.create(
+        file=("batch_input.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    logger.info(f"Submitted Batch API job {batch.id} with {len(requests)} requests.")
+
+    deadline = time.monotonic() + max_wait_hours * 3600
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        if time.monotonic() >= deadline:
+            client.batches.cancel(batch.id)
+            raise RuntimeError(
+                f"Batch API job {batch.id} did not finish within {max_wait_hours} hours and was cancelled."
+            )
+        time.sleep(_BATCH_POLL_INTERVAL)
+        batch = client.batches.retrieve(batch.id)
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(
+            f"Batch API job {batch.id} ended with status {batch.status}."
+        )
+
+    results = {}
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") == 200:
+            choice = response["body"]["choices"][0]
+            content = choice["message"].get("content")
+            if content and content.strip() and choice.get("finish_reason") == "stop":
+                results[record["custom_id"]] = content
+    return results
+
+
+def _write_batched_academic_reports(
+    batch_requests: List[Dict[str, Any]],
+    max_wait_hours: float = _DEFAULT_BATCH_MAX_WAIT_HOURS,
+) -> None:
+    """Generates queued academic summaries with the Batch API, grouped by endpoint.
+
+    Summaries the batch could not produce, including all of them when it
+    takes longer than max_wait_hours, are requested through the regular API
+    instead.
+
+    Args:
+        batch_requests: Requests queued by generate_sensitivity_academic_report().
+        max_wait_hours: How long to wait for each batch before falling back.
+    """
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for request in batch_requests:
+        groups.setdefault((request["api_key"], request["base_url"]), []).append(request)
+
+    for (api_key, base_url), requests in groups.items():
+        client = _get_openai_client(api_key, base_url)
+        try:
+            results = _run_batch_chat_completions(client, requests, max_wait_hours)
+        except Exception as e:
+            logger.error(f"Batch API request failed for {base_url}: {e}")
+            results = {}
+
+        for i, request in enumerate(requests):
+            summary_path = request["summary_path"]
+            try:
+                text = results.get(str(i))
+                if text is not None:
+                    _write_llm_cache(request["cache_path"], text)
+                else:
+                    logger.warning(
+                        f"No batch result for {summary_path}. Falling back to the regular API."
+                    )
+                    text = _create_chat_completion(
+                        client,
+                        request["ai_model"],
+                        request["prompt"],
+                        max_tokens=request["max_tokens"],
+                        cache_dir=request["cache_dir"],
+                    )
+                with open(summary_path, "w", encoding="utf-8") as f:
+                    f.write(text)
+                logger.info(
+                    f"Successfully generated academic analysis summary: {summary_path}"
+                )
+            except Exception as e:
+                logger.error(f"Failed to generate academic summary {summary_path}: {e}")
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Returns the seconds to wait before retrying a failed LLM request.
+
+    Honors the Retry-After header of rate-limit (HTTP 429) responses, and
+    otherwise backs off exponentially with jitter.
+
+    Args:
+        error: The exception raised by the failed attempt.
+        attempt: The zero-based number of the failed attempt.
+    """
+    if isinstance(error, openai.APIStatusError) and error.status_code == 429:
+        retry_after = error.response.headers.get("retry-after")
+        try:
+            return max(0.0, float(retry_after))
+        except (TypeError, ValueError):
+            pass
+    return 2**attempt + random.random()
+
+
+@lru_cache(maxsize=4)
+def _load_text_cached(path: str, mtime: float) -> str:
+    """Returns the text of a UTF-8 file, cached until its modification time changes."""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=8)
+def _get_openai_client(api_key: str, base_url: str) -> openai.OpenAI:
+    """Returns a shared OpenAI client for the given credentials.
+
+    The client holds an HTTP connection pool, so reusing it across retries and
+    cases keeps connections alive instead of reconnecting for every request.
+    """
+    return openai.OpenAI(api_key=api_key, base_url=base_url)
+
 
 def call_openai_analysis_api(
     case_name: str,
@@ -26,6 +489,7 @@ def call_openai_analysis_api(
     original_config: dict,
     case_data: dict,
     reference_col_for_turning_point: str = None,
+    cache_dir: Optional[str] = None,
 ) -> Optional[str]:
     """Constructs a text-only prompt, calls the OpenAI API for analysis, and returns the result string.
 
@@ -40,6 +504,7 @@ def call_openai_analysis_api(
         original_config: Original configuration dictionary.
         case_data: Case-specific data dictionary.
         reference_col_for_turning_point: Optional reference column for turning point analysis.
+        cache_dir: Optional directory whose `.llm_cache` is reused for identical prompts.
 
     Returns:
         The combined prompt and LLM analysis result, or None if failed.
@@ -48,16 +513,13 @@ def call_openai_analysis_api(
         Constructs dynamic prompts based on case configuration. Includes sections for
         global sensitivity analysis, interaction effects (if simulation parameters present),
         and dynamic process analysis (if reference column provided). Retries up to 3 times
-        on failure with 5-second delays.
+        on failure, waiting as _retry_delay() advises between attempts.
     """
     try:
         logger.info(f"Proceeding with LLM analysis for case {case_name}.")
 
         # 1. Construct the prompt for the API
-        role_prompt = """**角色：** 你是一名聚变反应堆氚燃料循环领域的专家。
-
-**任务：** 请**完全基于**下方提供的**两类数据表格**，对聚变堆燃料循环模型的**敏感性分析**结果进行深度解读。
-"""
+        role_prompt = _ANALYSIS_ROLE_PROMPT
 
         analysis_prompt = f"""
 **分析数据：**(注意：分析中不可使用任何图表信息，所有结论必须源于数据表格。)
@@ -74,57 +536,35 @@ def call_openai_analysis_api(
         prompt_sections = []
 
         # Section 1: Global Sensitivity Analysis
-        global_sensitivity_points = [
-            "1.  **全局敏感性分析 (参考“性能指标总表”) :**",
-            "    *   分析性能指标总表（ `Startup_Inventory`, `Doubling_Time` 以及以 `Required_` 开头的求解指标等）呈现出怎样的**总体趋势**？请进行量化描述。",
-            f"    *   如果存在多个性能指标，分析哪个性能指标对独立变量 `{independent_variable}` 的变化最为敏感？哪个最不敏感？\n",
-        ]
+        global_sensitivity = _GLOBAL_SENSITIVITY_TMPL.format(
+            independent_variable=independent_variable
+        )
 
         # Interaction effect analysis, with refined description
         if has_sim_params:
-            param_names_list = []
-            for p in case_data["simulation_parameters"].keys():
-                if p == "Required_TBR":
-                    label = "`Required_TBR约束值 (hour)`"
-                else:
-                    label = f"`{p}`"
-                param_names_list.append(label)
-            param_names = ", ".join(param_names_list)
-
-            interaction_text = (
-                f"2.  **交互效应分析：** 本次分析包含了多变量的交互效应。请分析独立变量 `{independent_variable}` "
-                f"与背景扫描参数 ({param_names}) 之间的交互作用对各项性能指标的影响。"
-                "请注意，独立变量或背景扫描参数中，可能包含常规的模型参数，也可能包含为满足特定性能目标（限制倍增时间Double_Time达到倍增）而求解出的特殊变量（约束限制变量Double_Time）。"
-                "请讨论在不同的变量组合下，性能指标的敏感性有何不同？是否存在显著的交互效应？"
+            param_names = ", ".join(
+                "`Required_TBR约束值 (hour)`" if p == "Required_TBR" else f"`{p}`"
+                for p in case_data["simulation_parameters"]
+            )
+            global_sensitivity += "\n" + _INTERACTION_TMPL.format(
+                independent_variable=independent_variable, param_names=param_names
             )
-            global_sensitivity_points.append(interaction_text)
 
-        prompt_sections.append("\n".join(global_sensitivity_points))
+        prompt_sections.append(global_sensitivity)
 
         # Section 2: Dynamic Process Analysis
         if reference_col_for_turning_point:
-            dynamic_process_points = [
-                "3.  **动态过程分析 (参考“关键动态数据切片：过程数据”) :**",
-                "    *   观察过程数据切片：系统在“初始阶段”和“结束阶段”的行为有何不同？",
-                f"    *   以 `{reference_col_for_turning_point}` 为参考，其“转折点阶段”的数据揭示了什么物理过程？（例如，它是否是氚库存由消耗转为净增长的关键时刻？）",
-            ]
-            prompt_sections.append("\n".join(dynamic_process_points))
+            prompt_sections.append(
+                _DYNAMIC_TMPL.format(reference_col=reference_col_for_turning_point)
+            )
 
         # Section 3: Overall Conclusion (renumbered from 4)
-        conclusion_points = ["3.  **综合结论：**"]
-        conclusion_intro = "结合所有分析（包括主趋势"
-        if has_sim_params:
-            conclusion_intro += "、背景参数交互效应"
-        conclusion_intro += "），"
-
-        conclusion_points.append(
-            conclusion_intro
-            + f"总结在不同的运行场景下，调整 `{independent_variable}` 对整个氚燃料循环系统的综合影响和潜在的利弊权衡。"
-        )
-        conclusion_points.append(
-            "    *   基于这些发现，可以得出哪些关于系统设计或运行优化的初步建议？"
+        prompt_sections.append(
+            _CONCLUSION_TMPL.format(
+                interaction_clause="、背景参数交互效应" if has_sim_params else "",
+                independent_variable=independent_variable,
+            )
         )
-        prompt_sections.append("\n".join(conclusion_points))
 
         # Assemble the final prompt
         points_prompt = "\n\n".join(prompt_sections)
@@ -132,26 +572,30 @@ def call_openai_analysis_api(
             "\n**分析要点 (必须严格依据数据表格作答)：**\n\n" + points_prompt
         )
 
+        full_text_prompt = "\n\n".join([role_prompt, analysis_prompt, points_prompt])
+        # Budget the answer by the number of analysis sections requested.
+        max_tokens = min(
+            _MAX_COMPLETION_TOKENS,
+            800 + 400 * (1 + has_sim_params + bool(reference_col_for_turning_point)),
+        )
+
         # 2. Call API with retry logic
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                client = openai.OpenAI(api_key=api_key, base_url=base_url)
+                client = _get_openai_client(api_key, base_url)
                 logger.info(
                     f"Sending request to OpenAI API for case {case_name} (Attempt {attempt + 1}/{max_retries})..."
                 )
 
-                full_text_prompt = "\n\n".join(
-                    [role_prompt, analysis_prompt, points_prompt]
+                analysis_result = _create_chat_completion(
+                    client,
+                    ai_model,
+                    full_text_prompt,
+                    max_tokens=max_tokens,
+                    cache_dir=cache_dir,
                 )
 
-                response = client.chat.completions.create(
-                    model=ai_model,
-                    messages=[{"role": "user", "content": full_text_prompt}],
-                    max_tokens=4000,
-                )
-                analysis_result = response.choices[0].message.content
-
                 logger.info(f"LLM analysis successful for case {case_name}.")
                 return (
                     role_prompt
@@ -164,7 +608,7 @@ def call_openai_analysis_api(
             except Exception as e:
                 logger.error(f"Error calling OpenAI API on attempt {attempt + 1}: {e}")
                 if attempt < max_retries - 1:
-                    time.sleep(5)
+                    time.sleep(_retry_delay(e, attempt))
                 else:
                     logger.error(
                         f"Failed to call OpenAI API after {max_retries} attempts."
@@ -179,6 +623,186 @@ def call_openai_analysis_api(
         return None
 
 
+# json.dumps() builds a new encoder whenever non-default options are passed.
+_MD_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+@lru_cache(maxsize=32)
+def _build_academic_instructions(
+    independent_variable: str,
+    sampling_range: str,
+    title_instruction_text: str,
+    plot_list_str: str,
+    simulation_params_str: str,
+    dependent_vars_str: str,
+    results_and_discussion_str: str,
+) -> str:
+    """Fills the academic summary instructions; models of one case share the result."""
+    return _ACADEMIC_INSTRUCTIONS_TMPL.format(
+        independent_variable=independent_variable,
+        sampling_range=sampling_range,
+        title_instruction_text=title_instruction_text,
+        plot_list_str=plot_list_str,
+        simulation_params_str=simulation_params_str,
+        dependent_vars_str=dependent_vars_str,
+        results_and_discussion_str=results_and_discussion_str,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _format_label(label: str) -> str:
+    """Formats a label for display, turning underscores and non-decimal dots into spaces.
+
+    Labels repeat across sub-tables, plots and cases, so results are cached.
+    """
+    if not isinstance(label, str):
+        return label
+    return _LABEL_DOT_RE.sub(" ", label.replace("_", " "))
+
+
+@lru_cache(maxsize=None)
+def _required_column_pattern(base_name: str) -> re.Pattern:
+    """Matches `base_name(value)` columns, capturing the constraint value."""
+    return re.compile(re.escape(base_name) + r"\((.*)\)")
+
+
+@lru_cache(maxsize=None)
+def _sanitize_model_name(ai_model: str) -> str:
+    """Keeps the alphanumeric, '-' and '_' characters of a model name for file names."""
+    return _MODEL_NAME_STRIP_RE.sub("", ai_model)
+
+
+def _format_for_md(value: Any) -> str:
+    """Formats a configuration value as inline code for a Markdown table cell."""
+    return f"`{_MD_JSON_ENCODER.encode(value)}`".replace("|", "\\|")
+
+
+def _case_report_etag(
+    case_data: dict,
+    sensitivity_config: dict,
+    input_paths: List[str],
+    plots: List[str],
+    ai_models: Optional[str],
+) -> str:
+    """Fingerprints everything a case's Markdown report is built from.
+
+    Args:
+        case_data: Case configuration.
+        sensitivity_config: The `sensitivity_analysis` configuration section.
+        input_paths: Result files read by the report; their mtimes are hashed.
+        plots: Plot file names referenced by the report.
+        ai_models: Configured AI model names, if any.
+
+    Returns:
+        A hex digest that changes whenever any of the inputs change.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (case_data, sensitivity_config, ai_models):
+        digest.update(json.dumps(part, sort_keys=True, default=str).encode("utf-8"))
+        digest.update(b"|")
+    for path in input_paths:
+        mtime = os.path.getmtime(path) if os.path.exists(path) else None
+        digest.update(f"{path}={mtime}|".encode("utf-8"))
+    digest.update(",".join(sorted(plots)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _markdown_table(
+    headers: List[str], columns: List[List[str]], right_aligned: List[bool]
+) -> str:
+    """Renders text cells as a Markdown pipe table.
+
+    Args:
+        headers: Column headers.
+        columns: The cells of each column, as strings.
+        right_aligned: Whether each column is right-aligned.
+
+    Returns:
+        The pipe table, one line per row, without a trailing newline.
+    """
+    widths = [
+        max([len(header)] + [len(cell) for cell in cells])
+        for header, cells in zip(headers, columns)
+    ]
+
+    def _row(cells) -> str:
+        padded = (
+            cell.rjust(width) if right else cell.ljust(width)
+            for cell, width, right in zip(cells, widths, right_aligned)
+        )
+        return "| " + " | ".join(padded) + " |"
+
+    rules = (
+        "-" * (width + 1) + ":" if right else ":" + "-" * (width + 1)
+        for width, right in zip(widths, right_aligned)
+    )
+    separator = "|" + "|".join(rules) + "|"
+    lines = [_row(headers), separator]
+    lines.extend(_row(row) for row in zip(*columns))
+    return "\n".join(lines)
+
+
+def _dataframe_to_markdown(df: pd.DataFrame) -> str:
+    """Renders a DataFrame as a Markdown pipe table without its index.
+
+    Stands in for DataFrame.to_markdown(index=False) without going through
+    tabulate. Float columns use the same "g" formatting and numeric columns
+    are right-aligned; every other cell is written with str().
+    """
+    headers = [str(col) for col in df.columns]
+    columns, right_aligned = [], []
+    for _, series in df.items():
+        if pd.api.types.is_float_dtype(series):
+            cells = [format(value, "g") for value in series.to_numpy()]
+        else:
+            cells = [str(value) for value in series.to_numpy(dtype=object)]
+        columns.append(cells)
+        right_aligned.append(
+            pd.api.types.is_numeric_dtype(series)
+            and not pd.api.types.is_bool_dtype(series)
+        )
+    return _markdown_table(headers, columns, right_aligned)
+
+
+def _classify_plots(results_dir: str) -> Tuple[List[str], List[str]]:
+    """Lists the SVG and PNG plots of a results directory in a single scan.
+
+    Args:
+        results_dir: Directory containing the generated plots.
+
+    Returns:
+        A tuple (svg_plots, png_plots) of file names.
+    """
+    svg_plots, png_plots = [], []
+    with os.scandir(results_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".svg"):
+                svg_plots.append(name)
+            elif name.endswith(".png"):
+                png_plots.append(name)
+    return svg_plots, png_plots
+
+
+def _build_svg_plot_map(svg_plots: List[str]) -> Dict[str, str]:
+    """Maps each SVG plot to one language version, preferring the _zh variant.
+
+    Args:
+        svg_plots: SVG file names, typically from _classify_plots().
+
+    Returns:
+        Dict mapping the English file name to the file name to use.
+    """
+    plot_map = {}
+    for plot in sorted(svg_plots, reverse=True):  # Process _zh.svg first
+        base_name = plot
+        if plot.endswith("_zh.svg"):
+            base_name = plot[: -len("_zh.svg")] + ".svg"
+        if base_name not in plot_map:
+            plot_map[base_name] = plot
+    return plot_map
+
+
 def generate_sensitivity_academic_report(
     case_name: str,
     case_workspace: str,
@@ -187,6 +811,8 @@ def generate_sensitivity_academic_report(
     case_data: dict,
     ai_model: str,
     report_path: str,
+    report_content: Optional[str] = None,
+    batch_requests: Optional[List[Dict[str, Any]]] = None,
 ) -> None:
     """Generates a professional academic analysis summary for a sensitivity analysis case.
 
@@ -200,12 +826,17 @@ def generate_sensitivity_academic_report(
         case_data: Case-specific data dictionary.
         ai_model: Model name to use for generating the report.
         report_path: Path to the existing report file.
+        report_content: Content of the report file, if the caller already has it
+            in memory. Read from report_path when omitted.
+        batch_requests: If given, the request is appended to this list for
+            _write_batched_academic_reports() instead of being sent right away.
 
     Note:
         Requires report file and glossary file to exist. Loads API credentials from
         environment variables. Generates academic report with proper structure including
         title, abstract, introduction, methodology, results & discussion, and conclusion.
         Retries up to 3 times on API failure. Saves result to academic_report_{case_name}_{model}.md.
+        Responses are cached under results/.llm_cache, so unchanged inputs skip the API call.
     """
     try:
         logger.info(
@@ -216,13 +847,17 @@ def generate_sensitivity_academic_report(
         results_dir = os.path.join(case_workspace, "results")
         report_filename = os.path.basename(report_path)
 
-        if not os.path.exists(report_path):
+        if report_content is not None:
+            original_report_content = report_content
+        elif not os.path.exists(report_path):
             logger.error(
                 f"Cannot generate academic summary: Original report '{report_path}' not found."
             )
             return
-        with open(report_path, "r", encoding="utf-8") as f:
-            original_report_content = f.read()
+        else:
+            original_report_content = _load_text_cached(
+                report_path, os.path.getmtime(report_path)
+            )
 
         # 2. Read the glossary
         glossary_path = original_config.get("sensitivity_analysis", {}).get(
@@ -233,11 +868,13 @@ def generate_sensitivity_academic_report(
                 f"Cannot generate academic summary: Glossary file '{glossary_path}' not found."
             )
             return
-        with open(glossary_path, "r", encoding="utf-8") as f:
-            glossary_content = f.read()
+        glossary_content = _load_text_cached(
+            glossary_path, os.path.getmtime(glossary_path)
+        )
 
         # 3. Check for API credentials
         env = get_llm_env(original_config)
+        _configure_llm_rate_limiter(env)
         api_key = env.get("API_KEY")
         base_url = env.get("BASE_URL")
 
@@ -248,10 +885,7 @@ def generate_sensitivity_academic_report(
             return
 
         # 4. Construct the prompt
-        role_prompt = """**角色：** 您是一位在核聚变工程，特别是氚燃料循环领域，具有深厚学术背景的资深科学家。
-
-**任务：** 您收到了一个关于**敏感性分析**的程序自动生成的初步报告和一份专业术语表。请您基于这两份文件，撰写一份更加专业、正式、符合学术发表标准的深度分析总结报告。
-"""
+        role_prompt = _ACADEMIC_ROLE_PROMPT
 
         # Extract relevant details from case_data for the prompt
         sampling_range = case_data.get("independent_variable_sampling", {})
@@ -303,18 +937,10 @@ def generate_sensitivity_academic_report(
             )
 
         # Find all plots to instruct the LLM to include them, prioritizing Chinese versions
-        all_files = [f for f in os.listdir(results_dir) if f.endswith((".svg", ".png"))]
-
-        plot_map = {}
-        # Handle SVGs, prioritizing _zh versions
-        svg_plots = sorted([f for f in all_files if f.endswith(".svg")], reverse=True)
-        for plot in svg_plots:
-            base_name = plot.replace("_zh.svg", ".svg")
-            if base_name not in plot_map:
-                plot_map[base_name] = plot
+        svg_plots, png_plots = _classify_plots(results_dir)
+        plot_map = _build_svg_plot_map(svg_plots)
 
         # Add PNGs (which are not bilingual)
-        png_plots = [f for f in all_files if f.endswith(".png")]
         for plot in png_plots:
             plot_map[plot] = plot  # Use plot name as key for uniqueness
 
@@ -359,29 +985,15 @@ def generate_sensitivity_academic_report(
                 "请在标题中明确指出，本次分析是关于“独立变量”的【敏感性分析】。"
             )
 
-        instructions_prompt = f"""**指令：**
-
-1.  **专业化语言：** 将初步报告中的模型参数/缩写（例如 `sds.I[1]`, `Startup_Inventory`）替换为术语表中对应的“中文翻译”或“英文术语”。例如，应将“`sds`的库存”表述为“储存与输送系统 (SDS) 的氚库存量 (Tritium Inventory)”。
-2.  **学术化重述：** 用严谨、客观的学术语言重新组织和阐述初步报告中的发现。避免使用“看起来”、“好像”等模糊词汇。
-3.  **图表和表格的呈现与引用：**
-    *   **显示图表：** 在报告的“结果与讨论”部分，您**必须**使用Markdown语法 `![图表标题](图表文件名)` 来**直接嵌入**和显示初步报告中包含的所有图表。可用的图表文件如下：
-{plot_list_str}
-    *   **引用图表：** 在正文中分析和讨论图表内容时，请使用“如图1所示...”等方式对图表进行编号和文字引用。
-    *   **显示表格：** 当呈现数据时（例如，性能指标总表或关键动态数据切片），您**必须**使用Markdown的管道表格（pipe-table）格式来清晰地展示它们。您可以直接复用或重新格式化初步报告中的数据表格。
-4.  **结构化报告：** 您的报告是关于一项**敏感性分析**。报告应包含以下部分：
-    *   **标题 (Title):** {title_instruction_text}
-    *   **摘要 (Abstract):** 简要概括本次敏感性研究的目的，明确指明独立变量是 **`{independent_variable}`** 以及背景扫描参数，总结其对哪些关键性能指标（如启动库存、增殖时间等）影响最显著，并陈述核心结论。
-    *   **引言 (Introduction):** 描述进行这项关于 **`{independent_variable}`** 的敏感性分析的背景和重要性。阐述研究目标，即量化评估 **`{independent_variable}`** 的变化对氚燃料循环系统性能的影响。
-        *   **独立变量采样 (Independent Variable Sampling):** 本次分析中，独立变量 `{independent_variable}` 扫描范围为 `{sampling_range}`。
-{simulation_params_str}{dependent_vars_str}
-    *   **方法 (Methodology):** 简要说明分析方法，包括提及 **`{independent_variable}`** 的扫描范围和被评估的关键性能指标。
-    *   **结果与讨论 (Results and Discussion):** 这是报告的核心。请结合所有图表和数据表格，并根据分析内容，组织分点详细论述：
-{results_and_discussion_str}
-    *   **结论 (Conclusion):** 总结本次敏感性分析得出的主要学术结论，并对反应堆设计或未来运行策略提出具体建议。
-5.  **输出格式：** 请直接输出完整的学术分析报告正文，确保所有内容（包括图表和表格）都遵循正确的Markdown语法。
-
-**输入文件：**
-"""
+        instructions_prompt = _build_academic_instructions(
+            independent_variable,
+            str(sampling_range),
+            title_instruction_text,
+            plot_list_str,
+            simulation_params_str,
+            dependent_vars_str,
+            results_and_discussion_str,
+        )
 
         analysis_prompt = f"""
 ---
@@ -395,36 +1007,59 @@ def generate_sensitivity_academic_report(
 {glossary_content}
 """
 
+        full_text_prompt = "\n\n".join(
+            [role_prompt, instructions_prompt, analysis_prompt]
+        )
+        # The full report grows with the embedded plots and discussion points.
+        max_tokens = min(
+            _MAX_COMPLETION_TOKENS,
+            1500 + 150 * len(all_plots) + 400 * len(results_and_discussion_points),
+        )
+
+        sanitized_model_name = _sanitize_model_name(ai_model)
+        summary_filename = f"academic_report_{case_name}_{sanitized_model_name}.md"
+        summary_path = os.path.join(results_dir, summary_filename)
+        # Streamed output goes to a temporary file so an interrupted response
+        # never leaves a truncated report behind.
+        partial_path = summary_path + ".part"
+
+        cache_path = _llm_cache_path(results_dir, ai_model, full_text_prompt)
+        if batch_requests is not None and not os.path.exists(cache_path):
+            batch_requests.append(
+                dict(
+                    api_key=api_key,
+                    base_url=base_url,
+                    ai_model=ai_model,
+                    prompt=full_text_prompt,
+                    max_tokens=max_tokens,
+                    summary_path=summary_path,
+                    cache_dir=results_dir,
+                    cache_path=cache_path,
+                )
+            )
+            logger.info(f"Queued academic summary {summary_path} for the Batch API.")
+            return
+
         # 5. Call the API
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                client = openai.OpenAI(api_key=api_key, base_url=base_url)
+                client = _get_openai_client(api_key, base_url)
                 logger.info(
                     f"Sending request to OpenAI API for academic summary for case {case_name} with model {ai_model} (Attempt {attempt + 1}/{max_retries})..."
                 )
 
-                full_text_prompt = "\n\n".join(
-                    [role_prompt, instructions_prompt, analysis_prompt]
-                )
-
-                response = client.chat.completions.create(
-                    model=ai_model,
-                    messages=[{"role": "user", "content": full_text_prompt}],
-                    max_tokens=4000,
-                )
-                academic_summary = response.choices[0].message.content
-
-                # 6. Save the result
-                sanitized_model_name = "".join(
-                    c for c in ai_model if c.isalnum() or c in ("-", "_")
-                ).rstrip()
-                summary_filename = (
-                    f"academic_report_{case_name}_{sanitized_model_name}.md"
-                )
-                summary_path = os.path.join(results_dir, summary_filename)
-                with open(summary_path, "w", encoding="utf-8") as f:
-                    f.write(academic_summary)
+                # 6. Stream the result to disk
+                with open(partial_path, "w", encoding="utf-8") as f:
+                    _create_chat_completion(
+                        client,
+                        ai_model,
+                        full_text_prompt,
+                        max_tokens=max_tokens,
+                        sink=f,
+                        cache_dir=results_dir,
+                    )
+                os.replace(partial_path, summary_path)
 
                 logger.info(
                     f"Successfully generated academic analysis summary: {summary_path}"
@@ -436,11 +1071,13 @@ def generate_sensitivity_academic_report(
                     f"Error calling OpenAI API for academic summary on attempt {attempt + 1}: {e}"
                 )
                 if attempt < max_retries - 1:
-                    time.sleep(5)
+                    time.sleep(_retry_delay(e, attempt))
                 else:
                     logger.error(
                         f"Failed to generate academic summary for {case_name} after {max_retries} attempts."
                     )
+                    if os.path.exists(partial_path):
+                        os.remove(partial_path)
                     return  # Exit after all retries failed
 
     except Exception as e:
@@ -464,15 +1101,19 @@ def generate_prompt_templates(
         a detailed Markdown report including configuration details, optimization configs,
         time-series plots, performance metric plots, and data tables. Supports AI-enhanced
         reporting if API credentials are available. Creates bilingual plots prioritizing
-        Chinese versions (_zh suffix).
+        Chinese versions (_zh suffix). The AI analyses of all cases and models are run
+        concurrently after the base reports are built.
     """
 
-    def _find_unit_config(var_name: str, unit_map: dict) -> dict | None:
+    def _find_unit_config(
+        var_name: str, unit_map: dict, sorted_keys: Optional[List[str]] = None
+    ) -> dict | None:
         """
         Finds the unit configuration for a variable name from the unit_map.
         1. Checks for an exact match.
         2. Checks if the last part of a dot-separated name matches.
         3. Checks for a simple substring containment as a fallback, matching longest keys first.
+        `sorted_keys` may hold the unit_map keys pre-sorted by descending length.
         """
         if not unit_map or not var_name:
             return None
@@ -481,22 +1122,28 @@ def generate_prompt_templates(
         components = var_name.split(".")
         if len(components) > 1 and components[-1] in unit_map:
             return unit_map[components[-1]]
-        for key in sorted(unit_map.keys(), key=len, reverse=True):
+        if sorted_keys is None:
+            sorted_keys = sorted(unit_map.keys(), key=len, reverse=True)
+        for key in sorted_keys:
             if key in var_name:
                 return unit_map[key]
         return None
 
-    def _format_label(label: str) -> str:
-        """Formats a label for display, replacing underscores/dots with spaces and capitalizing each word."""
-        if not isinstance(label, str):
-            return label
-        label = label.replace("_", " ")
-        label = re.sub(r"(?<!\d)\.|\.(?!\d)", " ", label)
-        return label  # .title()
-
     try:
         sensitivity_analysis_config = original_config.get("sensitivity_analysis", {})
         unit_map = sensitivity_analysis_config.get("unit_map", {})
+        # Substring fallback order of _find_unit_config, sorted once per run.
+        unit_keys_by_length = sorted(unit_map.keys(), key=len, reverse=True)
+
+        # (case, model) LLM analyses, run together once all base reports exist
+        ai_tasks = []
+        base_report_paths = []
+        # (etag path, etag, expected report paths) of every regenerated case
+        case_etags = []
+        # Academic summaries collected for the Batch API, if enabled
+        academic_batch = (
+            [] if sensitivity_analysis_config.get("use_batch_api", False) else None
+        )
 
         for case_info in case_configs:
             case_data = case_info["case_data"]
@@ -523,29 +1170,69 @@ def generate_prompt_templates(
                 )
                 continue
 
-            summary_df = pd.read_csv(summary_csv_path)
+            summary_df = pd.read_csv(summary_csv_path, engine="c", low_memory=False)
             independent_variable = case_data.get("independent_variable", "燃烧率")
 
-            # Check for sweep results (CSV or HDF5)
+            report_path = os.path.join(
+                case_results_dir, f"analysis_report_{case_name}.md"
+            )
+
+            # Check for sweep results (CSV or HDF5), statting each file once
             sweep_results_path = os.path.join(case_results_dir, "sweep_results.csv")
-            if not os.path.exists(sweep_results_path):
+            sweep_results_exists = os.path.exists(sweep_results_path)
+            if not sweep_results_exists:
                 h5_path = os.path.join(case_results_dir, "sweep_results.h5")
                 if os.path.exists(h5_path):
                     sweep_results_path = h5_path
+                    sweep_results_exists = True
 
             # Use a dictionary to ensure we only get one version of each plot, prioritizing Chinese
-            all_plots_all_langs = [
-                f for f in os.listdir(case_results_dir) if f.endswith(".svg")
-            ]
-            plot_map = {}
-            for plot in sorted(
-                all_plots_all_langs, reverse=True
-            ):  # Process _zh.svg first
-                base_name = plot.replace("_zh.svg", ".svg")
-                if base_name not in plot_map:
-                    plot_map[base_name] = plot
+            plot_map = _build_svg_plot_map(_classify_plots(case_results_dir)[0])
 
             all_plots = list(plot_map.values())
+
+            # Skip cases whose inputs are unchanged since their reports were built
+            env = get_llm_env(original_config)
+            _configure_llm_rate_limiter(env)
+            ai_models_str = env.get("AI_MODELS") or env.get("AI_MODEL")
+            etag = _case_report_etag(
+                case_data,
+                sensitivity_analysis_config,
+                [summary_csv_path, sweep_results_path],
+                all_plots,
+                ai_models_str if case_data.get("ai", False) else None,
+            )
+            etag_path = os.path.join(case_results_dir, ".report_etag")
+            if case_data.get("ai", False) and ai_models_str:
+                expected_reports = [
+                    f"academic_report_{case_name}_{_sanitize_model_name(m.strip())}.md"
+                    for m in ai_models_str.split(",")
+                ]
+            else:
+                expected_reports = [os.path.basename(report_path)]
+            # Reports may already have been moved by consolidate_reports()
+            report_dirs = (case_results_dir, os.path.join(case_workspace, "report"))
+            if os.path.exists(etag_path) and all(
+                any(os.path.exists(os.path.join(d, name)) for d in report_dirs)
+                for name in expected_reports
+            ):
+                with open(etag_path, "r", encoding="utf-8") as f:
+                    if f.read() == etag:
+                        logger.info(
+                            f"Inputs of case {case_name} are unchanged, skipping report generation."
+                        )
+                        continue
+
+            # Drop the outdated etag and reports so that a failed regeneration
+            # cannot leave them looking current to the next run.
+            expected_paths = [
+                os.path.join(case_results_dir, name) for name in expected_reports
+            ]
+            for stale_path in [etag_path] + expected_paths:
+                if os.path.exists(stale_path):
+                    os.remove(stale_path)
+            case_etags.append((etag_path, etag, expected_paths))
+
             sweep_plots = [f for f in all_plots if f.startswith("sweep_")]
             combined_plots = [f for f in all_plots if f.startswith("combined_")]
             multi_metric_plots = [
@@ -601,36 +1288,50 @@ def generate_prompt_templates(
                 "| :--- | :--- | :--- |",
             ]
 
-            def format_for_md(value):
-                return f"`{json.dumps(value, ensure_ascii=False)}`".replace("|", "\\|")
-
+            # (key, value, description, included)
+            config_rows = [
+                ("name", case_name, "本次分析案例的名称。", True),
+                (
+                    "independent_variable",
+                    independent_variable,
+                    "独立扫描变量，即本次分析中主要改变的参数。",
+                    True,
+                ),
+                (
+                    "independent_variable_sampling",
+                    case_data.get("independent_variable_sampling"),
+                    "独立变量的采样方法和范围。",
+                    True,
+                ),
+                (
+                    "default_independent_values",
+                    case_data.get("default_independent_values"),
+                    "独立扫描变量在模型中的原始默认值。",
+                    "default_independent_values" in case_data,
+                ),
+                (
+                    "simulation_parameters",
+                    case_data.get("simulation_parameters"),
+                    "背景扫描参数，与独立变量组合形成多维扫描。",
+                    bool(case_data.get("simulation_parameters")),
+                ),
+                (
+                    "default_simulation_values",
+                    case_data.get("default_simulation_values"),
+                    "背景扫描参数在模型中的原始默认值。",
+                    bool(case_data.get("default_simulation_values")),
+                ),
+                (
+                    "dependent_variables",
+                    case_data.get("dependent_variables"),
+                    "因变量，即我们关心的、随自变量变化的性能指标。",
+                    True,
+                ),
+            ]
             config_details_lines.extend(
-                [
-                    f"| **`name`** | {format_for_md(case_name)} | 本次分析案例的名称。 |",
-                    f"| **`independent_variable`** | {format_for_md(independent_variable)} | 独立扫描变量，即本次分析中主要改变的参数。 |",
-                    f"| **`independent_variable_sampling`** | {format_for_md(case_data.get('independent_variable_sampling'))} | 独立变量的采样方法和范围。 |",
-                ]
-            )
-            if "default_independent_values" in case_data:
-                config_details_lines.append(
-                    f"| **`default_independent_values`** | {format_for_md(case_data['default_independent_values'])} | 独立扫描变量在模型中的原始默认值。 |"
-                )
-            if (
-                "simulation_parameters" in case_data
-                and case_data["simulation_parameters"]
-            ):
-                config_details_lines.append(
-                    f"| **`simulation_parameters`** | {format_for_md(case_data['simulation_parameters'])} | 背景扫描参数，与独立变量组合形成多维扫描。 |"
-                )
-            if (
-                "default_simulation_values" in case_data
-                and case_data["default_simulation_values"]
-            ):
-                config_details_lines.append(
-                    f"| **`default_simulation_values`** | {format_for_md(case_data['default_simulation_values'])} | 背景扫描参数在模型中的原始默认值。 |"
-                )
-            config_details_lines.append(
-                f"| **`dependent_variables`** | {format_for_md(case_data.get('dependent_variables'))} | 因变量，即我们关心的、随自变量变化的性能指标。 |"
+                f"| **`{key}`** | {_format_for_md(value)} | {description} |"
+                for key, value, description, included in config_rows
+                if included
             )
             config_details_lines.append("\n")
             prompt_lines.extend(config_details_lines)
@@ -654,20 +1355,11 @@ def generate_prompt_templates(
                             "| 配置项 | 值 | 说明 |",
                             "| :--- | :--- | :--- |",
                         ]
-                        config_map = {
-                            "source_column": "限制条件的数据源列。",
-                            "parameter_to_optimize": "优化的目标参数。",
-                            "search_range": "参数的搜索范围。",
-                            "tolerance": "搜索的收敛精度。",
-                            "max_iterations": "最大迭代次数。",
-                            "metric_name": "限制条件的性能指标。",
-                            "metric_max_value": "限制条件满足的上限值。（hour）",
-                        }
-                        for key, description in config_map.items():
+                        for key, description in _OPTIMIZATION_CONFIG_ROWS.items():
                             if key in metric_config:
                                 value = metric_config[key]
                                 details_lines.append(
-                                    f"| **`{key}`** | {format_for_md(value)} | {description} |"
+                                    f"| **`{key}`** | {_format_for_md(value)} | {description} |"
                                 )
 
                             metric_config_sim = case_data.get(
@@ -676,7 +1368,7 @@ def generate_prompt_templates(
                             if metric_config_sim and key in metric_config_sim:
                                 value = metric_config_sim[key]
                                 details_lines.append(
-                                    f"| **`{key} (from simulation_parameters)`** | {format_for_md(value)} | {description} |"
+                                    f"| **`{key} (from simulation_parameters)`** | {_format_for_md(value)} | {description} |"
                                 )
 
                         details_lines.append("\n")
@@ -742,18 +1434,14 @@ def generate_prompt_templates(
                         [f"### {title}\n", f"![{title}]({plot_file})\n\n"]
                     )
 
-            def _format_df_to_md(
-                sub_df: pd.DataFrame,
-                ind_var: str,
-                case_data: dict,
-                current_unit_map: dict,
-            ) -> str:
-                if sub_df.empty:
-                    return "无数据。"
-                all_markdown_lines = []
-                all_cols = sub_df.columns.tolist()
-                if ind_var in all_cols:
-                    all_cols.remove(ind_var)
+            # Every group of a case shares its columns, so classify them and look
+            # up their units once per case rather than once per sub-table.
+            column_layouts = {}
+            unit_configs = {}
+
+            def _classify_columns(columns: tuple, ind_var: str, case_data: dict):
+                """Splits columns into standard metrics and Required_ groups."""
+                all_cols = [c for c in columns if c != ind_var]
                 standard_cols = [
                     c
                     for c in all_cols
@@ -773,40 +1461,65 @@ def generate_prompt_templates(
                             group_cols.append(col)
                     if group_cols:
                         required_groups[base_name] = group_cols
+                return standard_cols, required_groups
+
+            def _format_df_to_md(
+                sub_df: pd.DataFrame,
+                ind_var: str,
+                case_data: dict,
+                current_unit_map: dict,
+            ) -> str:
+                if sub_df.empty:
+                    return "无数据。"
+                all_markdown_lines = []
+                layout_key = tuple(sub_df.columns)
+                if layout_key not in column_layouts:
+                    column_layouts[layout_key] = _classify_columns(
+                        layout_key, ind_var, case_data
+                    )
+                standard_cols, required_groups = column_layouts[layout_key]
 
                 def _format_slice_to_md(df_slice: pd.DataFrame, umap: dict) -> str:
                     if df_slice.empty:
                         return ""
-                    df_formatted = df_slice.copy()
-                    new_columns = {}
-                    for col_name in df_formatted.columns:
-                        unit_config = _find_unit_config(col_name, umap)
-                        new_col_name = _format_label(col_name)
+                    # Build the table cells column by column straight from the
+                    # slice's arrays, without copying or renaming the frame.
+                    headers, columns, right_aligned = [], [], []
+                    for col_name, series in df_slice.items():
+                        if col_name not in unit_configs:
+                            unit_configs[col_name] = _find_unit_config(
+                                col_name, umap, unit_keys_by_length
+                            )
+                        unit_config = unit_configs[col_name]
+                        header = _format_label(col_name)
+                        is_numeric = pd.api.types.is_numeric_dtype(series)
+                        if is_numeric:
+                            values = series.to_numpy(dtype=float, na_value=np.nan)
+                        else:
+                            values = series.to_numpy(dtype=object)
                         if unit_config:
                             unit = unit_config.get("unit")
                             factor = unit_config.get("conversion_factor")
-                            if factor and pd.api.types.is_numeric_dtype(
-                                df_formatted[col_name]
-                            ):
-                                df_formatted[col_name] = df_formatted[col_name] / float(
-                                    factor
-                                )
+                            if factor and is_numeric:
+                                values = values / float(factor)
                             if unit:
-                                new_col_name = f"{new_col_name} ({unit})"
-                        new_columns[col_name] = new_col_name
-                    df_formatted.rename(columns=new_columns, inplace=True)
-                    format_map = {}
-                    for original_col_name in df_slice.columns:
-                        if original_col_name.startswith("Required_"):
-                            format_map[new_columns[original_col_name]] = "{:.4f}"
-                    default_format = "{:.2f}"
-                    for col in df_formatted.columns:
-                        if pd.api.types.is_numeric_dtype(df_formatted[col]):
-                            formatter = format_map.get(col, default_format)
-                            df_formatted[col] = df_formatted[col].apply(
-                                lambda x: formatter.format(x) if pd.notnull(x) else x
+                                header = f"{header} ({unit})"
+                        if is_numeric:
+                            formatter = (
+                                "%.4f" if col_name.startswith("Required_") else "%.2f"
                             )
-                    return df_formatted.to_markdown(index=False)
+                            missing = np.isnan(values)
+                            cells = np.char.mod(
+                                formatter, np.where(missing, 0.0, values)
+                            ).astype(object)
+                            cells[missing] = "nan"
+                            cells = cells.tolist()
+                        else:
+                            cells = [str(value) for value in values]
+                        headers.append(str(header))
+                        columns.append(cells)
+                        right_aligned.append(is_numeric)
+                    return _markdown_table(headers, columns, right_aligned)
 
                 ind_var_list = [ind_var] if isinstance(ind_var, str) else list(ind_var)
                 existing_ind_vars = [c for c in ind_var_list if c in sub_df.columns]
@@ -850,14 +1563,6 @@ def generate_prompt_templates(
                                 all_markdown_lines.append("\n")
                                 continue
 
-                            # Melt the dataframe from wide to long format
-                            melted_df = req_df_slice.melt(
-                                id_vars=[ind_var],
-                                value_vars=value_vars,
-                                var_name="variable_col",
-                                value_name=base_name,
-                            )
-
                             # Determine the name for the new column from config (e.g., 'Doubling_Time')
                             new_col_name = "Constraint"  # Default name
                             metric_def = case_data.get("simulation_parameters").get(
@@ -867,18 +1572,33 @@ def generate_prompt_templates(
                                 new_col_name = "Constraint " + metric_def["metric_name"]
 
                             # Extract constraint value from old column name, e.g., '7.0' from 'Required_TBR(7.0)'
-                            pattern_str = f"{re.escape(base_name)}\\((.*)\\)"
-                            melted_df[new_col_name] = melted_df[
-                                "variable_col"
-                            ].str.extract(pat=pattern_str)
+                            pattern = _required_column_pattern(base_name)
+                            constraints = []
+                            for col in value_vars:
+                                match = pattern.search(col)
+                                constraints.append(match.group(1) if match else np.nan)
+
+                            # Melt from wide to long format column-wise, as
+                            # DataFrame.melt would: one block of rows per value column
+                            ind_values = req_df_slice[ind_var].to_numpy()
+                            melted_values = np.concatenate(
+                                [req_df_slice[col].to_numpy() for col in value_vars]
+                            )
+                            keep = ~pd.isna(melted_values)
 
                             # Create the final dataframe with the desired columns: [A, new_col, B]
-                            final_df = melted_df[
-                                [ind_var, new_col_name, base_name]
-                            ].copy()
-                            final_df.dropna(subset=[base_name], inplace=True)
+                            final_df = pd.DataFrame(
+                                {
+                                    ind_var: np.tile(ind_values, len(value_vars))[keep],
+                                    new_col_name: np.repeat(
+                                        np.array(constraints, dtype=object),
+                                        len(ind_values),
+                                    )[keep],
+                                    base_name: melted_values[keep],
+                                }
+                            )
 
-                            all_markdown_lines.append(final_df.to_markdown(index=False))
+                            all_markdown_lines.append(_dataframe_to_markdown(final_df))
                             all_markdown_lines.append("\n")
 
                         except Exception as e:
@@ -892,7 +1612,7 @@ def generate_prompt_templates(
                 return "\n".join(all_markdown_lines)
 
             reference_col_for_turning_point = None
-            if case_data.get("sweep_time") and os.path.exists(sweep_results_path):
+            if case_data.get("sweep_time") and sweep_results_exists:
                 try:
                     logger.info("Loading sweep results for dynamic slicing.")
                     if sweep_results_path.endswith(".h5"):
@@ -906,7 +1626,12 @@ def generate_prompt_templates(
                         )
                         end_data = slice_data.get("end_sample_df", pd.DataFrame())
                     else:
-                        sweep_df = pd.read_csv(sweep_results_path)
+                        # Sweep files can be wide: read the values as float32
+                        sweep_columns = pd.read_csv(sweep_results_path, nrows=0).columns
+                        sweep_df = pd.read_csv(
+                            sweep_results_path,
+                            dtype={c: np.float32 for c in sweep_columns if c != "time"},
+                        )
                         if "time" in sweep_df.columns and len(sweep_df.columns) > 1:
                             reference_col_for_turning_point = sweep_df.columns[
                                 len(sweep_df.columns) // 2
@@ -917,14 +1642,15 @@ def generate_prompt_templates(
                         end_data = pd.DataFrame()
 
                         if reference_col_for_turning_point:
-                            data_to_slice_df = sweep_df.copy()
-                            data_to_slice_df.reset_index(drop=True, inplace=True)
+                            # Slicing only reads; read_csv already gives a RangeIndex
+                            data_to_slice_df = sweep_df
                             primary_y_var = reference_col_for_turning_point
                             min_idx = -1
                             if primary_y_var in data_to_slice_df.columns:
-                                y_data = data_to_slice_df[primary_y_var]
-                                if not y_data.empty:
-                                    min_idx = y_data.idxmin()
+                                y_values = data_to_slice_df[primary_y_var].to_numpy()
+                                # Same position as idxmin() on the RangeIndex
+                                if y_values.size and not np.isnan(y_values).all():
+                                    min_idx = int(np.nanargmin(y_values))
                             num_points, interval = 20, 2
                             window_size = (num_points - 1) * interval + 1
                             start_data = data_to_slice_df.iloc[:window_size:interval]
@@ -972,8 +1698,8 @@ def generate_prompt_templates(
                             "### 1. 初始阶段 (前 20 个数据点, 间隔 2)\n"
                         )
                         prompt_lines.append(
-                            start_data.rename(columns=rename_map).to_markdown(
-                                index=False
+                            _dataframe_to_markdown(
+                                start_data.rename(columns=rename_map)
                             )
                             + "\n\n"
                         )
@@ -982,16 +1708,16 @@ def generate_prompt_templates(
                                 f"### 2. 转折点阶段 (围绕 '{reference_col_for_turning_point}' 最小值)\n"
                             )
                             prompt_lines.append(
-                                turning_point_data.rename(
-                                    columns=rename_map
-                                ).to_markdown(index=False)
+                                _dataframe_to_markdown(
+                                    turning_point_data.rename(columns=rename_map)
+                                )
                                 + "\n\n"
                             )
                         prompt_lines.append(
                             "### 3. 结束阶段 (后 20 个数据点, 间隔 2)\n"
                         )
                         prompt_lines.append(
-                            end_data.rename(columns=rename_map).to_markdown(index=False)
+                            _dataframe_to_markdown(end_data.rename(columns=rename_map))
                             + "\n\n"
                         )
                 except Exception as e:
@@ -1011,7 +1737,7 @@ def generate_prompt_templates(
                 prompt_lines.append(
                     f"## 性能指标总表 (分组: `{'`, `'.join(grouping_vars)}`)\n\n"
                 )
-                groups = dict(list(summary_df.groupby(grouping_vars)))
+                groups = summary_df.groupby(grouping_vars)
                 default_values = case_data.get("default_simulation_values")
                 default_group_key = None
                 if default_values:
@@ -1024,8 +1750,13 @@ def generate_prompt_templates(
                             "Mismatch between default_simulation_values and grouping_vars. Cannot find default group."
                         )
                         default_group_key = None
-                if default_group_key and default_group_key in groups:
-                    default_group_df = groups.pop(default_group_key)
+                default_group_df = None
+                if default_group_key:
+                    try:
+                        default_group_df = groups.get_group(default_group_key)
+                    except KeyError:
+                        pass
+                if default_group_df is not None:
                     header = " & ".join(
                         f"`{var}={val}`"
                         for var, val in zip(grouping_vars, default_group_key)
@@ -1040,9 +1771,11 @@ def generate_prompt_templates(
                         )
                     )
                     prompt_lines.append("\n---\n")
-                if groups:
+                if groups.ngroups > (default_group_df is not None):
                     prompt_lines.append("> 其他参数组合下的数据子表：\n")
-                for group_name, group_df in groups.items():
+                for group_name, group_df in groups:
+                    if default_group_df is not None and group_name == default_group_key:
+                        continue
                     header = (
                         " & ".join(
                             f"`{var}={val}`"
@@ -1067,9 +1800,6 @@ def generate_prompt_templates(
             # --- AI Analysis and Report Writing ---
             if not case_data.get("ai", False):
                 # AI is off: write a single, simple report
-                report_path = os.path.join(
-                    case_results_dir, f"analysis_report_{case_name}.md"
-                )
                 with open(report_path, "w", encoding="utf-8") as f:
                     f.write(base_report_content)
                 logger.info(
@@ -1078,20 +1808,14 @@ def generate_prompt_templates(
                 continue  # Go to next case
 
             # AI is ON: go into multi-model logic
-            env = get_llm_env(original_config)
             api_key = env.get("API_KEY")
             base_url = env.get("BASE_URL")
 
-            ai_models_str = env.get("AI_MODELS") or env.get("AI_MODEL")
-
             if not all((api_key, base_url, ai_models_str)):
                 logger.warning(
                     "API_KEY, BASE_URL, or AI_MODELS/AI_MODEL not found in environment variables. Skipping LLM analysis."
                 )
                 # Also write the base report here so something is generated
-                report_path = os.path.join(
-                    case_results_dir, f"analysis_report_{case_name}.md"
-                )
                 with open(report_path, "w", encoding="utf-8") as f:
                     f.write(base_report_content)
                 logger.info(
@@ -1101,63 +1825,145 @@ def generate_prompt_templates(
 
             ai_models = [model.strip() for model in ai_models_str.split(",")]
 
-            for ai_model in ai_models:
-                logger.info(
-                    f"Generating AI analysis for case '{case_name}' with model '{ai_model}'."
-                )
-
-                sanitized_model_name = "".join(
-                    c for c in ai_model if c.isalnum() or c in ("-", "_")
-                ).rstrip()
-                model_report_filename = (
-                    f"analysis_report_{case_name}_{sanitized_model_name}.md"
-                )
-                model_report_path = os.path.join(
-                    case_results_dir, model_report_filename
-                )
-
-                with open(model_report_path, "w", encoding="utf-8") as f:
-                    f.write(base_report_content)
-                logger.info(
-                    f"Generated base report for model {ai_model}: {model_report_path}"
-                )
-
-                llm_analysis = call_openai_analysis_api(
-                    case_name=case_name,
-                    df=summary_df,
-                    api_key=api_key,
-                    base_url=base_url,
-                    ai_model=ai_model,
-                    independent_variable=independent_variable,
-                    report_content=base_report_content,
-                    original_config=original_config,
-                    case_data=case_data,
-                    reference_col_for_turning_point=reference_col_for_turning_point,
-                )
-
-                if llm_analysis:
-                    with open(model_report_path, "a", encoding="utf-8") as f:
-                        f.write(
-                            f"\n\n---\n\n# AI模型分析提示词 ({ai_model})\n\n```markdown\n"
-                        )
-                        f.write(llm_analysis)
-                        f.write("\n```\n")
-                    logger.info(f"Appended LLM analysis to {model_report_path}")
+            # Encode the base report once; each model's report starts as a copy.
+            base_report_path = os.path.join(case_results_dir, f".base_{case_name}.md")
+            with open(base_report_path, "w", encoding="utf-8") as f:
+                f.write(base_report_content)
+            base_report_paths.append(base_report_path)
 
-                    generate_sensitivity_academic_report(
+            for ai_model in ai_models:
+                ai_tasks.append(
+                    dict(
                         case_name=case_name,
                         case_workspace=case_workspace,
+                        case_results_dir=case_results_dir,
+                        summary_df=summary_df,
+                        api_key=api_key,
+                        base_url=base_url,
+                        ai_model=ai_model,
                         independent_variable=independent_variable,
+                        base_report_content=base_report_content,
+                        base_report_path=base_report_path,
                         original_config=original_config,
                         case_data=case_data,
-                        ai_model=ai_model,
-                        report_path=model_report_path,
+                        reference_col_for_turning_point=reference_col_for_turning_point,
+                        academic_batch=academic_batch,
                     )
+                )
+
+        # The LLM calls only wait on the network, so run the (case, model)
+        # analyses side by side, bounded to keep within provider rate limits.
+        if ai_tasks:
+            max_workers = min(_MAX_CONCURRENT_LLM_CASES, len(ai_tasks))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(_generate_model_reports, **task)
+                    for task in ai_tasks
+                ]
+                for future, task in zip(futures, ai_tasks):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(
+                            f"AI analysis failed for case {task['case_name']} with model {task['ai_model']}: {e}",
+                            exc_info=True,
+                        )
+
+        for base_report_path in base_report_paths:
+            if os.path.exists(base_report_path):
+                os.remove(base_report_path)
+
+        if academic_batch:
+            _write_batched_academic_reports(
+                academic_batch,
+                float(
+                    sensitivity_analysis_config.get(
+                        "batch_api_max_wait_hours", _DEFAULT_BATCH_MAX_WAIT_HOURS
+                    )
+                ),
+            )
+
+        # A case is recorded as up to date only once all its reports exist.
+        for etag_path, etag, expected_paths in case_etags:
+            if all(os.path.exists(path) for path in expected_paths):
+                with open(etag_path, "w", encoding="utf-8") as f:
+                    f.write(etag)
 
     except Exception as e:
         logger.error(f"Error generating detailed analysis reports: {e}", exc_info=True)
 
 
+def _generate_model_reports(
+    case_name: str,
+    case_workspace: str,
+    case_results_dir: str,
+    summary_df: pd.DataFrame,
+    api_key: str,
+    base_url: str,
+    ai_model: str,
+    independent_variable: str,
+    base_report_content: str,
+    base_report_path: str,
+    original_config: dict,
+    case_data: dict,
+    reference_col_for_turning_point: Optional[str],
+    academic_batch: Optional[List[Dict[str, Any]]] = None,
+) -> None:
+    """Writes one model's analysis report for a case and its academic summary.
+
+    Copies the base report already written to base_report_path (which must hold
+    base_report_content) to analysis_report_{case_name}_{model}.md, appends the
+    LLM analysis to it and then generates the academic report from it. Each
+    (case, model) pair only touches its own files, so pairs can run concurrently.
+    With academic_batch, the academic report is queued for the Batch API instead.
+    """
+    logger.info(
+        f"Generating AI analysis for case '{case_name}' with model '{ai_model}'."
+    )
+
+    sanitized_model_name = _sanitize_model_name(ai_model)
+    model_report_filename = f"analysis_report_{case_name}_{sanitized_model_name}.md"
+    model_report_path = os.path.join(case_results_dir, model_report_filename)
+
+    shutil.copyfile(base_report_path, model_report_path)
+    logger.info(f"Generated base report for model {ai_model}: {model_report_path}")
+
+    llm_analysis = call_openai_analysis_api(
+        case_name=case_name,
+        df=summary_df,
+        api_key=api_key,
+        base_url=base_url,
+        ai_model=ai_model,
+        independent_variable=independent_variable,
+        report_content=base_report_content,
+        original_config=original_config,
+        case_data=case_data,
+        reference_col_for_turning_point=reference_col_for_turning_point,
+        cache_dir=case_results_dir,
+    )
+
+    if llm_analysis:
+        llm_section = (
+            f"\n\n---\n\n# AI模型分析提示词 ({ai_model})\n\n```markdown\n"
+            f"{llm_analysis}\n```\n"
+        )
+        with open(model_report_path, "a", encoding="utf-8") as f:
+            f.write(llm_section)
+        logger.info(f"Appended LLM analysis to {model_report_path}")
+
+        generate_sensitivity_academic_report(
+            case_name=case_name,
+            case_workspace=case_workspace,
+            independent_variable=independent_variable,
+            original_config=original_config,
+            case_data=case_data,
+            ai_model=ai_model,
+            report_path=model_report_path,
+            report_content=base_report_content + llm_section,
+            batch_requests=academic_batch,
+        )
+
+
 def _retry_salib_case(
     case_info: Dict[str, Any], original_config: Dict[str, Any]
 ) -> None:
@@ -1265,8 +2071,9 @@ def _retry_salib_case(
                 f"Glossary file not found at {glossary_path}, skipping academic report generation."
             )
             return
-        with open(glossary_path, "r", encoding="utf-8") as f:
-            glossary_content = f.read()
+        glossary_content = _load_text_cached(
+            glossary_path, os.path.getmtime(glossary_path)
+        )
 
         analysis_case = case_data
         param_names = analysis_case.get("independent_variable")
@@ -1336,6 +2143,7 @@ def _retry_standard_case(
         return
 
     env = get_llm_env(original_config)
+    _configure_llm_rate_limiter(env)
     api_key = env.get("API_KEY")
     base_url = env.get("BASE_URL")
     ai_models_str = env.get("AI_MODELS") or env.get("AI_MODEL")
@@ -1347,116 +2155,146 @@ def _retry_standard_case(
         return
 
     ai_models = [model.strip() for model in ai_models_str.split(",")]
+
+    # Each model's reports are independent files; retry them side by side.
+    with ThreadPoolExecutor(max_workers=len(ai_models)) as executor:
+        futures = [
+            executor.submit(
+                _retry_standard_model,
+                case_name,
+                case_workspace,
+                case_results_dir,
+                case_data,
+                original_config,
+                api_key,
+                base_url,
+                ai_model,
+            )
+            for ai_model in ai_models
+        ]
+        for future, ai_model in zip(futures, ai_models):
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(
+                    f"AI analysis retry failed for case {case_name} with model {ai_model}: {e}",
+                    exc_info=True,
+                )
+
+
+def _retry_standard_model(
+    case_name: str,
+    case_workspace: str,
+    case_results_dir: str,
+    case_data: dict,
+    original_config: dict,
+    api_key: str,
+    base_url: str,
+    ai_model: str,
+) -> None:
+    """Retries the missing AI analysis and academic report of one model for a case."""
     independent_variable = case_data.get("independent_variable", "燃烧率")
+    logger.info(f"Checking for retry: case '{case_name}' with model '{ai_model}'.")
+    sanitized_model_name = _sanitize_model_name(ai_model)
+    model_report_filename = f"analysis_report_{case_name}_{sanitized_model_name}.md"
+    model_report_path = os.path.join(case_results_dir, model_report_filename)
 
-    for ai_model in ai_models:
-        logger.info(f"Checking for retry: case '{case_name}' with model '{ai_model}'.")
-        sanitized_model_name = "".join(
-            c for c in ai_model if c.isalnum() or c in ("-", "_")
-        ).rstrip()
-        model_report_filename = f"analysis_report_{case_name}_{sanitized_model_name}.md"
-        model_report_path = os.path.join(case_results_dir, model_report_filename)
+    if not os.path.exists(model_report_path):
+        logger.warning(
+            f"Base report '{model_report_path}' not found. Cannot retry. Please run the full analysis first."
+        )
+        return
 
-        if not os.path.exists(model_report_path):
-            logger.warning(
-                f"Base report '{model_report_path}' not found. Cannot retry. Please run the full analysis first."
-            )
-            continue
+    with open(model_report_path, "r", encoding="utf-8") as f:
+        report_content = f.read()
 
-        with open(model_report_path, "r", encoding="utf-8") as f:
-            report_content = f.read()
+    if "AI模型分析结果" not in report_content:
+        logger.info(
+            f"AI analysis result not found in '{model_report_path}'. Retrying generation..."
+        )
+        summary_csv_path = os.path.join(
+            case_results_dir, "sensitivity_analysis_summary.csv"
+        )
+        if not os.path.exists(summary_csv_path):
+            logger.error(f"Summary CSV not found for case {case_name}, cannot retry.")
+            return
+        summary_df = pd.read_csv(summary_csv_path, engine="c", low_memory=False)
+        reference_col_for_turning_point = None
+        sweep_csv_path = os.path.join(case_results_dir, "sweep_results.csv")
+        sweep_h5_path = os.path.join(case_results_dir, "sweep_results.h5")
+        if case_data.get("sweep_time") and os.path.exists(sweep_h5_path):
+            try:
+                slice_data = build_dynamic_slices_from_hdf5(sweep_h5_path)
+                reference_col_for_turning_point = slice_data.get("reference_label")
+            except Exception as e:
+                logger.warning(
+                    f"Could not determine reference_col_for_turning_point for retry: {e}"
+                )
+        elif case_data.get("sweep_time") and os.path.exists(sweep_csv_path):
+            try:
+                # Only the header is needed to pick the reference column
+                sweep_columns = pd.read_csv(sweep_csv_path, nrows=0).columns
+                if "time" in sweep_columns and len(sweep_columns) > 1:
+                    reference_col_for_turning_point = sweep_columns[
+                        len(sweep_columns) // 2
+                    ]
+            except Exception as e:
+                logger.warning(
+                    f"Could not determine reference_col_for_turning_point for retry: {e}"
+                )
+        llm_analysis = call_openai_analysis_api(
+            case_name=case_name,
+            df=summary_df,
+            api_key=api_key,
+            base_url=base_url,
+            ai_model=ai_model,
+            independent_variable=independent_variable,
+            report_content=report_content,
+            original_config=original_config,
+            case_data=case_data,
+            reference_col_for_turning_point=reference_col_for_turning_point,
+            cache_dir=case_results_dir,
+        )
+        if llm_analysis:
+            llm_section = (
+                f"\n\n---\n\n# AI模型分析提示词 ({ai_model})\n\n```markdown\n"
+                f"{llm_analysis}\n```\n"
+            )
+            with open(model_report_path, "a", encoding="utf-8") as f:
+                f.write(llm_section)
+            logger.info(f"Successfully appended LLM analysis to {model_report_path}")
+            report_content += llm_section
+        else:
+            logger.error(
+                f"Failed to generate LLM analysis for {model_report_path} on retry."
+            )
+            return
 
-        if "AI模型分析结果" not in report_content:
+    academic_report_filename = f"academic_report_{case_name}_{sanitized_model_name}.md"
+    academic_report_path = os.path.join(case_results_dir, academic_report_filename)
+    if not os.path.exists(academic_report_path):
+        if "AI模型分析结果" in report_content:
             logger.info(
-                f"AI analysis result not found in '{model_report_path}'. Retrying generation..."
+                f"Academic report '{academic_report_path}' not found. Generating..."
             )
-            summary_csv_path = os.path.join(
-                case_results_dir, "sensitivity_analysis_summary.csv"
-            )
-            if not os.path.exists(summary_csv_path):
-                logger.error(
-                    f"Summary CSV not found for case {case_name}, cannot retry."
-                )
-                continue
-            summary_df = pd.read_csv(summary_csv_path)
-            reference_col_for_turning_point = None
-            sweep_csv_path = os.path.join(case_results_dir, "sweep_results.csv")
-            sweep_h5_path = os.path.join(case_results_dir, "sweep_results.h5")
-            if case_data.get("sweep_time") and os.path.exists(sweep_h5_path):
-                try:
-                    slice_data = build_dynamic_slices_from_hdf5(sweep_h5_path)
-                    reference_col_for_turning_point = slice_data.get("reference_label")
-                except Exception as e:
-                    logger.warning(
-                        f"Could not determine reference_col_for_turning_point for retry: {e}"
-                    )
-            elif case_data.get("sweep_time") and os.path.exists(sweep_csv_path):
-                try:
-                    sweep_df = pd.read_csv(sweep_csv_path)
-                    if "time" in sweep_df.columns and len(sweep_df.columns) > 1:
-                        reference_col_for_turning_point = sweep_df.columns[
-                            len(sweep_df.columns) // 2
-                        ]
-                except Exception as e:
-                    logger.warning(
-                        f"Could not determine reference_col_for_turning_point for retry: {e}"
-                    )
-            llm_analysis = call_openai_analysis_api(
+            generate_sensitivity_academic_report(
                 case_name=case_name,
-                df=summary_df,
-                api_key=api_key,
-                base_url=base_url,
-                ai_model=ai_model,
+                case_workspace=case_workspace,
                 independent_variable=independent_variable,
-                report_content=report_content,
                 original_config=original_config,
                 case_data=case_data,
-                reference_col_for_turning_point=reference_col_for_turning_point,
+                ai_model=ai_model,
+                report_path=model_report_path,
+                report_content=report_content,
             )
-            if llm_analysis:
-                with open(model_report_path, "a", encoding="utf-8") as f:
-                    f.write(
-                        f"\n\n---\n\n# AI模型分析提示词 ({ai_model})\n\n```markdown\n"
-                    )
-                    f.write(llm_analysis)
-                    f.write("\n```\n")
-                logger.info(
-                    f"Successfully appended LLM analysis to {model_report_path}"
-                )
-                with open(model_report_path, "r", encoding="utf-8") as f:
-                    report_content = f.read()
-            else:
-                logger.error(
-                    f"Failed to generate LLM analysis for {model_report_path} on retry."
-                )
-                continue
-
-        academic_report_filename = (
-            f"academic_report_{case_name}_{sanitized_model_name}.md"
-        )
-        academic_report_path = os.path.join(case_results_dir, academic_report_filename)
-        if not os.path.exists(academic_report_path):
-            if "AI模型分析结果" in report_content:
-                logger.info(
-                    f"Academic report '{academic_report_path}' not found. Generating..."
-                )
-                generate_sensitivity_academic_report(
-                    case_name=case_name,
-                    case_workspace=case_workspace,
-                    independent_variable=independent_variable,
-                    original_config=original_config,
-                    case_data=case_data,
-                    ai_model=ai_model,
-                    report_path=model_report_path,
-                )
-            else:
-                logger.warning(
-                    f"Skipping academic report for {case_name} as main AI analysis is still missing after retry."
-                )
         else:
-            logger.info(
-                f"Academic report '{academic_report_path}' already exists. Skipping generation."
+            logger.warning(
+                f"Skipping academic report for {case_name} as main AI analysis is still missing after retry."
             )
+    else:
+        logger.info(
+            f"Academic report '{academic_report_path}' already exists. Skipping generation."
+        )
 
 
 def retry_ai_analysis(
@@ -25,6 +25,10 @@ _english_glossary_map = {}
 _chinese_glossary_map = {}
 _use_chinese_labels = False
 
+# Render SVG text as paths so the Chinese labels do not depend on the fonts
+# installed where the SVGs are viewed. Set once here rather than per save.
+plt.rcParams["svg.fonttype"] = "path"
+
 # Add a dictionary for UI text translations
 _ui_text = {
     "en": {
@@ -386,7 +390,6 @@ def _plot_time_series_with_zoom(df: pd.DataFrame, output_dir: str, **kwargs) ->
 
         save_path = os.path.join(output_dir, output_filename)
         try:
-            plt.rcParams["svg.fonttype"] = "path"
             plt.savefig(save_path, format="svg", bbox_inches="tight")
             logger.info(f"Successfully generated plot with all curves: {save_path}")
         finally:
@@ -440,7 +443,6 @@ def _plot_final_values_bar_chart(df: pd.DataFrame, output_dir: str, **kwargs) ->
         output_filename = f"{name}{suffix}{ext}"
         save_path = os.path.join(output_dir, output_filename)
         try:
-            plt.rcParams["svg.fonttype"] = "path"
             plt.savefig(save_path, format="svg", bbox_inches="tight")
             logger.info(
                 f"Successfully generated bar chart of final values: {save_path}"
@@ -606,9 +608,9 @@ def _generate_postprocess_report(
                 f"未找到与主要变量 '{detailed_var}' 相关的列，无法计算关键指标。\n\n"
             )
         else:
+            time_series = df["time"]
             for col in primary_var_columns:
                 series = df[col]
-                time_series = df["time"]
 
                 startup_inventory = _calculate_startup_inventory(series, time_series)
                 turning_point_time = _time_of_turning_point(series, time_series)
@@ -1014,10 +1016,11 @@ def _collect_baseline_stream_data(results_file_path: str, **kwargs) -> dict:
                         }
                     )
 
-                    current_min = series.min()
+                    min_index = series.idxmin()
+                    current_min = series[min_index]
                     if current_min < turning_value_min:
                         turning_value_min = current_min
-                        turning_index = int(series.idxmin())
+                        turning_index = int(min_index)
                         turning_label = label
 
         if turning_index is not None:
@@ -1242,7 +1245,6 @@ def _plot_time_series_with_zoom_from_hdf5(
         save_path = os.path.join(output_dir, output_filename)
 
         try:
-            plt.rcParams["svg.fonttype"] = "path"
             plt.savefig(save_path, format="svg", bbox_inches="tight")
             logger.info(f"Successfully generated plot with all curves: {save_path}")
         finally:
@@ -1293,7 +1295,6 @@ def _plot_final_values_bar_chart_from_series(
         save_path = os.path.join(output_dir, output_filename)
 
         try:
-            plt.rcParams["svg.fonttype"] = "path"
             plt.savefig(save_path, format="svg", bbox_inches="tight")
             logger.info(
                 f"Successfully generated bar chart of final values: {save_path}"
@@ -21,7 +21,14 @@ from tricys.core.modelica import (
 # Standard logger setup
 logger = logging.getLogger(__name__)
 
-LLM_ENV_KEYS = ("API_KEY", "BASE_URL", "AI_MODEL", "AI_MODELS")
+LLM_ENV_KEYS = (
+    "API_KEY",
+    "BASE_URL",
+    "AI_MODEL",
+    "AI_MODELS",
+    "AI_REQUESTS_PER_MINUTE",
+    "AI_TOKENS_PER_MINUTE",
+)
 
 
 def get_llm_env(config: Optional[Dict[str, Any]] = None) -> Dict[str, Optional[str]]: